@@ -0,0 +1,49 @@
+"""
+API Dependencies
+FastAPI dependency providers for shared services
+"""
+from typing import Optional
+from fastapi import Header
+
+from app.core.deadline import Deadline
+from app.core.responses import ResponseRenderer, negotiate
+from app.services.registry import registry
+from app.services.quiz_service import QuizService
+from app.services.learning_service import LearningService
+from app.services.job_queue import JobQueue
+from app.services.revision_scheduler import RevisionScheduler
+
+
+def get_quiz_service() -> QuizService:
+    """Shared QuizService instance"""
+    return registry.quiz_service()
+
+
+def get_learning_service() -> LearningService:
+    """Shared LearningService instance"""
+    return registry.learning_service()
+
+
+def get_job_queue() -> JobQueue:
+    """Shared background job queue"""
+    return registry.job_queue()
+
+
+def get_revision_scheduler() -> RevisionScheduler:
+    """Shared spaced-repetition queue"""
+    return registry.revision_scheduler()
+
+
+def get_request_deadline(
+    x_request_deadline_ms: Optional[int] = Header(
+        None,
+        description="Latency budget for this request in milliseconds"
+    )
+) -> Optional[Deadline]:
+    """Deadline from REQUEST_DEADLINE_SECONDS and the optional client header"""
+    return Deadline.for_request(x_request_deadline_ms)
+
+
+def get_renderer(accept: Optional[str] = Header(None)) -> ResponseRenderer:
+    """Response renderer for the format negotiated from the Accept header"""
+    return ResponseRenderer(negotiate(accept))
@@ -2,29 +2,49 @@
 Quiz and Learning Routes
 Main API endpoints for quiz submission and learning content
 """
-from fastapi import APIRouter, HTTPException, status
-from fastapi.responses import JSONResponse
-from typing import Dict, Any
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response, StreamingResponse
+from typing import AsyncIterator, Optional
+from datetime import datetime, timezone
+import asyncio
+import json
 
 from app.models.quiz_models import (
     QuizSubmissionRequest,
+    BatchQuizSubmissionRequest,
+    BatchQuizResponse,
     RoadmapResponse,
     ModuleQuizResponse,
     LearningContentRequest,
     LearningContentResponse,
+    JobResponse,
+    DueReviewsResponse,
     ErrorResponse,
     QuizFormType
 )
 from app.services.quiz_service import QuizService
 from app.services.learning_service import LearningService
+from app.services.job_queue import Job, JobQueue, JobQueueFull
+from app.services.revision_scheduler import RevisionScheduler
+from app.core.config import settings
+from app.core.deadline import Deadline
+from app.core.responses import ResponseRenderer
+from app.api.dependencies import (
+    get_quiz_service,
+    get_learning_service,
+    get_request_deadline,
+    get_renderer,
+    get_job_queue,
+    get_revision_scheduler
+)
 
 # Initialize routers
 quiz_router = APIRouter()
 learning_router = APIRouter()
+jobs_router = APIRouter()
+revision_router = APIRouter()
 
-# Initialize services
-quiz_service = QuizService()
-learning_service = LearningService()
+ASYNC_QUERY_DESCRIPTION = "Return immediately and generate content in a background job"
 
 
 @quiz_router.post(
@@ -32,11 +52,20 @@ learning_service = LearningService()
     response_model=RoadmapResponse | ModuleQuizResponse,
     status_code=status.HTTP_200_OK,
     responses={
+        202: {"model": JobResponse},
         400: {"model": ErrorResponse},
-        500: {"model": ErrorResponse}
+        500: {"model": ErrorResponse},
+        503: {"model": ErrorResponse}
     }
 )
-async def submit_quiz(request: QuizSubmissionRequest) -> Dict[str, Any]:
+async def submit_quiz(
+    request: QuizSubmissionRequest,
+    async_mode: bool = Query(False, alias="async", description=ASYNC_QUERY_DESCRIPTION),
+    quiz_service: QuizService = Depends(get_quiz_service),
+    job_queue: JobQueue = Depends(get_job_queue),
+    deadline: Optional[Deadline] = Depends(get_request_deadline),
+    render: ResponseRenderer = Depends(get_renderer)
+) -> Response:
     """
     Submit quiz for processing
     
@@ -44,17 +73,53 @@ async def submit_quiz(request: QuizSubmissionRequest) -> Dict[str, Any]:
     - prerequisite-quiz: Returns personalized roadmap
     - module-quiz: Returns performance analysis and revision needs
     - module-learn: Redirects to learning content generation
+    
+    Generation is bounded by the request deadline; when it runs out the
+    fallback content is returned instead.
+    
+    With ?async=true nothing waits on the LLM: a module quiz returns its
+    score and next_action at once with a job_id for the revision data, and a
+    prerequisite quiz returns 202 with the job that builds the roadmap.
+    Poll GET /jobs/{job_id} for the result. When the job queue is full a
+    module quiz gets its revision data inline, as without ?async=true.
     """
     try:
         if request.quiz_form == QuizFormType.PREREQUISITE:
+            if async_mode:
+                job = job_queue.submit(
+                    "roadmap",
+                    lambda: quiz_service.process_prerequisite_quiz(request, deadline=_job_deadline())
+                )
+                return render(_job_response(job), status_code=status.HTTP_202_ACCEPTED)
+            
             # Process prerequisite quiz and generate roadmap
-            response = await quiz_service.process_prerequisite_quiz(request)
-            return response
+            response = await quiz_service.process_prerequisite_quiz(request, deadline=deadline)
+            return render(response)
             
         elif request.quiz_form == QuizFormType.MODULE_QUIZ:
             # Process module quiz and determine revision needs
-            response = await quiz_service.process_module_quiz(request)
-            return response
+            response = await quiz_service.process_module_quiz(
+                request,
+                deadline=deadline,
+                include_revision=not async_mode
+            )
+            if async_mode and response.revision_need and response.weak_concepts:
+                weak_concepts = response.weak_concepts
+                try:
+                    job = job_queue.submit(
+                        "revision",
+                        lambda: quiz_service.generate_revision_data(
+                            request, weak_concepts, deadline=_job_deadline()
+                        )
+                    )
+                    response.job_id = job.job_id
+                except JobQueueFull:
+                    # The submission is already recorded, so a 503 would
+                    # have retries record it again: answer inline instead
+                    response.data = await quiz_service.generate_revision_data(
+                        request, weak_concepts, deadline=deadline
+                    )
+            return render(response)
             
         else:
             raise HTTPException(
@@ -62,6 +127,11 @@ async def submit_quiz(request: QuizSubmissionRequest) -> Dict[str, Any]:
                 detail=f"Invalid quiz_form type: {request.quiz_form}"
             )
             
+    except JobQueueFull as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -74,16 +144,70 @@ async def submit_quiz(request: QuizSubmissionRequest) -> Dict[str, Any]:
         )
 
 
+@quiz_router.post(
+    "/quiz/submit-batch",
+    response_model=BatchQuizResponse,
+    status_code=status.HTTP_200_OK,
+    responses={
+        400: {"model": ErrorResponse},
+        500: {"model": ErrorResponse}
+    }
+)
+async def submit_quiz_batch(
+    request: BatchQuizSubmissionRequest,
+    quiz_service: QuizService = Depends(get_quiz_service),
+    render: ResponseRenderer = Depends(get_renderer)
+) -> Response:
+    """
+    Submit many quizzes in one request
+    
+    Intended for backfills and bulk re-grading. Accepts prerequisite and
+    module quizzes; results are returned in submission order. With
+    "regrade": true submissions are graded without being recorded. The
+    interactive request deadline does not apply: each submission gets its
+    own BATCH_SUBMISSION_DEADLINE_SECONDS budget.
+    """
+    try:
+        results = await quiz_service.process_batch(request.submissions, regrade=request.regrade)
+        return render(BatchQuizResponse.model_construct(
+            status="success",
+            message="Quiz batch processed successfully",
+            count=len(results),
+            results=results
+        ))
+        
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"An error occurred processing the quiz batch: {str(e)}"
+        )
+
+
 @learning_router.post(
     "/learning/generate",
     response_model=LearningContentResponse,
     status_code=status.HTTP_200_OK,
     responses={
+        202: {"model": JobResponse},
         400: {"model": ErrorResponse},
-        500: {"model": ErrorResponse}
+        500: {"model": ErrorResponse},
+        503: {"model": ErrorResponse}
     }
 )
-async def generate_learning_content(request: LearningContentRequest) -> Dict[str, Any]:
+async def generate_learning_content(
+    request: LearningContentRequest,
+    stream: bool = Query(False, description="Stream module fields as server-sent events"),
+    async_mode: bool = Query(False, alias="async", description=ASYNC_QUERY_DESCRIPTION),
+    learning_service: LearningService = Depends(get_learning_service),
+    job_queue: JobQueue = Depends(get_job_queue),
+    deadline: Optional[Deadline] = Depends(get_request_deadline),
+    render: ResponseRenderer = Depends(get_renderer)
+) -> Response:
     """
     Generate personalized learning content
     
@@ -92,11 +216,37 @@ async def generate_learning_content(request: LearningContentRequest) -> Dict[str
     - User skill level
     - Weak concepts (if any)
     - Content format preference
+    
+    With ?stream=true the response is text/event-stream: one "field" event
+    per module field as it completes, then a "complete" event carrying the
+    full LearningContentResponse.
+    
+    With ?async=true the response is 202 with a job whose result is the
+    LearningContentResponse; poll GET /jobs/{job_id}.
     """
+    if stream:
+        return StreamingResponse(
+            _stream_learning_events(learning_service, request),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+    
     try:
-        response = await learning_service.generate_learning_content(request)
-        return response
+        if async_mode:
+            job = job_queue.submit(
+                "learning",
+                lambda: learning_service.generate_learning_content(request, deadline=_job_deadline())
+            )
+            return render(_job_response(job), status_code=status.HTTP_202_ACCEPTED)
+        
+        response = await learning_service.generate_learning_content(request, deadline=deadline)
+        return render(response)
         
+    except JobQueueFull as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e)
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -109,28 +259,135 @@ async def generate_learning_content(request: LearningContentRequest) -> Dict[str
         )
 
 
+@jobs_router.get(
+    "/jobs/{job_id}",
+    response_model=JobResponse,
+    responses={404: {"model": ErrorResponse}}
+)
+async def get_job(
+    job_id: str,
+    job_queue: JobQueue = Depends(get_job_queue),
+    render: ResponseRenderer = Depends(get_renderer)
+) -> Response:
+    """
+    Fetch a background job started with ?async=true
+    
+    Finished jobs are kept for JOB_TTL_SECONDS; after that, and for unknown
+    ids, the response is 404.
+    """
+    job = job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job not found: {job_id}"
+        )
+    return render(_job_response(job))
+
+
+@revision_router.post(
+    "/revision/due",
+    response_model=DueReviewsResponse
+)
+async def pop_due_revisions(
+    limit: int = Query(100, ge=1, le=settings.REVISION_DUE_MAX_LIMIT),
+    scheduler: RevisionScheduler = Depends(get_revision_scheduler),
+    render: ResponseRenderer = Depends(get_renderer)
+) -> Response:
+    """
+    Take the learner-module pairs whose review is due off the revision queue
+    
+    Pairs are returned most overdue first with their decayed memory score,
+    forgetting score and urgency. Each pair is returned once; its next
+    module quiz schedules it again.
+    """
+    reviews = await asyncio.to_thread(scheduler.pop_due, limit=limit)
+    return render(DueReviewsResponse.model_construct(
+        status="success",
+        count=len(reviews),
+        reviews=reviews
+    ))
+
+
+def _job_deadline() -> Optional[Deadline]:
+    """Generation budget for a background job, started when the job runs"""
+    if settings.JOB_TIMEOUT_SECONDS > 0:
+        return Deadline(settings.JOB_TIMEOUT_SECONDS)
+    return None
+
+
+def _job_response(job: Job) -> JobResponse:
+    """Public view of a job record"""
+    return JobResponse.model_construct(
+        status="success",
+        job_id=job.job_id,
+        kind=job.kind,
+        state=job.state,
+        created_at=datetime.fromtimestamp(job.created_at, tz=timezone.utc),
+        finished_at=(
+            datetime.fromtimestamp(job.finished_at, tz=timezone.utc)
+            if job.finished_at is not None else None
+        ),
+        result=job.result,
+        error=job.error
+    )
+
+
+def _format_sse(event: str, data: str) -> str:
+    """Format a single server-sent event"""
+    return f"event: {event}\ndata: {data}\n\n"
+
+
+async def _stream_learning_events(
+    learning_service: LearningService,
+    request: LearningContentRequest
+) -> AsyncIterator[str]:
+    """Render learning service stream events as SSE"""
+    try:
+        async for event, payload in learning_service.stream_learning_content(request):
+            if event == "field":
+                name, value = payload
+                yield _format_sse("field", json.dumps({"name": name, "value": value}))
+            elif event == "complete":
+                yield _format_sse("complete", payload.model_dump_json())
+    except Exception as e:
+        yield _format_sse("error", json.dumps({
+            "status": "error",
+            "message": f"An error occurred generating content: {str(e)}"
+        }))
+
+
 @quiz_router.get("/quiz/health")
-async def quiz_health():
+async def quiz_health(
+    quiz_service: QuizService = Depends(get_quiz_service),
+    render: ResponseRenderer = Depends(get_renderer)
+):
     """Quiz service health check"""
-    return {
+    return render({
         "status": "healthy",
         "service": "quiz",
         "adk_status": "active" if quiz_service.adk_enabled else "disabled"
-    }
+    })
 
 
 @learning_router.get("/learning/health")
-async def learning_health():
+async def learning_health(
+    learning_service: LearningService = Depends(get_learning_service),
+    render: ResponseRenderer = Depends(get_renderer)
+):
     """Learning service health check"""
-    return {
+    return render({
         "status": "healthy",
         "service": "learning",
         "adk_status": "active" if learning_service.adk_enabled else "disabled"
-    }
+    })
 
 
 @quiz_router.post("/quiz/analyze-behavior")
-async def analyze_quiz_behavior(request: QuizSubmissionRequest):
+async def analyze_quiz_behavior(
+    request: QuizSubmissionRequest,
+    quiz_service: QuizService = Depends(get_quiz_service),
+    render: ResponseRenderer = Depends(get_renderer)
+):
     """
     Analyze quiz-taking behavior
     
@@ -142,11 +399,11 @@ async def analyze_quiz_behavior(request: QuizSubmissionRequest):
     """
     try:
         analysis = await quiz_service.analyze_behavior(request)
-        return {
+        return render({
             "status": "success",
             "user_id": request.user_id,
             "behavioral_analysis": analysis
-        }
+        })
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -0,0 +1,123 @@
+"""
+Response Cache
+Content-addressed LRU cache for generated LLM content
+"""
+from typing import Any, Dict, Optional, Tuple
+from collections import OrderedDict
+import hashlib
+import threading
+import time
+
+from app.core.config import settings
+
+
+class ResponseCache:
+    """Size-bounded LRU cache with per-kind TTLs and hit/miss counters"""
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttls: Optional[Dict[str, float]] = None,
+        default_ttl: float = 3600.0
+    ):
+        self.max_entries = max_entries
+        self.ttls = dict(ttls or {})
+        self.default_ttl = default_ttl
+
+        # key -> (kind, expires_at, value); ordered oldest to most recently used
+        self._entries: "OrderedDict[str, Tuple[str, float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits: Dict[str, int] = {}
+        self._misses: Dict[str, int] = {}
+        self._evictions = 0
+
+    @staticmethod
+    def make_key(kind: str, prompt: str, model: str, temperature: float, max_tokens: int) -> str:
+        """Hash the fully built prompt together with the model settings"""
+        digest = hashlib.sha256()
+        for part in (kind, model, repr(float(temperature)), str(int(max_tokens)), prompt):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def get(self, kind: str, key: str) -> Optional[Any]:
+        """Return cached value or None if missing or expired"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != kind:
+                self._misses[kind] = self._misses.get(kind, 0) + 1
+                return None
+
+            if entry[1] <= now:
+                del self._entries[key]
+                self._misses[kind] = self._misses.get(kind, 0) + 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits[kind] = self._hits.get(kind, 0) + 1
+            return entry[2]
+
+    def set(self, kind: str, key: str, value: Any) -> None:
+        """Store a value, evicting least recently used entries when full"""
+        if self.max_entries <= 0:
+            return
+
+        ttl = self.ttls.get(kind, self.default_ttl)
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._entries[key] = (kind, time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def clear(self) -> None:
+        """Drop all entries and reset counters"""
+        with self._lock:
+            self._entries.clear()
+            self._hits.clear()
+            self._misses.clear()
+            self._evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, Any]:
+        """Snapshot of cache size and hit/miss counters per kind"""
+        with self._lock:
+            kinds = set(self._hits) | set(self._misses)
+            per_kind = {}
+            for kind in sorted(kinds):
+                hits = self._hits.get(kind, 0)
+                misses = self._misses.get(kind, 0)
+                total = hits + misses
+                per_kind[kind] = {
+                    "hits": hits,
+                    "misses": misses,
+                    "hit_rate": round(hits / total, 3) if total else 0.0
+                }
+
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "evictions": self._evictions,
+                "kinds": per_kind
+            }
+
+
+response_cache = ResponseCache(
+    max_entries=settings.CACHE_MAX_ENTRIES if settings.CACHE_ENABLED else 0,
+    ttls={
+        "roadmap": settings.CACHE_TTL_ROADMAP,
+        "revision": settings.CACHE_TTL_REVISION,
+        "revision_unit": settings.CACHE_TTL_REVISION,
+        "module": settings.CACHE_TTL_MODULE,
+        "module_overview": settings.CACHE_TTL_MODULE,
+        "module_content": settings.CACHE_TTL_MODULE,
+        "module_practice": settings.CACHE_TTL_MODULE,
+        "module_media": settings.CACHE_TTL_MODULE
+    }
+)
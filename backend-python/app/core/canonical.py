@@ -0,0 +1,87 @@
+"""
+Canonical Generation Inputs
+Normalizes topics and concept lists so equivalent requests share one cache key
+"""
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set
+import threading
+
+from app.core.config import settings
+
+
+def normalize_text(value: str) -> str:
+    """Trimmed, whitespace-collapsed, case-folded text"""
+    return " ".join(value.split()).casefold()
+
+
+def canonical_topic(topic: str) -> str:
+    return normalize_text(topic)
+
+
+def concept_names(concepts: Optional[Iterable[str]]) -> Dict[str, str]:
+    """Normalized concept -> its first spelling as given (trimmed), in first-seen order; blanks dropped"""
+    names: Dict[str, str] = {}
+    for concept in concepts or ():
+        if concept and not concept.isspace():
+            names.setdefault(normalize_text(concept), concept.strip())
+    return names
+
+
+def canonical_concepts(concepts: Optional[Iterable[str]], limit: Optional[int] = None) -> List[str]:
+    """
+    Normalized concepts, de-duplicated and sorted; blanks dropped
+
+    With limit only the first limit distinct concepts in the given
+    (priority) order are kept; sorting happens after the cut.
+    """
+    return sorted(list(concept_names(concepts))[:limit])
+
+
+class GenerationKeyStats:
+    """
+    Distinct generation inputs per kind, before and after canonicalization
+
+    requests / canonical_distinct is the best hit rate an unbounded cache
+    could reach for the traffic seen so far; raw_distinct shows what it
+    would be without canonicalization. Identities are kept as hashes and
+    stop being added once max_tracked are held per kind, which bounds the
+    memory at roughly 2 * max_tracked hashed ints per kind.
+    """
+
+    def __init__(self, max_tracked: int = 50000):
+        self.max_tracked = max_tracked
+        self._lock = threading.Lock()
+        self._requests: Dict[str, int] = {}
+        self._raw: Dict[str, Set[int]] = {}
+        self._canonical: Dict[str, Set[int]] = {}
+
+    def record(self, kind: str, raw: Hashable, canonical: Hashable) -> None:
+        with self._lock:
+            self._requests[kind] = self._requests.get(kind, 0) + 1
+            for seen, identity in ((self._raw, raw), (self._canonical, canonical)):
+                keys = seen.setdefault(kind, set())
+                if len(keys) < self.max_tracked:
+                    keys.add(hash(identity))
+
+    def reset(self) -> None:
+        with self._lock:
+            self._requests.clear()
+            self._raw.clear()
+            self._canonical.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Requests, distinct raw and canonical keys and achievable hit rate per kind"""
+        with self._lock:
+            result = {}
+            for kind, requests in sorted(self._requests.items()):
+                canonical = len(self._canonical[kind])
+                result[kind] = {
+                    "requests": requests,
+                    "raw_distinct": len(self._raw[kind]),
+                    "canonical_distinct": canonical,
+                    "achievable_hit_rate": round(1 - canonical / requests, 3),
+                    "saturated": canonical >= self.max_tracked
+                }
+            return result
+
+
+generation_keys = GenerationKeyStats(max_tracked=settings.GENERATION_KEYS_MAX_TRACKED)
@@ -16,6 +16,7 @@ class Settings(BaseSettings):
     DEBUG: bool = True
     HOST: str = "0.0.0.0"
     PORT: int = 8000
+    PREWARM_SERVICES: bool = True  # Build services in the background after startup
     
     # CORS
     CORS_ORIGINS: List[str] = [
@@ -31,6 +32,15 @@ class Settings(BaseSettings):
     ADK_API_KEY: str = os.getenv("ADK_API_KEY", "")
     GEMINI_API_KEY: str = os.getenv("GEMINI_API_KEY", "")
     
+    # Logging (JSON lines, written by a background thread)
+    LOG_FILE: str = "backend_debug.log"
+    LOG_LEVEL: str = "DEBUG"
+    LOG_MAX_BYTES: int = 10 * 1024 * 1024
+    LOG_BACKUP_COUNT: int = 3
+    LOG_BATCH_SIZE: int = 256
+    LOG_FLUSH_INTERVAL: float = 0.5
+    LOG_QUEUE_SIZE: int = 10000
+    
     # Database (if needed)
     DATABASE_URL: str = os.getenv("DATABASE_URL", "")
     SUPABASE_URL: str = os.getenv("SUPABASE_URL", "")
@@ -40,10 +50,80 @@ class Settings(BaseSettings):
     DEFAULT_MODEL: str = "gemini-1.5-flash"
     TEMPERATURE: float = 0.7
     MAX_TOKENS: int = 2000
-    
+    PROMPT_MAX_CONCEPTS: int = 10  # Concepts listed per prompt after de-duplication
+    MODULE_SECTIONED: bool = False  # Generate modules as concurrent per-section prompts
+
+    # LLM Provider: gemini, stub (local canned responses) or replay (recorded responses)
+    LLM_PROVIDER: str = "gemini"
+    LLM_RECORD_PATH: str = ""  # Append every response to this JSON-lines file; empty disables
+    LLM_REPLAY_PATH: str = "llm_recordings.jsonl"
+    LLM_STUB_LATENCY_MS: float = 200.0
+    LLM_STUB_LATENCY_JITTER_MS: float = 50.0
+    LLM_STUB_LATENCY_DIST: str = "lognormal"  # fixed, uniform, normal or lognormal
+    LLM_STUB_ERROR_RATE: float = 0.0
+    LLM_STUB_ERROR_CODE: int = 503  # 429/5xx are retried by the outbound limiter
+    LLM_STUB_RESPONSES_PATH: str = ""  # JSON object of prompt kind -> canned response
+    LLM_STUB_SEED: int = 0
+
+    # Response Cache (TTLs in seconds)
+    CACHE_ENABLED: bool = True
+    CACHE_MAX_ENTRIES: int = 1024
+    CACHE_TTL_ROADMAP: float = 3600.0
+    CACHE_TTL_REVISION: float = 3600.0
+    CACHE_TTL_MODULE: float = 21600.0
+    GENERATION_KEYS_MAX_TRACKED: int = 50000  # Distinct keys hashed per kind for /health stats
+
+    # Pregenerated content (scripts/pregenerate.py); empty disables lookups
+    CONTENT_STORE_PATH: str = "content_store.db"
+
+    # Outbound LLM Limits (rate 0 disables the token bucket)
+    LLM_MAX_CONCURRENCY: int = 16
+    LLM_RATE_PER_SECOND: float = 0.0
+    LLM_BURST: int = 10
+    LLM_MAX_RETRIES: int = 3
+    LLM_RETRY_BASE_DELAY: float = 0.5
+    LLM_RETRY_MAX_DELAY: float = 8.0
+
+    # Learner Profiles (cumulative concept mastery)
+    PROFILE_STORE_PATH: str = "learner_profiles.db"  # Also holds the revision schedule
+    PROFILE_CACHE_SIZE: int = 10000  # Profiles kept in memory
+
+    # Spaced Repetition (module quiz -> next revision)
+    REVISION_INTERVAL_HOURS: List[float] = [24, 72, 168, 720]  # 1d, 3d, 1w, 1m
+    MEMORY_DECAY_DAYS: float = 7.0  # Forgetting curve exp(-days / MEMORY_DECAY_DAYS)
+    REVISION_DUE_MAX_LIMIT: int = 10000  # Pairs returned per /revision/due call
+
+    # Analytics Events (quiz completion events, see backend/events/types.ts)
+    EVENT_SINK: str = "file"  # file | topics (one log per Kafka topic) | none
+    EVENT_SINK_PATH: str = "events.jsonl"  # File, or directory for "topics"
+    EVENT_OUTBOX_PATH: str = "event_outbox.db"
+    EVENT_BATCH_SIZE: int = 500
+    EVENT_FLUSH_INTERVAL: float = 1.0
+
+    # quiz_analytics write-behind (sqlite:///<path> or postgresql://...; empty disables)
+    ANALYTICS_DB_URL: str = ""
+    ANALYTICS_POOL_SIZE: int = 4
+    ANALYTICS_FLUSH_INTERVAL: float = 5.0
+    ANALYTICS_MAX_PENDING: int = 5000  # Pending rows that trigger an early flush
+
     # Quiz Thresholds
     PASS_THRESHOLD: float = 0.7  # 70% to pass
     REVISION_THRESHOLD: float = 0.5  # Below 50% needs revision
+
+    # Request latency budget in seconds (0 = none); clients may tighten it
+    # per request with the X-Request-Deadline-Ms header
+    REQUEST_DEADLINE_SECONDS: float = 20.0
+
+    # Batch Submission
+    BATCH_MAX_SUBMISSIONS: int = 5000
+    BATCH_LLM_CONCURRENCY: int = 8
+    BATCH_SUBMISSION_DEADLINE_SECONDS: float = 20.0  # Budget per submission once it starts (0 = none)
+
+    # Background Jobs (?async=true)
+    JOB_WORKERS: int = 4
+    JOB_QUEUE_SIZE: int = 1000  # Pending jobs before submits are rejected
+    JOB_TTL_SECONDS: float = 600.0  # How long finished jobs can be fetched
+    JOB_TIMEOUT_SECONDS: float = 60.0  # Generation budget per job
     
     class Config:
         env_file = ".env"
@@ -0,0 +1,131 @@
+"""
+Content Store
+SQLite store of pregenerated LLM content, consulted on response cache misses
+"""
+from typing import Any, Dict, List, Optional
+import os
+import sqlite3
+import threading
+import time
+
+from pydantic import TypeAdapter
+
+from app.core.config import settings
+from app.models.quiz_models import RoadmapTopic, RevisionData, LearningModule
+
+
+# How each kind of generated value is (de)serialized
+_ADAPTERS: Dict[str, TypeAdapter] = {
+    "roadmap": TypeAdapter(List[RoadmapTopic]),
+    "revision": TypeAdapter(List[RevisionData]),
+    "revision_unit": TypeAdapter(RevisionData),
+    "module": TypeAdapter(LearningModule),
+    # Sections of a sectioned module: LearningModule field -> value
+    "module_overview": TypeAdapter(Dict[str, Any]),
+    "module_content": TypeAdapter(Dict[str, Any]),
+    "module_practice": TypeAdapter(Dict[str, Any]),
+    "module_media": TypeAdapter(Dict[str, Any])
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS generated_content (
+    key TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    value TEXT NOT NULL,
+    created_at REAL NOT NULL
+)
+"""
+
+
+class ContentStore:
+    """
+    Durable key -> generated content mapping, keyed like ResponseCache
+
+    Filled offline by scripts/pregenerate.py and read by the API when the
+    in-memory cache misses, so hot content is warm from the first request
+    after a deploy. Reads never create the database: a missing file simply
+    behaves as an empty store. An empty path disables the store.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.path)
+
+    def _connection(self, create: bool) -> Optional[sqlite3.Connection]:
+        if self._conn is None and self.enabled:
+            if not create and self.path != ":memory:" and not os.path.exists(self.path):
+                return None
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+            self._conn.commit()
+        return self._conn
+
+    def get(self, kind: str, key: str) -> Optional[Any]:
+        """Stored value for key, or None"""
+        with self._lock:
+            conn = self._connection(create=False)
+            row = None
+            if conn is not None:
+                row = conn.execute(
+                    "SELECT value FROM generated_content WHERE key = ? AND kind = ?",
+                    (key, kind)
+                ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return _ADAPTERS[kind].validate_json(row[0])
+
+    def put(self, kind: str, key: str, value: Any) -> None:
+        """Insert or replace the value for key"""
+        payload = _ADAPTERS[kind].dump_json(value).decode("utf-8")
+        with self._lock:
+            conn = self._connection(create=True)
+            if conn is None:
+                return
+            conn.execute(
+                "INSERT OR REPLACE INTO generated_content (key, kind, value, created_at) "
+                "VALUES (?, ?, ?, ?)",
+                (key, kind, payload, time.time())
+            )
+            conn.commit()
+            self.writes += 1
+
+    def count(self, kind: Optional[str] = None) -> int:
+        """Number of stored entries, optionally of one kind"""
+        with self._lock:
+            conn = self._connection(create=False)
+            if conn is None:
+                return 0
+            if kind is None:
+                return conn.execute("SELECT COUNT(*) FROM generated_content").fetchone()[0]
+            return conn.execute(
+                "SELECT COUNT(*) FROM generated_content WHERE kind = ?", (kind,)
+            ).fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Lookup and write counters"""
+        return {
+            "enabled": self.enabled,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes
+        }
+
+
+content_store = ContentStore(settings.CONTENT_STORE_PATH)
@@ -0,0 +1,44 @@
+"""
+Request Deadlines
+Latency budgets carried from the route down to LLM calls
+"""
+from typing import Optional
+import time
+
+from app.core.config import settings
+
+
+class DeadlineExceeded(Exception):
+    """Raised when work could not finish within the request's remaining budget"""
+
+
+class Deadline:
+    """Absolute point in time (monotonic clock) by which a request must answer"""
+
+    def __init__(self, timeout: float):
+        self.timeout = timeout
+        self.expires_at = time.monotonic() + timeout
+
+    def remaining(self) -> float:
+        """Seconds left in the budget, never negative"""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    @classmethod
+    def for_request(cls, header_ms: Optional[int] = None) -> Optional["Deadline"]:
+        """
+        Build the deadline for an incoming request
+
+        Uses REQUEST_DEADLINE_SECONDS, tightened by an optional client budget
+        in milliseconds (X-Request-Deadline-Ms). Returns None when neither
+        sets a limit.
+        """
+        budgets = []
+        if settings.REQUEST_DEADLINE_SECONDS > 0:
+            budgets.append(settings.REQUEST_DEADLINE_SECONDS)
+        if header_ms is not None and header_ms > 0:
+            budgets.append(header_ms / 1000.0)
+        return cls(min(budgets)) if budgets else None
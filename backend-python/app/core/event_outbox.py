@@ -0,0 +1,241 @@
+"""
+Event Outbox
+Append-only local outbox of analytics events, delivered in batches by a background flusher
+"""
+from typing import Any, Dict, List, Optional, Tuple
+from abc import ABC, abstractmethod
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from app.core.log import get_logger
+
+
+logger = get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS event_outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    topic TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    created_at REAL NOT NULL
+)
+"""
+
+# Kafka topic per event type, as in backend/kafka/config.ts
+EVENT_TOPICS = {
+    "user_login": "user_login_events",
+    "domain_selected": "learning_domain_selection_events",
+    "diagnostic_quiz_completed": "diagnostic_quiz_events",
+    "module_quiz_completed": "module_quiz_events",
+    "module_completed": "module_completion_events",
+    "revision_scheduled": "revision_recommendation_events"
+}
+
+# Event vocabulary of backend/events/types.ts: Domain per DomainType value
+EVENT_DOMAINS = {
+    "dsa": "dsa",
+    "web-development": "webdev",
+    "ai-ml": "ai-ml"
+}
+
+# ModuleQuizEvent.passed is score >= 60 (0-100), independent of the API's PASS_THRESHOLD
+EVENT_PASS_SCORE = 60
+
+
+class EventSink(ABC):
+    """Destination of delivered events; send() raises to have a batch retried"""
+
+    @abstractmethod
+    def send(self, batch: List[Tuple[str, str]]) -> None:
+        """Deliver (topic, JSON payload) pairs in outbox order"""
+
+    def close(self) -> None:
+        pass
+
+
+class FileSink(EventSink):
+    """One JSON-lines file of {"topic": ..., "event": ...} records"""
+
+    def __init__(self, path: str):
+        self.path = path
+
+    def send(self, batch: List[Tuple[str, str]]) -> None:
+        lines = "".join(f'{{"topic":{json.dumps(topic)},"event":{payload}}}\n' for topic, payload in batch)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(lines)
+
+
+class TopicLogSink(EventSink):
+    """
+    Local Kafka stand-in: one append-only <topic>.jsonl log per topic
+
+    Each line is the bare event, as a Kafka consumer of that topic would
+    receive it.
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def send(self, batch: List[Tuple[str, str]]) -> None:
+        by_topic: Dict[str, List[str]] = {}
+        for topic, payload in batch:
+            by_topic.setdefault(topic, []).append(payload)
+        for topic, payloads in by_topic.items():
+            with open(os.path.join(self.directory, f"{topic}.jsonl"), "a", encoding="utf-8") as f:
+                f.write("\n".join(payloads) + "\n")
+
+
+def create_sink(kind: str, path: str) -> Optional[EventSink]:
+    """Sink named by EVENT_SINK; None for "none" """
+    if kind == "none":
+        return None
+    if kind == "file":
+        return FileSink(path)
+    if kind == "topics":
+        return TopicLogSink(path)
+    raise ValueError(f"Unknown event sink: {kind}")
+
+
+class EventOutbox:
+    """
+    Durable queue between request handlers and an event sink
+
+    append() is a local SQLite insert, so emitting an event never waits on
+    the sink. A flusher thread delivers pending events oldest first in
+    batches of up to batch_size, as soon as that many are pending and
+    otherwise every flush_interval seconds, and deletes them once the sink
+    accepts the batch. A failing sink keeps its events in the outbox
+    and is retried on the next interval, so delivery is at-least-once.
+    With autostart=False the flusher only runs once start() is called;
+    until then events are delivered by explicit flush() calls.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        sink: EventSink,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        autostart: bool = True
+    ):
+        self.path = path
+        self.sink = sink
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.autostart = autostart
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(_SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+        self._pending = self._conn.execute("SELECT COUNT(*) FROM event_outbox").fetchone()[0]
+
+        self.appended = 0
+        self.delivered = 0
+        self.batches = 0
+        self.failures = 0
+
+    def append(self, event: Dict[str, Any]) -> None:
+        """Add one event (a dict with event_type) to the outbox"""
+        topic = EVENT_TOPICS[event["event_type"]]
+        payload = json.dumps(event, separators=(",", ":"), default=str)
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO event_outbox (topic, payload, created_at) VALUES (?, ?, ?)",
+                (topic, payload, time.time())
+            )
+            self._conn.commit()
+            self._pending += 1
+            self.appended += 1
+            pending = self._pending
+        if self.autostart:
+            self.start()
+        if pending >= self.batch_size:
+            self._wake.set()
+
+    def start(self) -> None:
+        """Start the flusher thread if it is not running"""
+        if self._thread is not None or self._stopping:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="event-outbox", daemon=True)
+                self._thread.start()
+
+    def flush(self) -> int:
+        """Deliver pending events until the outbox is empty; returns the number delivered"""
+        delivered = 0
+        with self._flush_lock:
+            while True:
+                count = self._deliver_batch()
+                if not count:
+                    return delivered
+                delivered += count
+
+    def _deliver_batch(self) -> int:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, topic, payload FROM event_outbox ORDER BY id LIMIT ?",
+                (self.batch_size,)
+            ).fetchall()
+        if not rows:
+            return 0
+
+        try:
+            self.sink.send([(topic, payload) for _, topic, payload in rows])
+        except Exception as e:
+            self.failures += 1
+            logger.warning(
+                "Event sink failed; batch kept for retry",
+                extra={"batch_size": len(rows), "error": str(e)}
+            )
+            return 0
+
+        with self._lock:
+            self._conn.execute("DELETE FROM event_outbox WHERE id <= ?", (rows[-1][0],))
+            self._conn.commit()
+            self._pending -= len(rows)
+        self.delivered += len(rows)
+        self.batches += 1
+        return len(rows)
+
+    def _run(self) -> None:
+        while not self._stopping:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error("Event outbox flush failed", extra={"error": str(e)})
+
+    def close(self) -> None:
+        """Stop the flusher, deliver what the sink will take and close the outbox"""
+        self._stopping = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+        self.flush()
+        self.sink.close()
+        with self._lock:
+            self._conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Backlog and delivery counters"""
+        return {
+            "pending": self._pending,
+            "appended": self.appended,
+            "delivered": self.delivered,
+            "batches": self.batches,
+            "failures": self.failures
+        }
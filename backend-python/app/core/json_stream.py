@@ -0,0 +1,129 @@
+"""
+Incremental JSON Parser
+Emits top-level object members as soon as each one is complete
+"""
+from typing import Any, List, Tuple
+import json
+
+
+_WHITESPACE = " \t\r\n"
+
+
+class IncrementalObjectParser:
+    """
+    Streaming parser for a single top-level JSON object
+
+    Text is fed in arbitrary chunks (e.g. LLM stream tokens). Anything
+    before the first '{' is skipped, which tolerates markdown code fences.
+    Each member is decoded with json.loads once its value is closed.
+    """
+
+    # Parser states
+    SEEK_OBJECT = 0
+    EXPECT_KEY = 1
+    IN_KEY = 2
+    EXPECT_COLON = 3
+    IN_VALUE = 4
+    DONE = 5
+
+    def __init__(self):
+        self.state = self.SEEK_OBJECT
+        self._buffer = ""
+        self._pos = 0
+        self._key = ""
+        self._token_start = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._error = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the closing brace of the top-level object was seen"""
+        return self.state == self.DONE
+
+    @property
+    def text(self) -> str:
+        """All text fed so far"""
+        return self._buffer
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """
+        Consume a chunk and return the (key, value) members it completed
+
+        Malformed input raises ValueError. Members completed earlier in the
+        same chunk are still returned first; the error surfaces on the next
+        call.
+        """
+        if self._error is not None:
+            raise self._error
+
+        self._buffer += chunk
+        completed: List[Tuple[str, Any]] = []
+        try:
+            self._consume(completed)
+        except ValueError as e:
+            if not completed:
+                raise
+            self._error = e
+        return completed
+
+    def _consume(self, completed: List[Tuple[str, Any]]) -> None:
+        buffer = self._buffer
+
+        while self._pos < len(buffer) and self.state != self.DONE:
+            char = buffer[self._pos]
+
+            if self.state == self.SEEK_OBJECT:
+                if char == "{":
+                    self.state = self.EXPECT_KEY
+
+            elif self.state == self.EXPECT_KEY:
+                if char == '"':
+                    self.state = self.IN_KEY
+                    self._token_start = self._pos
+                    self._escape = False
+                elif char == "}":
+                    self.state = self.DONE
+                elif char not in _WHITESPACE and char != ",":
+                    raise ValueError(f"Unexpected character {char!r} while expecting a key")
+
+            elif self.state == self.IN_KEY:
+                if self._escape:
+                    self._escape = False
+                elif char == "\\":
+                    self._escape = True
+                elif char == '"':
+                    self._key = json.loads(buffer[self._token_start:self._pos + 1])
+                    self.state = self.EXPECT_COLON
+
+            elif self.state == self.EXPECT_COLON:
+                if char == ":":
+                    self.state = self.IN_VALUE
+                    self._token_start = self._pos + 1
+                    self._depth = 0
+                    self._in_string = False
+                    self._escape = False
+                elif char not in _WHITESPACE:
+                    raise ValueError(f"Unexpected character {char!r} while expecting ':'")
+
+            elif self.state == self.IN_VALUE:
+                if self._in_string:
+                    if self._escape:
+                        self._escape = False
+                    elif char == "\\":
+                        self._escape = True
+                    elif char == '"':
+                        self._in_string = False
+                elif char == '"':
+                    self._in_string = True
+                elif char in "[{":
+                    self._depth += 1
+                elif char in "]}" and self._depth > 0:
+                    self._depth -= 1
+                elif char in ",}" and self._depth == 0:
+                    value = json.loads(buffer[self._token_start:self._pos])
+                    completed.append((self._key, value))
+                    self.state = self.DONE if char == "}" else self.EXPECT_KEY
+
+            self._pos += 1
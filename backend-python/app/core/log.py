@@ -0,0 +1,237 @@
+"""
+Structured Logging
+Queue-backed JSON-lines logging that keeps disk I/O off the request path
+"""
+from typing import Any, Dict, List, Optional
+import atexit
+import copy
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import threading
+from datetime import datetime, timezone
+
+from app.core.config import settings
+
+
+# Attributes every LogRecord has; anything else came from `extra=` and is emitted as a field
+_RESERVED_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+_traceback_formatter = logging.Formatter()
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops records instead of blocking when the queue is full"""
+
+    def __init__(self, log_queue: "queue.Queue", writer: "LogWriter"):
+        super().__init__(log_queue)
+        self.writer = writer
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Merge args into the message and render any traceback into exc_text
+
+        The stdlib version appends the traceback to the message and clears
+        exc_text; keeping it separate lets the writer emit an "exception"
+        field. Traceback objects never cross the queue.
+        """
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _traceback_formatter.formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if self.writer.autostart:
+            self.writer.start()
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.writer.dropped += 1
+
+
+class LogWriter:
+    """
+    Background writer thread for JSON-lines log files
+
+    Callers only enqueue records through `handler`. The writer thread drains
+    the queue in batches, writes each batch with a single flush, and rotates
+    the file once it grows past max_bytes. With autostart the thread is
+    started by the first record rather than by start().
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 10 * 1024 * 1024,
+        backup_count: int = 3,
+        batch_size: int = 256,
+        flush_interval: float = 0.5,
+        queue_size: int = 10000,
+        autostart: bool = False
+    ):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.autostart = autostart
+        self.dropped = 0
+        self.written = 0
+
+        self._queue: "queue.Queue" = queue.Queue(maxsize=queue_size)
+        self.handler = _DroppingQueueHandler(self._queue, self)
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._stream = None
+
+    def start(self) -> None:
+        """Start the writer thread"""
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+                self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Write everything still queued and stop the writer thread"""
+        if self._thread is None:
+            return
+        # Blocking put: the stop marker must not be dropped
+        self._queue.put(self._STOP)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def _run(self) -> None:
+        running = True
+        while running:
+            batch: List[logging.LogRecord] = []
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                continue
+
+            while True:
+                if item is self._STOP:
+                    running = False
+                    break
+                batch.append(item)
+                if len(batch) >= self.batch_size:
+                    break
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+            if batch:
+                self._write(batch)
+
+        if self._stream is not None:
+            self._stream.close()
+            self._stream = None
+
+    def _write(self, batch: List[logging.LogRecord]) -> None:
+        lines = []
+        for record in batch:
+            try:
+                lines.append(json.dumps(self.format(record), default=str))
+            except Exception:
+                self.dropped += 1
+
+        try:
+            if self._stream is None:
+                self._stream = open(self.path, "a", encoding="utf-8")
+            self._stream.write("\n".join(lines) + "\n")
+            self._stream.flush()
+            self.written += len(lines)
+
+            if self.max_bytes > 0 and self._stream.tell() >= self.max_bytes:
+                self._rotate()
+        except OSError:
+            self.dropped += len(lines)
+
+    def _rotate(self) -> None:
+        """Shift path -> path.1 -> ... -> path.N, discarding the oldest"""
+        self._stream.close()
+        self._stream = None
+
+        if self.backup_count <= 0:
+            os.remove(self.path)
+            return
+
+        for idx in range(self.backup_count - 1, 0, -1):
+            source = f"{self.path}.{idx}"
+            if os.path.exists(source):
+                os.replace(source, f"{self.path}.{idx + 1}")
+        os.replace(self.path, f"{self.path}.1")
+
+    @staticmethod
+    def format(record: logging.LogRecord) -> Dict[str, Any]:
+        """Convert a prepared log record to a JSON-serializable dict"""
+        entry = {
+            "ts": datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage()
+        }
+        for key, value in vars(record).items():
+            if key not in _RESERVED_ATTRS:
+                entry[key] = value
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return entry
+
+
+_writer: Optional[LogWriter] = None
+_writer_lock = threading.Lock()
+
+
+def configure_logging() -> LogWriter:
+    """
+    Attach the queue-backed writer to the application logger (idempotent)
+
+    The writer thread starts with the first record, so importing a module
+    that calls get_logger() does not start a thread.
+    """
+    global _writer
+    with _writer_lock:
+        if _writer is None:
+            _writer = LogWriter(
+                settings.LOG_FILE,
+                max_bytes=settings.LOG_MAX_BYTES,
+                backup_count=settings.LOG_BACKUP_COUNT,
+                batch_size=settings.LOG_BATCH_SIZE,
+                flush_interval=settings.LOG_FLUSH_INTERVAL,
+                queue_size=settings.LOG_QUEUE_SIZE,
+                autostart=True
+            )
+            app_logger = logging.getLogger("neurolearn")
+            app_logger.setLevel(settings.LOG_LEVEL)
+            app_logger.addHandler(_writer.handler)
+            app_logger.propagate = False
+            atexit.register(_writer.stop)
+    return _writer
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the writer thread"""
+    global _writer
+    with _writer_lock:
+        if _writer is not None:
+            logging.getLogger("neurolearn").removeHandler(_writer.handler)
+            _writer.stop()
+            atexit.unregister(_writer.stop)
+            _writer = None
+
+
+def get_logger(name: str) -> logging.Logger:
+    """Return an application logger, configuring the writer on first use"""
+    configure_logging()
+    return logging.getLogger(f"neurolearn.{name}")
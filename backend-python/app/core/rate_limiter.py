@@ -0,0 +1,166 @@
+"""
+Outbound Rate Limiter
+Concurrency cap, token bucket and retry-with-backoff for LLM provider calls
+"""
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, TypeVar
+from contextlib import asynccontextmanager
+import asyncio
+import random
+import sys
+import time
+
+from app.core.config import settings
+from app.core.log import get_logger
+
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+def _is_google_transient(exc: BaseException) -> bool:
+    """
+    Whether exc is a google.api_core 429 (TooManyRequests, ResourceExhausted)
+    or 5xx (ServerError, including DeadlineExceeded) error
+
+    Looked up in sys.modules rather than imported: if the SDK raised the
+    error, its exceptions module is already loaded.
+    """
+    google_exceptions = sys.modules.get("google.api_core.exceptions")
+    if google_exceptions is None:
+        return False
+    return isinstance(exc, (google_exceptions.TooManyRequests, google_exceptions.ServerError))
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Whether an error is a rate limit (429) or server-side (5xx) failure"""
+    if _is_google_transient(exc):
+        return True
+    for attr in ("code", "status_code"):
+        code = getattr(exc, attr, None)
+        if isinstance(code, int):
+            return code == 429 or 500 <= code < 600
+    return False
+
+
+class OutboundLimiter:
+    """
+    Limits outbound LLM calls
+
+    A semaphore caps concurrent calls and a token bucket caps the sustained
+    request rate. Retryable errors are retried with full-jitter exponential
+    backoff; the slot is released while backing off. Counters expose how
+    many calls are queued so saturation is visible before quotas trip.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = 16,
+        rate_per_second: float = 0.0,
+        burst: int = 1,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0
+    ):
+        self.max_concurrency = max_concurrency
+        self.rate_per_second = rate_per_second
+        self.burst = max(1, burst)
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._tokens = float(self.burst)
+        self._refilled_at = time.monotonic()
+
+        self.in_flight = 0
+        self.waiting = 0
+        self.max_waiting = 0
+        self.calls = 0
+        self.retries = 0
+        self.failures = 0
+
+    async def _take_token(self) -> None:
+        if self.rate_per_second <= 0:
+            return
+        while True:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst,
+                self._tokens + (now - self._refilled_at) * self.rate_per_second
+            )
+            self._refilled_at = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await asyncio.sleep((1 - self._tokens) / self.rate_per_second)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold one concurrency slot and one rate token for the enclosed call"""
+        self.waiting += 1
+        self.max_waiting = max(self.max_waiting, self.waiting)
+        try:
+            await self._semaphore.acquire()
+            try:
+                await self._take_token()
+            except BaseException:
+                self._semaphore.release()
+                raise
+        finally:
+            self.waiting -= 1
+
+        self.in_flight += 1
+        self.calls += 1
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for the given retry attempt (1-based)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** (attempt - 1))))
+
+    async def call(self, factory: Callable[[], Awaitable[T]]) -> T:
+        """Run factory() under the limits, retrying transient errors"""
+        attempt = 0
+        while True:
+            try:
+                async with self.slot():
+                    return await factory()
+            except Exception as e:
+                if not is_retryable(e) or attempt >= self.max_retries:
+                    self.failures += 1
+                    raise
+                attempt += 1
+                self.retries += 1
+                delay = self.backoff_delay(attempt)
+                logger.info(
+                    "Retrying LLM call after transient error",
+                    extra={"attempt": attempt, "delay": round(delay, 3), "error": type(e).__name__}
+                )
+                await asyncio.sleep(delay)
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and call counters"""
+        return {
+            "max_concurrency": self.max_concurrency,
+            "rate_per_second": self.rate_per_second,
+            "in_flight": self.in_flight,
+            "waiting": self.waiting,
+            "max_waiting": self.max_waiting,
+            "calls": self.calls,
+            "retries": self.retries,
+            "failures": self.failures
+        }
+
+
+outbound_limiter = OutboundLimiter(
+    max_concurrency=settings.LLM_MAX_CONCURRENCY,
+    rate_per_second=settings.LLM_RATE_PER_SECOND,
+    burst=settings.LLM_BURST,
+    max_retries=settings.LLM_MAX_RETRIES,
+    base_delay=settings.LLM_RETRY_BASE_DELAY,
+    max_delay=settings.LLM_RETRY_MAX_DELAY
+)
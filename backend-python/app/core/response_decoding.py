@@ -0,0 +1,171 @@
+"""
+LLM Response Decoding
+Locate, repair and validate the JSON payload of an LLM response
+"""
+from typing import Any, Dict, List, Optional, Tuple, Type, TypeVar
+import threading
+
+from pydantic import BaseModel, ValidationError
+
+from app.core.log import get_logger
+
+
+logger = get_logger(__name__)
+
+M = TypeVar("M", bound=BaseModel)
+
+_CLOSERS = {"{": "}", "[": "]"}
+_WHITESPACE = " \t\r\n"
+
+
+class ResponseDecodeError(ValueError):
+    """Raised when an LLM response holds no usable JSON payload"""
+
+
+def find_payload(text: str) -> str:
+    """
+    Slice the JSON document out of an LLM response
+
+    Takes everything from the first '{' or '[' to the last matching closer,
+    which drops markdown fences and any prose around the payload. A
+    response cut off before its closer is returned from the opener onwards.
+    """
+    starts = [i for i in (text.find("{"), text.find("[")) if i >= 0]
+    if not starts:
+        raise ResponseDecodeError("No JSON object or array in response")
+    start = min(starts)
+    end = text.rfind(_CLOSERS[text[start]])
+    return text[start:end + 1] if end > start else text[start:]
+
+
+def repair(payload: str) -> str:
+    """
+    Fix the formatting slips LLMs commonly make, in one scan
+
+    - trailing commas before '}' or ']' are removed
+    - text after the top-level value is closed is dropped
+    - a truncated document is cut back to its last complete member (after a
+      comma or closer) and the open arrays/objects are closed
+    """
+    out: List[str] = []
+    stack: List[str] = []
+    in_string = False
+    escape = False
+    # Last point where the document could be closed: (length of out, open closers)
+    cut: Optional[Tuple[int, Tuple[str, ...]]] = None
+
+    for ch in payload:
+        if in_string:
+            out.append(ch)
+            if escape:
+                escape = False
+            elif ch == "\\":
+                escape = True
+            elif ch == '"':
+                in_string = False
+            continue
+
+        if ch == '"':
+            in_string = True
+            out.append(ch)
+        elif ch in _CLOSERS:
+            stack.append(_CLOSERS[ch])
+            out.append(ch)
+            if len(stack) == 1:
+                cut = (len(out), tuple(stack))
+        elif ch == "}" or ch == "]":
+            while out and out[-1] in _WHITESPACE:
+                out.pop()
+            if out and out[-1] == ",":
+                out.pop()
+            if stack and stack[-1] == ch:
+                stack.pop()
+            out.append(ch)
+            if not stack:
+                return "".join(out)
+            cut = (len(out), tuple(stack))
+        elif ch == ",":
+            cut = (len(out), tuple(stack))
+            out.append(ch)
+        else:
+            out.append(ch)
+
+    if cut is None:
+        return "".join(out)
+
+    length, open_closers = cut
+    del out[length:]
+    while out and out[-1] in _WHITESPACE + ",":
+        out.pop()
+    out.extend(reversed(open_closers))
+    return "".join(out)
+
+
+def _is_syntax_error(error: ValidationError) -> bool:
+    return any(e["type"] == "json_invalid" for e in error.errors())
+
+
+class DecodeMetrics:
+    """Per-kind counts of clean, repaired and failed decodes"""
+
+    OUTCOMES = ("ok", "repaired", "failed")
+
+    def __init__(self):
+        self._counts: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, kind: str, outcome: str) -> None:
+        with self._lock:
+            counts = self._counts.setdefault(kind, dict.fromkeys(self.OUTCOMES, 0))
+            counts[outcome] += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counts.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Counts and failure rate for each response kind"""
+        with self._lock:
+            result = {}
+            for kind, counts in self._counts.items():
+                total = sum(counts.values())
+                result[kind] = dict(
+                    counts,
+                    total=total,
+                    failure_rate=round(counts["failed"] / total, 4) if total else 0.0
+                )
+            return result
+
+
+decode_metrics = DecodeMetrics()
+
+
+def decode(text: str, model: Type[M], kind: str) -> M:
+    """
+    Validate the JSON payload of an LLM response straight into a model
+
+    The payload goes through pydantic's native JSON parser via
+    model_validate_json; only on a JSON syntax error is it repaired and
+    validated once more. Schema errors are not repaired.
+    """
+    try:
+        payload = find_payload(text)
+        try:
+            result = model.model_validate_json(payload)
+            decode_metrics.record(kind, "ok")
+            return result
+        except ValidationError as e:
+            if not _is_syntax_error(e):
+                raise
+        result = model.model_validate_json(repair(payload))
+    except (ResponseDecodeError, ValidationError) as e:
+        decode_metrics.record(kind, "failed")
+        logger.warning(
+            "Could not decode LLM response",
+            extra={"kind": kind, "error": str(e).splitlines()[0], "length": len(text)}
+        )
+        raise ResponseDecodeError(f"Invalid {kind} response: {e}") from e
+
+    decode_metrics.record(kind, "repaired")
+    logger.info("Repaired malformed LLM response", extra={"kind": kind, "length": len(text)})
+    return result
@@ -0,0 +1,98 @@
+"""
+Response Rendering
+Fast JSON and MessagePack responses, negotiated on the Accept header
+"""
+from typing import Any, Dict, Optional
+import msgpack
+import orjson
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+_MSGPACK_ALIASES = {MSGPACK_MEDIA_TYPE, "application/x-msgpack"}
+_VARY = {"Vary": "Accept"}
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response without FastAPI's jsonable_encoder pass
+
+    Models are serialized by pydantic-core (model_dump_json), which is the
+    fastest path for an already-built model; everything else goes through
+    orjson.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode("utf-8")
+        return orjson.dumps(content, default=_dump_model)
+
+
+class MsgPackResponse(Response):
+    """MessagePack response for clients sending Accept: application/msgpack"""
+
+    media_type = MSGPACK_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            content = content.model_dump(mode="json")
+        return msgpack.packb(content, use_bin_type=True, default=_dump_model)
+
+
+def _dump_model(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Type is not serializable: {type(value).__name__}")
+
+
+def _quality(accept: str) -> Dict[str, float]:
+    """Media range -> q value from an Accept header"""
+    ranges: Dict[str, float] = {}
+    for part in accept.split(","):
+        media_range, _, params = part.strip().partition(";")
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.strip().partition("=")
+            if name == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        ranges[media_range.strip().lower()] = q
+    return ranges
+
+
+def negotiate(accept: Optional[str]) -> str:
+    """
+    Pick the response media type for an Accept header
+
+    MessagePack is only chosen when it is asked for explicitly and ranks at
+    least as high as JSON; wildcards resolve to JSON.
+    """
+    if not accept:
+        return JSON_MEDIA_TYPE
+    ranges = _quality(accept)
+    msgpack_q = max((ranges.get(alias, 0.0) for alias in _MSGPACK_ALIASES), default=0.0)
+    json_q = ranges.get(JSON_MEDIA_TYPE, ranges.get("application/*", ranges.get("*/*", 0.0)))
+    return MSGPACK_MEDIA_TYPE if msgpack_q > 0 and msgpack_q >= json_q else JSON_MEDIA_TYPE
+
+
+class ResponseRenderer:
+    """
+    Renders route results in the negotiated format
+
+    Routes return render(model) so FastAPI skips response_model
+    re-validation; the service layer has already built and validated the
+    models. response_model is kept on the routes for the OpenAPI schema.
+    """
+
+    def __init__(self, media_type: str = JSON_MEDIA_TYPE):
+        self.media_type = media_type
+
+    def __call__(self, content: Any, status_code: int = 200) -> Response:
+        if self.media_type == MSGPACK_MEDIA_TYPE:
+            return MsgPackResponse(content, status_code=status_code, headers=_VARY)
+        return ORJSONResponse(content, status_code=status_code, headers=_VARY)
@@ -0,0 +1,48 @@
+"""
+LLM Payload Models
+Schemas of the JSON documents the generation prompts ask the LLM for
+"""
+from pydantic import BaseModel
+from typing import List, Optional, Dict
+
+
+class RoadmapTopicPayload(BaseModel):
+    """One topic as returned by the roadmap prompt"""
+    name: str = ""
+    description: str = ""
+    estimated_time: str = "1-2 weeks"
+    difficulty: str = "medium"
+    priority: Optional[int] = None
+    concepts: List[str] = []
+    prerequisites: List[str] = []
+
+
+class RoadmapPayload(BaseModel):
+    """Roadmap prompt response"""
+    topics: List[RoadmapTopicPayload] = []
+
+
+class RevisionItemPayload(BaseModel):
+    """One concept as returned by the revision prompt"""
+    concept: str = ""
+    explanation: str = ""
+    examples: List[str] = []
+    practice_problems: List[str] = []
+    resources: List[Dict[str, str]] = []
+
+
+class RevisionPayload(BaseModel):
+    """Revision prompt response"""
+    revisions: List[RevisionItemPayload] = []
+
+
+class ModulePayload(BaseModel):
+    """Learning module prompt response"""
+    title: Optional[str] = None
+    tldr: str = ""
+    video_links: List[Dict[str, str]] = []
+    text_content: Optional[str] = None
+    key_concepts: List[str] = []
+    examples: List[str] = []
+    practice_exercises: List[str] = []
+    additional_resources: List[Dict[str, str]] = []
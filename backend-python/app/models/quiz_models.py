@@ -3,8 +3,9 @@ Quiz Request and Response Models
 Pydantic schemas for data validation
 """
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Union
 from enum import Enum
+from datetime import datetime
 
 
 class QuizFormType(str, Enum):
@@ -28,6 +29,14 @@ class SkillLevel(str, Enum):
     ADVANCED = "advanced"
 
 
+class JobState(str, Enum):
+    """Background job states"""
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
 class QuizSubmissionRequest(BaseModel):
     """Request model for quiz submission"""
     quiz_form: QuizFormType = Field(..., description="Type of quiz")
@@ -151,12 +160,40 @@ class ModuleQuizResponse(BaseModel):
         None,
         description="Targeted revision materials"
     )
+    job_id: Optional[str] = Field(
+        None,
+        description="Background job generating the revision data (?async=true)"
+    )
     
     # Next steps
     next_action: str = Field(..., description="What user should do next")
     unlock_next_module: bool = Field(..., description="Whether to unlock next module")
 
 
+class BatchQuizSubmissionRequest(BaseModel):
+    """Request model for bulk quiz submission (backfill / re-grading)"""
+    submissions: List[QuizSubmissionRequest] = Field(
+        ...,
+        min_length=1,
+        description="Quiz submissions to process"
+    )
+    regrade: bool = Field(
+        False,
+        description="Only grade: leave profiles, review schedule and analytics events untouched"
+    )
+
+
+class BatchQuizResponse(BaseModel):
+    """Response for bulk quiz submission"""
+    status: str = "success"
+    message: str
+    count: int = Field(..., description="Number of processed submissions")
+    results: List[Union[RoadmapResponse, ModuleQuizResponse]] = Field(
+        ...,
+        description="Per-submission results in request order"
+    )
+
+
 class LearningContentRequest(BaseModel):
     """Request for learning content"""
     user_id: str
@@ -205,6 +242,43 @@ class LearningContentResponse(BaseModel):
     estimated_time: str
 
 
+class JobResponse(BaseModel):
+    """State and, once finished, result of a background job"""
+    status: str = "success"
+    job_id: str
+    kind: str
+    state: JobState
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    result: Optional[Any] = Field(
+        None,
+        description="Job output once succeeded (revision data or a full response)"
+    )
+    error: Optional[str] = None
+
+
+class DueReview(BaseModel):
+    """A learner-module pair due for revision, with its decayed memory score"""
+    user_id: str
+    module_id: str
+    domain: str
+    current_score: float = Field(..., description="Estimated retention now (0-100)")
+    forgetting_score: float = Field(..., description="Risk of forgetting (0-100)")
+    decay_factor: float = Field(..., description="Forgetting-curve multiplier since last review")
+    revision_urgency: str = Field(..., description="Urgency level: high/medium/low")
+    review_count: int
+    days_since_review: int
+    last_reviewed_at: datetime
+    next_review_at: datetime
+
+
+class DueReviewsResponse(BaseModel):
+    """Pairs taken off the revision queue"""
+    status: str = "success"
+    count: int
+    reviews: List[DueReview]
+
+
 class ErrorResponse(BaseModel):
     """Error response model"""
     status: str = "error"
@@ -2,8 +2,8 @@
 ADK Agent Service
 Integration with Agent Development Kit for AI-powered content generation
 """
-from typing import Dict, Any, List
-import json
+from typing import Dict, Any, List, Callable, Awaitable, AsyncIterator, Iterator, Optional, Tuple
+import asyncio
 import os
 
 from app.models.quiz_models import (
@@ -14,6 +14,86 @@ from app.models.quiz_models import (
     SkillLevel
 )
 from app.core.config import settings
+from app.core.cache import response_cache
+from app.core.content_store import content_store
+from app.core.rate_limiter import outbound_limiter
+from app.models.llm_payloads import RoadmapPayload, RevisionPayload, ModulePayload
+from app.core.deadline import Deadline, DeadlineExceeded
+from app.core.response_decoding import decode
+from app.services.fallback_catalog import fallback_catalog
+from app.services.prompt_templates import (
+    CompiledPrompt,
+    MODULE_SECTION_FIELDS,
+    REVISION_PROMPT,
+    roadmap_prompt,
+    revision_prompt,
+    module_prompt,
+    module_section_prompts
+)
+from app.core.canonical import (
+    canonical_concepts,
+    canonical_topic,
+    concept_names,
+    generation_keys,
+    normalize_text
+)
+from app.core.json_stream import IncrementalObjectParser
+from app.services.llm_providers import create_provider
+from app.core.log import get_logger
+
+
+logger = get_logger(__name__)
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key
+    
+    The first caller starts the work as a task; callers arriving while it is
+    in flight await the same task instead of issuing their own request.
+    """
+    
+    def __init__(self):
+        self._calls: Dict[str, asyncio.Future] = {}
+        self.started = 0
+        self.coalesced = 0
+    
+    def future(self, key: str, factory: Callable[[], Awaitable[Any]]) -> asyncio.Future:
+        """Return the in-flight task for key, starting factory() if there is none"""
+        future = self._calls.get(key)
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._calls[key] = future
+            future.add_done_callback(lambda done: self._forget(key, done))
+            self.started += 1
+        else:
+            self.coalesced += 1
+        return future
+    
+    async def do(self, key: str, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Run factory() once per key among concurrent callers"""
+        # Shield so one cancelled waiter does not cancel the shared call
+        return await asyncio.shield(self.future(key, factory))
+    
+    def _forget(self, key: str, future: asyncio.Future) -> None:
+        if self._calls.get(key) is future:
+            del self._calls[key]
+        # Mark the error as retrieved: calls abandoned by every waiter
+        # (e.g. after a deadline) would otherwise log "never retrieved"
+        if not future.cancelled():
+            future.exception()
+    
+    def stats(self) -> Dict[str, int]:
+        """In-flight and coalescing counters"""
+        return {
+            "in_flight": len(self._calls),
+            "started": self.started,
+            "coalesced": self.coalesced
+        }
+
+
+# Shared across service instances so all callers coalesce on the same key
+single_flight = SingleFlight()
 
 
 class ADKAgentService:
@@ -25,31 +105,32 @@ class ADKAgentService:
         self.model = settings.DEFAULT_MODEL
         self.temperature = settings.TEMPERATURE
         self.max_tokens = settings.MAX_TOKENS
+        self.cache = response_cache
+        self.store = content_store
+        self.single_flight = single_flight
+        self.limiter = outbound_limiter
+        # Offline pregeneration writes generated content to the store and
+        # wants failures raised rather than replaced by mock content
+        self.persist_generated = False
+        self.fallback_on_error = True
+        self.sectioned_modules = settings.MODULE_SECTIONED
         
-        # Initialize ADK client if enabled
-        log_msg = f"DEBUG: ADK_ENABLED={self.adk_enabled}, API_KEY_LENGTH={len(self.api_key) if self.api_key else 0}, SETTINGS_MODEL={settings.DEFAULT_MODEL}\n"
-        with open("backend_debug.log", "a") as f:
-            f.write(log_msg)
-            
-        if self.adk_enabled and self.api_key:
-            try:
-                import google.generativeai as genai
-                genai.configure(api_key=self.api_key)
-                self.client = genai.GenerativeModel(self.model)
-                with open("backend_debug.log", "a") as f:
-                    f.write(f"DEBUG: ADK Client initialized with model {self.model} (Self.model)\n")
-            except ImportError:
-                with open("backend_debug.log", "a") as f:
-                    f.write("Error: Google Generative AI package not installed. ADK features limited.\n")
-                self.client = None
-            except Exception as e:
-                with open("backend_debug.log", "a") as f:
-                    f.write(f"Error initializing ADK client: {e}\n")
-                self.client = None
-        else:
-            with open("backend_debug.log", "a") as f:
-                f.write("DEBUG: ADK Client NOT initialized (missing key or disabled)\n")
-            self.client = None
+        # Initialize the LLM provider (Gemini when ADK is enabled with a key)
+        logger.debug(
+            "ADK settings loaded",
+            extra={
+                "adk_enabled": self.adk_enabled,
+                "api_key_length": len(self.api_key) if self.api_key else 0,
+                "model": self.model,
+                "provider": settings.LLM_PROVIDER
+            }
+        )
+        self.client = create_provider(settings.LLM_PROVIDER)
+    
+    def close(self) -> None:
+        """Release the LLM provider, writing out any queued recordings"""
+        if self.client is not None:
+            self.client.close()
     
     async def generate_roadmap(
         self,
@@ -59,69 +140,50 @@ class ADKAgentService:
         strengths: List[str],
         weaknesses: List[str],
         behavioral_profile: Dict[str, Any],
-        user_id: str
+        user_id: str,
+        deadline: Deadline = None
     ) -> List[RoadmapTopic]:
         """
         Generate personalized learning roadmap using ADK agent
+        
+        If the deadline passes first, the mock roadmap is returned and the
+        generation keeps running in the background to fill the cache.
         """
         if not self.client:
+            self._require_fallback()
             # Return mock roadmap for testing
             return self._generate_mock_roadmap(domain, skill_level, weaknesses)
         
         # Create prompt for ADK agent
-        prompt = self._create_roadmap_prompt(
-            domain,
-            skill_level,
+        prompt = roadmap_prompt(
+            domain.value,
+            skill_level.value,
             proficiency_score,
-            strengths,
-            weaknesses,
+            canonical_concepts(strengths, settings.PROMPT_MAX_CONCEPTS),
+            canonical_concepts(weaknesses, settings.PROMPT_MAX_CONCEPTS),
             behavioral_profile
         )
         
         try:
             # Call ADK agent with Gemini
-            system_prompt = "You are an expert educational content designer specializing in personalized learning paths. Generate structured, detailed roadmaps in JSON format."
-            full_prompt = f"{system_prompt}\n\n{prompt}\n\nIMPORTANT: Return ONLY valid JSON, no markdown formatting."
-            
-            response = await self.client.generate_content_async(
-                full_prompt,
-                generation_config={
-                    "temperature": self.temperature,
-                    "max_output_tokens": self.max_tokens,
-                }
+            return await self._generate_cached(
+                "roadmap",
+                prompt,
+                lambda text: self._parse_roadmap(text, domain),
+                deadline,
+                raw_inputs=(tuple(strengths), tuple(weaknesses))
             )
             
-            # Parse response
-            content = response.text.strip()
-            # Remove markdown code blocks if present
-            if content.startswith("```json"):
-                content = content[7:]
-            if content.startswith("```"):
-                content = content[3:]
-            if content.endswith("```"):
-                content = content[:-3]
-            content = content.strip()
-            
-            roadmap_data = json.loads(content)
-            
-            # Convert to RoadmapTopic objects
-            roadmap = []
-            for idx, topic in enumerate(roadmap_data.get("topics", [])):
-                roadmap.append(RoadmapTopic(
-                    topic_id=f"{domain}_{idx+1}",
-                    topic_name=topic.get("name", ""),
-                    description=topic.get("description", ""),
-                    estimated_time=topic.get("estimated_time", "1-2 weeks"),
-                    difficulty=topic.get("difficulty", "medium"),
-                    priority=topic.get("priority", idx + 1),
-                    concepts=topic.get("concepts", []),
-                    prerequisites=topic.get("prerequisites", [])
-                ))
-            
-            return roadmap
+        except DeadlineExceeded:
+            if not self.fallback_on_error:
+                raise
+            logger.info("Roadmap generation missed its deadline, using mock roadmap")
+            return self._generate_mock_roadmap(domain, skill_level, weaknesses)
             
         except Exception as e:
-            print(f"Error calling ADK agent: {e}")
+            if not self.fallback_on_error:
+                raise
+            logger.warning("Error calling ADK agent, using mock roadmap", exc_info=e)
             # Fallback to mock roadmap
             return self._generate_mock_roadmap(domain, skill_level, weaknesses)
     
@@ -130,56 +192,61 @@ class ADKAgentService:
         domain: DomainType,
         weak_concepts: List[str],
         module_id: str,
-        user_id: str
+        user_id: str,
+        deadline: Deadline = None
     ) -> List[RevisionData]:
         """
         Generate targeted revision content for weak concepts
+        
+        Content is cached per (domain, concept, module) unit, so a request is
+        assembled from cached units and only the concepts missing from the
+        cache are sent to the LLM, together in one prompt per
+        PROMPT_MAX_CONCEPTS concepts. Missing concepts fall back to mock
+        revision content when the deadline passes first.
+        
+        Units are keyed by canonical concept, but the response follows the
+        caller's order and spelling of weak_concepts, as the mock path does.
         """
         if not self.client:
+            self._require_fallback()
             return self._generate_mock_revision(weak_concepts)
         
-        prompt = self._create_revision_prompt(domain, weak_concepts, module_id)
+        raw_concepts = tuple(weak_concepts or ())
+        names = concept_names(raw_concepts)
+        concepts = sorted(names)
+        keys = {concept: self._revision_unit_key(domain, concept, module_id) for concept in concepts}
+        request_key = tuple(keys.values())
+        generation_keys.record("revision", (request_key, raw_concepts), request_key)
+        for key in keys.values():
+            generation_keys.record("revision_unit", key, key)
+        found = await asyncio.gather(*[self._lookup("revision_unit", key) for key in keys.values()])
+        units: Dict[str, RevisionData] = {
+            concept: unit for concept, unit in zip(keys, found) if unit is not None
+        }
+        missing = [concept for concept in concepts if concept not in units]
         
         try:
-            system_prompt = "You are an expert tutor creating targeted revision materials. Provide clear explanations, examples, and practice problems in JSON format."
-            full_prompt = f"{system_prompt}\n\n{prompt}\n\nIMPORTANT: Return ONLY valid JSON, no markdown formatting."
-            
-            response = await self.client.generate_content_async(
-                full_prompt,
-                generation_config={
-                    "temperature": self.temperature,
-                    "max_output_tokens": self.max_tokens,
-                }
-            )
+            if missing:
+                limit = settings.PROMPT_MAX_CONCEPTS
+                batches = await asyncio.gather(*[
+                    self._fill_revision_units(domain, missing[i:i + limit], module_id, keys, deadline)
+                    for i in range(0, len(missing), limit)
+                ])
+                for batch in batches:
+                    units.update(batch)
+            return self._partial_revision(names, units)
             
-            content = response.text.strip()
-            # Remove markdown code blocks if present
-            if content.startswith("```json"):
-                content = content[7:]
-            if content.startswith("```"):
-                content = content[3:]
-            if content.endswith("```"):
-                content = content[:-3]
-            content = content.strip()
-            
-            revision_data = json.loads(content)
-            
-            # Convert to RevisionData objects
-            revisions = []
-            for concept_data in revision_data.get("revisions", []):
-                revisions.append(RevisionData(
-                    concept=concept_data.get("concept", ""),
-                    explanation=concept_data.get("explanation", ""),
-                    examples=concept_data.get("examples", []),
-                    practice_problems=concept_data.get("practice_problems", []),
-                    resources=concept_data.get("resources", [])
-                ))
-            
-            return revisions
+        except DeadlineExceeded:
+            if not self.fallback_on_error:
+                raise
+            logger.info("Revision generation missed its deadline, using mock revision")
+            return self._partial_revision(names, units)
             
         except Exception as e:
-            print(f"Error generating revision content: {e}")
-            return self._generate_mock_revision(weak_concepts)
+            if not self.fallback_on_error:
+                raise
+            logger.warning("Error generating revision content, using mock revision", exc_info=e)
+            return self._partial_revision(names, units)
     
     async def generate_learning_module(
         self,
@@ -189,179 +256,422 @@ class ADKAgentService:
         format_preference: str,
         weak_concepts: List[str],
         user_id: str,
-        module_id: str = None
+        module_id: str = None,
+        deadline: Deadline = None
     ) -> LearningModule:
         """
         Generate personalized learning module content
+        
+        Falls back to the mock module when the deadline passes first. With
+        sectioned_modules the module is generated section by section
+        instead (see _generate_sectioned_module).
         """
         if not self.client:
+            self._require_fallback()
             return self._generate_mock_module(topic, format_preference)
         
-        prompt = self._create_module_prompt(
-            domain,
-            topic,
-            skill_level,
+        raw_concepts = tuple(weak_concepts or ())
+        if self.sectioned_modules:
+            return await self._generate_sectioned_module(
+                domain, topic, skill_level, format_preference, raw_concepts, module_id, deadline
+            )
+        
+        prompt = module_prompt(
+            domain.value,
+            canonical_topic(topic),
+            skill_level.value,
             format_preference,
-            weak_concepts
+            canonical_concepts(raw_concepts, settings.PROMPT_MAX_CONCEPTS)
         )
+        module_id = self._module_id(domain, topic, module_id)
         
         try:
-            system_prompt = "You are an expert content creator for educational platforms. Create comprehensive, engaging learning modules in JSON format."
-            full_prompt = f"{system_prompt}\n\n{prompt}\n\nIMPORTANT: Return ONLY valid JSON, no markdown formatting."
-            
-            response = await self.client.generate_content_async(
-                full_prompt,
-                generation_config={
-                    "temperature": self.temperature,
-                    "max_output_tokens": self.max_tokens,
-                }
+            module = await self._generate_cached(
+                "module",
+                prompt,
+                lambda text: self._parse_module(text, domain, topic, format_preference, module_id),
+                deadline,
+                raw_inputs=(topic, raw_concepts)
             )
+            return self._with_module_id(module, module_id)
             
-            content = response.text.strip()
-            # Remove markdown code blocks if present
-            if content.startswith("```json"):
-                content = content[7:]
-            if content.startswith("```"):
-                content = content[3:]
-            if content.endswith("```"):
-                content = content[:-3]
-            content = content.strip()
-            
-            module_data = json.loads(content)
-            
-            return LearningModule(
-                module_id=module_id or f"{domain}_{topic.replace(' ', '_')}",
-                title=module_data.get("title", topic),
-                tldr=module_data.get("tldr", ""),
-                content_type=format_preference,
-                video_links=module_data.get("video_links", []),
-                text_content=module_data.get("text_content"),
-                key_concepts=module_data.get("key_concepts", []),
-                examples=module_data.get("examples", []),
-                practice_exercises=module_data.get("practice_exercises", []),
-                additional_resources=module_data.get("additional_resources", [])
-            )
+        except DeadlineExceeded:
+            if not self.fallback_on_error:
+                raise
+            logger.info("Module generation missed its deadline, using mock module")
+            return self._generate_mock_module(topic, format_preference)
             
         except Exception as e:
-            with open("backend_debug.log", "a") as f:
-                f.write(f"Error generating learning module: {e}\n")
+            if not self.fallback_on_error:
+                raise
+            logger.warning("Error generating learning module, using mock module", exc_info=e)
             return self._generate_mock_module(topic, format_preference)
     
-    def _create_roadmap_prompt(
+    async def _generate_sectioned_module(
         self,
         domain: DomainType,
+        topic: str,
         skill_level: SkillLevel,
-        proficiency_score: float,
-        strengths: List[str],
-        weaknesses: List[str],
-        behavioral_profile: Dict[str, Any]
-    ) -> str:
-        """Create prompt for roadmap generation"""
-        return f"""Generate a personalized learning roadmap for a {skill_level.value} learner in {domain.value}.
-
-User Profile:
-- Proficiency Score: {proficiency_score:.2f}/1.0
-- Strengths: {', '.join(strengths) if strengths else 'None identified'}
-- Weaknesses: {', '.join(weaknesses) if weaknesses else 'None identified'}
-- Learning Style: {behavioral_profile.get('overall_behavior_profile', 'Balanced')}
-- Decision Pattern: {behavioral_profile.get('decision_pattern', 'N/A')}
-
-Requirements:
-1. Create 5-8 topics tailored to their level and gaps
-2. Prioritize weak areas while building on strengths
-3. Include clear learning objectives and prerequisites
-4. Estimate realistic time commitments
-5. Structure for progressive difficulty
-
-Return JSON with this structure:
-{{
-    "topics": [
-        {{
-            "name": "Topic Name",
-            "description": "Detailed description",
-            "estimated_time": "1-2 weeks",
-            "difficulty": "beginner/intermediate/advanced",
-            "priority": 1,
-            "concepts": ["concept1", "concept2"],
-            "prerequisites": ["prerequisite1"]
-        }}
-    ]
-}}"""
+        format_preference: str,
+        weak_concepts: Tuple[str, ...],
+        module_id: str = None,
+        deadline: Deadline = None
+    ) -> LearningModule:
+        """
+        Generate a module as independent section prompts run concurrently
+        
+        Each section (overview, content, practice, media) goes through
+        _generate_cached on its own, so sections are cached, coalesced and
+        limited separately and wall-clock time follows the slowest section
+        rather than the sum. A section that fails or misses the deadline
+        only loses its own fields, which come from the mock module instead.
+        """
+        prompts = module_section_prompts(
+            domain.value,
+            canonical_topic(topic),
+            skill_level.value,
+            format_preference,
+            canonical_concepts(weak_concepts, settings.PROMPT_MAX_CONCEPTS)
+        )
+        results = await asyncio.gather(*[
+            self._generate_cached(
+                prompt.kind,
+                prompt,
+                lambda text, section=section: self._parse_section(text, section),
+                deadline,
+                raw_inputs=(topic, weak_concepts)
+            )
+            for section, prompt in prompts.items()
+        ], return_exceptions=True)
+        
+        fields: Dict[str, Any] = {}
+        mock = None
+        for section, result in zip(prompts, results):
+            if isinstance(result, Exception):
+                if not self.fallback_on_error:
+                    raise result
+                logger.warning(
+                    "Module section generation failed, using mock section",
+                    extra={"section": section, "error": str(result) or type(result).__name__}
+                )
+                mock = mock or self._generate_mock_module(topic, format_preference)
+                result = {name: getattr(mock, name) for name in MODULE_SECTION_FIELDS[section]}
+            fields.update(result)
+        fields["title"] = fields.get("title") or topic
+        
+        return LearningModule.model_construct(
+            module_id=self._module_id(domain, topic, module_id),
+            content_type=format_preference,
+            **fields
+        )
     
-    def _create_revision_prompt(
+    async def stream_learning_module(
         self,
         domain: DomainType,
+        topic: str,
+        skill_level: SkillLevel,
+        format_preference: str,
         weak_concepts: List[str],
-        module_id: str
-    ) -> str:
-        """Create prompt for revision content generation"""
-        return f"""Create targeted revision materials for {domain.value} concepts where the learner needs improvement.
-
-Weak Concepts: {', '.join(weak_concepts)}
-Module: {module_id}
-
-For each concept, provide:
-1. Clear, simplified explanation
-2. 2-3 practical examples
-3. 2-3 practice problems with hints
-4. Recommended resources (videos, articles)
-
-Return JSON:
-{{
-    "revisions": [
-        {{
-            "concept": "Concept Name",
-            "explanation": "Clear explanation",
-            "examples": ["example1", "example2"],
-            "practice_problems": ["problem1", "problem2"],
-            "resources": [
-                {{"type": "video", "title": "...", "url": "..."}},
-                {{"type": "article", "title": "...", "url": "..."}}
-            ]
-        }}
-    ]
-}}"""
+        user_id: str,
+        module_id: str = None
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Stream a learning module field by field
+        
+        Yields ("field", (name, value)) as each top-level module field is
+        completed by the model, then ("module", LearningModule) with the
+        validated result. The final module is authoritative: if the stream
+        fails part-way, it carries the mock fallback instead. Cached and mock
+        modules are replayed through the same events.
+        """
+        if not self.client:
+            for event in self._module_events(self._generate_mock_module(topic, format_preference)):
+                yield event
+            return
+        
+        raw_concepts = tuple(weak_concepts or ())
+        prompt = module_prompt(
+            domain.value,
+            canonical_topic(topic),
+            skill_level.value,
+            format_preference,
+            canonical_concepts(raw_concepts, settings.PROMPT_MAX_CONCEPTS)
+        )
+        module_id = self._module_id(domain, topic, module_id)
+        full_prompt = prompt.text
+        key = self.cache.make_key("module", full_prompt, self.model, self.temperature, self.max_tokens)
+        generation_keys.record("module", (key, topic, raw_concepts), key)
+        cached = await self._lookup("module", key)
+        if cached is not None:
+            for event in self._module_events(self._with_module_id(cached, module_id)):
+                yield event
+            return
+        
+        parser = IncrementalObjectParser()
+        chunks: "asyncio.Queue[Optional[str]]" = asyncio.Queue()
+        
+        async def read_stream() -> None:
+            # The slot covers only the model call: chunks are queued, so a
+            # slow reader never holds it. Streams are not retried.
+            try:
+                async with self.limiter.slot():
+                    response = await self.client.generate_content_async(
+                        full_prompt,
+                        generation_config={
+                            "temperature": self.temperature,
+                            "max_output_tokens": self.max_tokens,
+                        },
+                        stream=True
+                    )
+                    async for chunk in response:
+                        chunks.put_nowait(chunk.text)
+            finally:
+                chunks.put_nowait(None)
+        
+        reader = asyncio.create_task(read_stream())
+        try:
+            while True:
+                text = await chunks.get()
+                if text is None:
+                    break
+                for name, value in parser.feed(text):
+                    if name in LearningModule.model_fields:
+                        yield "field", (name, value)
+            await reader  # Raises if the model call failed
+            
+            module = self._parse_module(parser.text, domain, topic, format_preference, module_id)
+            self.cache.set("module", key, module)
+            
+        except Exception as e:
+            logger.warning("Error streaming learning module, using mock module", exc_info=e)
+            module = self._generate_mock_module(topic, format_preference)
+        finally:
+            # An abandoned stream stops the model call and frees its slot
+            reader.cancel()
+        
+        yield "module", module
+    
+    def _module_events(self, module: LearningModule) -> Iterator[Tuple[str, Any]]:
+        """Replay an already built module as stream events"""
+        for name, value in module.model_dump().items():
+            yield "field", (name, value)
+        yield "module", module
     
-    def _create_module_prompt(
+    async def _generate_cached(
+        self,
+        kind: str,
+        prompt: CompiledPrompt,
+        parse: Callable[[str], Any],
+        deadline: Deadline = None,
+        raw_inputs: Any = (),
+        cache_result: bool = True
+    ) -> Any:
+        """
+        Run a generation through the response cache
+        
+        The key covers the fully built prompt and model settings, so any
+        change to either produces a fresh generation. Concurrent misses on
+        the same key share a single in-flight request, which runs under the
+        outbound limiter (concurrency cap, rate limit, transient retries).
+        
+        On a cache miss the content store (pregenerated content) is checked
+        before calling the LLM.
+        
+        With a deadline, waiting stops when the budget runs out and
+        DeadlineExceeded is raised; the shared call carries on and caches
+        its result for later requests. Only successfully
+        parsed results are cached; errors propagate to every waiting caller.
+        
+        Prompts are built from canonicalized inputs, so equivalent requests
+        share a key; raw_inputs (the inputs as given) are only used to count
+        how many distinct keys there would have been without that.
+        
+        With cache_result=False the result itself is neither looked up nor
+        stored; parse is then responsible for caching what it extracts.
+        """
+        full_prompt = prompt.text
+        key = self.cache.make_key(kind, full_prompt, self.model, self.temperature, self.max_tokens)
+        generation_keys.record(kind, (key, raw_inputs), key)
+        if cache_result:
+            cached = await self._lookup(kind, key)
+            if cached is not None:
+                return cached
+        
+        async def generate() -> Any:
+            logger.debug(
+                "Sending prompt",
+                extra={"kind": kind, "estimated_tokens": prompt.estimated_tokens}
+            )
+            response = await self.limiter.call(lambda: self.client.generate_content_async(
+                full_prompt,
+                generation_config={
+                    "temperature": self.temperature,
+                    "max_output_tokens": self.max_tokens,
+                }
+            ))
+            
+            result = parse(response.text)
+            if cache_result:
+                self.cache.set(kind, key, result)
+                if self.persist_generated:
+                    self.store.put(kind, key, result)
+            return result
+        
+        future = self.single_flight.future(key, generate)
+        if deadline is None:
+            return await asyncio.shield(future)
+        
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout=deadline.remaining())
+        except asyncio.TimeoutError:
+            raise DeadlineExceeded(f"{kind} generation exceeded {deadline.timeout:.2f}s budget")
+    
+    async def _fill_revision_units(
         self,
         domain: DomainType,
+        concepts: List[str],
+        module_id: str,
+        keys: Dict[str, str],
+        deadline: Deadline = None
+    ) -> Dict[str, RevisionData]:
+        """Generate the given concepts in one prompt and cache each as its own unit"""
+        def parse(text: str) -> Dict[str, RevisionData]:
+            units = self._match_units(concepts, self._parse_revisions(text))
+            for concept, unit in units.items():
+                self.cache.set("revision_unit", keys[concept], unit)
+                if self.persist_generated:
+                    self.store.put("revision_unit", keys[concept], unit)
+            return units
+        
+        return await self._generate_cached(
+            "revision_batch",
+            revision_prompt(domain.value, concepts, module_id),
+            parse,
+            deadline,
+            raw_inputs=tuple(concepts),
+            cache_result=False
+        )
+    
+    def _revision_unit_key(self, domain: DomainType, concept: str, module_id: str) -> str:
+        """Cache key of one concept's revision content; concept is canonical"""
+        unit = f"{REVISION_PROMPT.prefix}\n{domain.value}\n{module_id or 'general'}\n{concept}"
+        return self.cache.make_key("revision_unit", unit, self.model, self.temperature, self.max_tokens)
+    
+    def _match_units(self, concepts: List[str], items: List[RevisionData]) -> Dict[str, RevisionData]:
+        """
+        Assign generated revision items to the requested concepts
+        
+        Items whose concept names a requested concept are matched by name;
+        the rest fill the remaining concepts in prompt order. Extra items
+        are dropped and concepts left without an item stay uncached.
+        """
+        units: Dict[str, RevisionData] = {}
+        unmatched = []
+        for item in items:
+            concept = normalize_text(item.concept or "")
+            if concept in concepts and concept not in units:
+                units[concept] = item
+            else:
+                unmatched.append(item)
+        remaining = [concept for concept in concepts if concept not in units]
+        units.update(zip(remaining, unmatched))
+        return units
+    
+    def _partial_revision(self, names: Dict[str, str], units: Dict[str, RevisionData]) -> List[RevisionData]:
+        """
+        Units named and ordered as the caller gave the concepts
+        
+        names maps canonical concepts to the caller's spelling, in the
+        caller's order. Concepts without a unit get mock content, as far as
+        the fallback catalog provides it.
+        """
+        missing = [name for concept, name in names.items() if concept not in units]
+        mock = {revision.concept: revision for revision in self._generate_mock_revision(missing)}
+        revisions = []
+        for concept, name in names.items():
+            if concept in units:
+                revisions.append(units[concept].model_copy(update={"concept": name}))
+            elif name in mock:
+                revisions.append(mock[name])
+        return revisions
+    
+    async def _lookup(self, kind: str, key: str) -> Any:
+        """
+        Cached content for key, falling back to the pregenerated store
+        
+        The store is SQLite, so a cache miss reads it in a worker thread.
+        """
+        cached = self.cache.get(kind, key)
+        if cached is None:
+            if self.store.enabled:
+                cached = await asyncio.to_thread(self.store.get, kind, key)
+            else:
+                cached = self.store.get(kind, key)
+            if cached is not None:
+                self.cache.set(kind, key, cached)
+        return cached
+    
+    def _require_fallback(self) -> None:
+        """Raise instead of serving mock content when fallbacks are disabled"""
+        if not self.fallback_on_error:
+            raise RuntimeError("LLM client is not configured (check LLM_PROVIDER, ADK_ENABLED and GEMINI_API_KEY)")
+    
+    def _module_id(self, domain: DomainType, topic: str, module_id: str = None) -> str:
+        return module_id or f"{domain}_{topic.replace(' ', '_')}"
+    
+    def _with_module_id(self, module: LearningModule, module_id: str) -> LearningModule:
+        """A shared (cached) module stamped with this request's module_id"""
+        if module.module_id == module_id:
+            return module
+        return module.model_copy(update={"module_id": module_id})
+    
+    def _parse_roadmap(self, text: str, domain: DomainType) -> List[RoadmapTopic]:
+        """Parse roadmap JSON into RoadmapTopic objects"""
+        payload = decode(text, RoadmapPayload, "roadmap")
+        
+        # Fields are already validated, so build the topics without re-validating
+        return [
+            RoadmapTopic.model_construct(
+                topic_id=f"{domain}_{idx+1}",
+                topic_name=topic.name,
+                description=topic.description,
+                estimated_time=topic.estimated_time,
+                difficulty=topic.difficulty,
+                priority=topic.priority if topic.priority is not None else idx + 1,
+                concepts=topic.concepts,
+                prerequisites=topic.prerequisites
+            )
+            for idx, topic in enumerate(payload.topics)
+        ]
+    
+    def _parse_revisions(self, text: str) -> List[RevisionData]:
+        """Parse revision JSON into RevisionData objects"""
+        payload = decode(text, RevisionPayload, "revision")
+        return [RevisionData.model_construct(**dict(item)) for item in payload.revisions]
+    
+    def _parse_module(
+        self,
+        text: str,
+        domain: DomainType,
         topic: str,
-        skill_level: SkillLevel,
         format_preference: str,
-        weak_concepts: List[str]
-    ) -> str:
-        """Create prompt for learning module generation"""
-        focus = f"\nFocus areas: {', '.join(weak_concepts)}" if weak_concepts else ""
+        module_id: str = None
+    ) -> LearningModule:
+        """Parse learning module JSON into a LearningModule"""
+        payload = decode(text, ModulePayload, "module")
+        fields = dict(payload)
+        fields["title"] = payload.title or topic
         
-        return f"""Create a comprehensive learning module for {topic} in {domain.value}.
-
-Learner Level: {skill_level.value}
-Format Preference: {format_preference}{focus}
-
-Include:
-1. Engaging title and TL;DR summary
-2. Core content (text explanation)
-3. Key concepts list
-4. 3-5 practical examples
-5. Practice exercises
-6. Video recommendations (if applicable)
-7. Additional resources
-
-Return JSON:
-{{
-    "title": "Module Title",
-    "tldr": "Brief summary (2-3 sentences)",
-    "text_content": "Comprehensive explanation",
-    "key_concepts": ["concept1", "concept2"],
-    "examples": ["example1", "example2"],
-    "practice_exercises": ["exercise1", "exercise2"],
-    "video_links": [
-        {{"title": "Video Title", "url": "YouTube URL", "duration": "10 min"}}
-    ],
-    "additional_resources": [
-        {{"type": "article", "title": "...", "url": "..."}}
-    ]
-}}"""
+        return LearningModule.model_construct(
+            module_id=self._module_id(domain, topic, module_id),
+            content_type=format_preference,
+            **fields
+        )
+    
+    def _parse_section(self, text: str, section: str) -> Dict[str, Any]:
+        """Parse one module section into its LearningModule fields"""
+        payload = decode(text, ModulePayload, f"module_{section}")
+        return {name: getattr(payload, name) for name in MODULE_SECTION_FIELDS[section]}
     
     def _generate_mock_roadmap(
         self,
@@ -369,144 +679,13 @@ Return JSON:
         skill_level: SkillLevel,
         weaknesses: List[str]
     ) -> List[RoadmapTopic]:
-        """Generate mock roadmap for testing"""
-        roadmaps = {
-            DomainType.DSA: [
-                RoadmapTopic(
-                    topic_id="dsa_1",
-                    topic_name="Arrays and Strings",
-                    description="Master array manipulation, string operations, and two-pointer techniques",
-                    estimated_time="1-2 weeks",
-                    difficulty="beginner",
-                    priority=1,
-                    concepts=["array traversal", "string manipulation", "two pointers"],
-                    prerequisites=[]
-                ),
-                RoadmapTopic(
-                    topic_id="dsa_2",
-                    topic_name="Linked Lists",
-                    description="Understand node-based data structures and pointer manipulation",
-                    estimated_time="1 week",
-                    difficulty="intermediate",
-                    priority=2,
-                    concepts=["singly linked list", "doubly linked list", "circular list"],
-                    prerequisites=["dsa_1"]
-                ),
-                RoadmapTopic(
-                    topic_id="dsa_3",
-                    topic_name="Stacks and Queues",
-                    description="Learn LIFO and FIFO data structures with real-world applications",
-                    estimated_time="1 week",
-                    difficulty="intermediate",
-                    priority=3,
-                    concepts=["stack operations", "queue operations", "deque"],
-                    prerequisites=["dsa_1"]
-                )
-            ],
-            DomainType.WEB_DEV: [
-                RoadmapTopic(
-                    topic_id="web_1",
-                    topic_name="HTML & CSS Fundamentals",
-                    description="Build responsive layouts with modern HTML5 and CSS3",
-                    estimated_time="2 weeks",
-                    difficulty="beginner",
-                    priority=1,
-                    concepts=["semantic HTML", "flexbox", "grid", "responsive design"],
-                    prerequisites=[]
-                ),
-                RoadmapTopic(
-                    topic_id="web_2",
-                    topic_name="JavaScript Basics",
-                    description="Master JavaScript fundamentals and DOM manipulation",
-                    estimated_time="2-3 weeks",
-                    difficulty="intermediate",
-                    priority=2,
-                    concepts=["variables", "functions", "DOM", "events"],
-                    prerequisites=["web_1"]
-                )
-            ],
-            DomainType.AI_ML: [
-                RoadmapTopic(
-                    topic_id="ai_1",
-                    topic_name="Python for ML",
-                    description="Learn Python essentials and ML libraries",
-                    estimated_time="2 weeks",
-                    difficulty="beginner",
-                    priority=1,
-                    concepts=["numpy", "pandas", "matplotlib"],
-                    prerequisites=[]
-                ),
-                RoadmapTopic(
-                    topic_id="ai_2",
-                    topic_name="Linear Regression",
-                    description="Understand supervised learning with regression",
-                    estimated_time="1 week",
-                    difficulty="intermediate",
-                    priority=2,
-                    concepts=["gradient descent", "cost function", "predictions"],
-                    prerequisites=["ai_1"]
-                )
-            ]
-        }
-        
-        return roadmaps.get(domain, roadmaps[DomainType.DSA])[:5]
+        """Mock roadmap from the prebuilt fallback catalog"""
+        return fallback_catalog.roadmap(domain, skill_level, weaknesses)
     
     def _generate_mock_revision(self, weak_concepts: List[str]) -> List[RevisionData]:
-        """Generate mock revision content"""
-        revisions = []
-        for concept in weak_concepts[:3]:
-            revisions.append(RevisionData(
-                concept=concept,
-                explanation=f"Detailed explanation of {concept} with simplified approach",
-                examples=[
-                    f"Example 1: Basic {concept} application",
-                    f"Example 2: Advanced {concept} use case"
-                ],
-                practice_problems=[
-                    f"Practice problem 1 for {concept}",
-                    f"Practice problem 2 for {concept}"
-                ],
-                resources=[
-                    {"type": "video", "title": f"{concept} Tutorial", "url": "#"},
-                    {"type": "article", "title": f"Understanding {concept}", "url": "#"}
-                ]
-            ))
-        return revisions
+        """Mock revision content from the prebuilt fallback catalog"""
+        return fallback_catalog.revisions(weak_concepts)
     
     def _generate_mock_module(self, topic: str, format_preference: str) -> LearningModule:
-        """Generate mock learning module"""
-        return LearningModule(
-            module_id=f"module_{topic.replace(' ', '_').lower()}",
-            title=f"Mastering {topic}",
-            tldr=f"A comprehensive guide to understanding {topic} with practical examples",
-            content_type=format_preference,
-            video_links=[
-                {"title": f"{topic} Introduction", "url": "https://youtube.com/watch?v=example", "duration": "15 min"}
-            ] if format_preference in ["video", "mixed"] else [],
-            text_content=f"""
-# Introduction to {topic}
-
-{topic} is a fundamental concept that every developer should master.
-
-## Key Points
-- Understanding the basics
-- Practical applications
-- Best practices
-
-## Deep Dive
-[Detailed explanation would go here]
-            """,
-            key_concepts=[f"{topic} fundamentals", f"{topic} applications", f"{topic} best practices"],
-            examples=[
-                f"Example 1: Basic {topic} implementation",
-                f"Example 2: Real-world {topic} use case",
-                f"Example 3: Advanced {topic} pattern"
-            ],
-            practice_exercises=[
-                f"Exercise 1: Implement {topic}",
-                f"Exercise 2: Optimize {topic}"
-            ],
-            additional_resources=[
-                {"type": "documentation", "title": f"Official {topic} Docs", "url": "#"}
-            ]
-        )
+        """Mock learning module from the prebuilt fallback catalog"""
+        return fallback_catalog.module(topic, format_preference)
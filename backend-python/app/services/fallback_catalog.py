@@ -0,0 +1,242 @@
+"""
+Fallback Catalog
+Prebuilt mock content served when the LLM is unavailable or too slow
+"""
+from typing import Dict, List, Sequence, Set, Tuple
+from functools import lru_cache
+import re
+
+from app.models.quiz_models import (
+    RoadmapTopic,
+    RevisionData,
+    LearningModule,
+    DomainType,
+    SkillLevel
+)
+
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def _terms(text: str) -> Set[str]:
+    """Lowercased phrase plus its individual words, for weakness lookup"""
+    phrase = text.strip().lower()
+    return {phrase, *_WORD.findall(phrase)}
+
+
+class FallbackCatalog:
+    """
+    Immutable fallback content, built once per process
+
+    Roadmaps are stored as tuples per (domain, skill level) together with a
+    term index from concept/topic words to topic positions, so reordering by
+    weakness is an index lookup rather than a rebuild. Revision and module
+    fallbacks are built once per concept / topic and memoized.
+    
+    Returned models are shared between requests and must be treated as
+    read-only; copy them before modifying.
+    """
+    
+    MAX_ROADMAP_TOPICS = 5
+    
+    def __init__(self):
+        self._roadmaps: Dict[Tuple[DomainType, SkillLevel], Tuple[RoadmapTopic, ...]] = {}
+        self._term_index: Dict[Tuple[DomainType, SkillLevel], Dict[str, Tuple[int, ...]]] = {}
+        
+        for domain, topics in self._build_roadmaps().items():
+            for skill_level in SkillLevel:
+                ordered = self._order_for_level(topics, skill_level)
+                key = (domain, skill_level)
+                self._roadmaps[key] = ordered
+                self._term_index[key] = self._index_terms(ordered)
+        
+        self.revision = lru_cache(maxsize=4096)(self._build_revision)
+        self.module = lru_cache(maxsize=1024)(self._build_module)
+    
+    def roadmap(
+        self,
+        domain: DomainType,
+        skill_level: SkillLevel,
+        weaknesses: Sequence[str]
+    ) -> List[RoadmapTopic]:
+        """Topics for a domain and level, those covering a weakness first"""
+        key = (domain, skill_level or SkillLevel.INTERMEDIATE)
+        if key not in self._roadmaps:
+            key = (DomainType.DSA, key[1])
+        topics = self._roadmaps[key]
+        
+        if weaknesses:
+            index = self._term_index[key]
+            matched: Set[int] = set()
+            for weakness in weaknesses:
+                for term in _terms(weakness):
+                    matched.update(index.get(term, ()))
+            if matched:
+                order = sorted(matched) + [i for i in range(len(topics)) if i not in matched]
+                return [topics[i] for i in order[:self.MAX_ROADMAP_TOPICS]]
+        
+        return list(topics[:self.MAX_ROADMAP_TOPICS])
+    
+    def revisions(self, weak_concepts: Sequence[str]) -> List[RevisionData]:
+        """Revision entries for up to three weak concepts"""
+        return [self.revision(concept) for concept in weak_concepts[:3]]
+    
+    @staticmethod
+    def _order_for_level(
+        topics: Sequence[RoadmapTopic],
+        skill_level: SkillLevel
+    ) -> Tuple[RoadmapTopic, ...]:
+        """Advanced learners see beginner topics last; others keep authored order"""
+        if skill_level != SkillLevel.ADVANCED:
+            return tuple(topics)
+        return tuple(sorted(topics, key=lambda topic: topic.difficulty == "beginner"))
+    
+    @staticmethod
+    def _index_terms(topics: Sequence[RoadmapTopic]) -> Dict[str, Tuple[int, ...]]:
+        index: Dict[str, List[int]] = {}
+        for position, topic in enumerate(topics):
+            terms: Set[str] = _terms(topic.topic_name)
+            for concept in topic.concepts:
+                terms |= _terms(concept)
+            for term in terms:
+                index.setdefault(term, []).append(position)
+        return {term: tuple(positions) for term, positions in index.items()}
+    
+    @staticmethod
+    def _build_roadmaps() -> Dict[DomainType, List[RoadmapTopic]]:
+        return {
+            DomainType.DSA: [
+                RoadmapTopic(
+                    topic_id="dsa_1",
+                    topic_name="Arrays and Strings",
+                    description="Master array manipulation, string operations, and two-pointer techniques",
+                    estimated_time="1-2 weeks",
+                    difficulty="beginner",
+                    priority=1,
+                    concepts=["array traversal", "string manipulation", "two pointers"],
+                    prerequisites=[]
+                ),
+                RoadmapTopic(
+                    topic_id="dsa_2",
+                    topic_name="Linked Lists",
+                    description="Understand node-based data structures and pointer manipulation",
+                    estimated_time="1 week",
+                    difficulty="intermediate",
+                    priority=2,
+                    concepts=["singly linked list", "doubly linked list", "circular list"],
+                    prerequisites=["dsa_1"]
+                ),
+                RoadmapTopic(
+                    topic_id="dsa_3",
+                    topic_name="Stacks and Queues",
+                    description="Learn LIFO and FIFO data structures with real-world applications",
+                    estimated_time="1 week",
+                    difficulty="intermediate",
+                    priority=3,
+                    concepts=["stack operations", "queue operations", "deque"],
+                    prerequisites=["dsa_1"]
+                )
+            ],
+            DomainType.WEB_DEV: [
+                RoadmapTopic(
+                    topic_id="web_1",
+                    topic_name="HTML & CSS Fundamentals",
+                    description="Build responsive layouts with modern HTML5 and CSS3",
+                    estimated_time="2 weeks",
+                    difficulty="beginner",
+                    priority=1,
+                    concepts=["semantic HTML", "flexbox", "grid", "responsive design"],
+                    prerequisites=[]
+                ),
+                RoadmapTopic(
+                    topic_id="web_2",
+                    topic_name="JavaScript Basics",
+                    description="Master JavaScript fundamentals and DOM manipulation",
+                    estimated_time="2-3 weeks",
+                    difficulty="intermediate",
+                    priority=2,
+                    concepts=["variables", "functions", "DOM", "events"],
+                    prerequisites=["web_1"]
+                )
+            ],
+            DomainType.AI_ML: [
+                RoadmapTopic(
+                    topic_id="ai_1",
+                    topic_name="Python for ML",
+                    description="Learn Python essentials and ML libraries",
+                    estimated_time="2 weeks",
+                    difficulty="beginner",
+                    priority=1,
+                    concepts=["numpy", "pandas", "matplotlib"],
+                    prerequisites=[]
+                ),
+                RoadmapTopic(
+                    topic_id="ai_2",
+                    topic_name="Linear Regression",
+                    description="Understand supervised learning with regression",
+                    estimated_time="1 week",
+                    difficulty="intermediate",
+                    priority=2,
+                    concepts=["gradient descent", "cost function", "predictions"],
+                    prerequisites=["ai_1"]
+                )
+            ]
+        }
+    
+    def _build_revision(self, concept: str) -> RevisionData:
+        return RevisionData(
+            concept=concept,
+            explanation=f"Detailed explanation of {concept} with simplified approach",
+            examples=[
+                f"Example 1: Basic {concept} application",
+                f"Example 2: Advanced {concept} use case"
+            ],
+            practice_problems=[
+                f"Practice problem 1 for {concept}",
+                f"Practice problem 2 for {concept}"
+            ],
+            resources=[
+                {"type": "video", "title": f"{concept} Tutorial", "url": "#"},
+                {"type": "article", "title": f"Understanding {concept}", "url": "#"}
+            ]
+        )
+    
+    def _build_module(self, topic: str, format_preference: str) -> LearningModule:
+        return LearningModule(
+            module_id=f"module_{topic.replace(' ', '_').lower()}",
+            title=f"Mastering {topic}",
+            tldr=f"A comprehensive guide to understanding {topic} with practical examples",
+            content_type=format_preference,
+            video_links=[
+                {"title": f"{topic} Introduction", "url": "https://youtube.com/watch?v=example", "duration": "15 min"}
+            ] if format_preference in ["video", "mixed"] else [],
+            text_content=f"""
+# Introduction to {topic}
+
+{topic} is a fundamental concept that every developer should master.
+
+## Key Points
+- Understanding the basics
+- Practical applications
+- Best practices
+
+## Deep Dive
+[Detailed explanation would go here]
+            """,
+            key_concepts=[f"{topic} fundamentals", f"{topic} applications", f"{topic} best practices"],
+            examples=[
+                f"Example 1: Basic {topic} implementation",
+                f"Example 2: Real-world {topic} use case",
+                f"Example 3: Advanced {topic} pattern"
+            ],
+            practice_exercises=[
+                f"Exercise 1: Implement {topic}",
+                f"Exercise 2: Optimize {topic}"
+            ],
+            additional_resources=[
+                {"type": "documentation", "title": f"Official {topic} Docs", "url": "#"}
+            ]
+        )
+
+
+fallback_catalog = FallbackCatalog()
@@ -0,0 +1,157 @@
+"""
+Background Job Queue
+In-process worker pool for generation work requested with ?async=true
+"""
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+import asyncio
+import heapq
+import time
+import uuid
+
+from app.core.log import get_logger
+from app.models.quiz_models import JobState
+
+
+logger = get_logger(__name__)
+
+
+class JobQueueFull(Exception):
+    """Raised when the queue already holds its maximum number of pending jobs"""
+
+
+@dataclass
+class Job:
+    """One unit of background work and its outcome"""
+    job_id: str
+    kind: str
+    factory: Callable[[], Awaitable[Any]] = field(repr=False)
+    state: JobState = JobState.QUEUED
+    created_at: float = field(default_factory=time.time)
+    finished_at: Optional[float] = None
+    result: Any = None
+    error: Optional[str] = None
+
+
+class JobQueue:
+    """
+    Bounded queue of background jobs served by a fixed pool of workers
+
+    Workers are asyncio tasks started on the first submit, on the running
+    event loop. At most max_pending jobs wait for a worker; finished jobs
+    are kept for ttl seconds so clients can poll them, then evicted.
+    """
+
+    def __init__(self, workers: int = 4, max_pending: int = 1000, ttl: float = 600.0):
+        self.worker_count = max(1, workers)
+        self.max_pending = max_pending
+        self.ttl = ttl
+
+        self._jobs: Dict[str, Job] = {}
+        # (expires_at, job_id) for finished jobs, earliest first
+        self._expiry: List[Tuple[float, str]] = []
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        self.submitted = 0
+        self.rejected = 0
+        self.succeeded = 0
+        self.failed = 0
+        self.evicted = 0
+
+    @property
+    def pending(self) -> int:
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def submit(self, kind: str, factory: Callable[[], Awaitable[Any]]) -> Job:
+        """Queue factory() for a worker and return its job record"""
+        self._ensure_workers()
+        self._evict_expired()
+        if self.pending >= self.max_pending:
+            self.rejected += 1
+            raise JobQueueFull(f"Job queue is full ({self.max_pending} pending)")
+
+        job = Job(job_id=uuid.uuid4().hex, kind=kind, factory=factory)
+        self._jobs[job.job_id] = job
+        self._queue.put_nowait(job)
+        self.submitted += 1
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Job by id, or None if unknown or already evicted"""
+        self._evict_expired()
+        return self._jobs.get(job_id)
+
+    def _ensure_workers(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._loop is loop and self._workers:
+            return
+        # First use, or the previous loop is gone (e.g. server reload)
+        self.close()
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._workers = [
+            loop.create_task(self._worker(self._queue)) for _ in range(self.worker_count)
+        ]
+
+    async def _worker(self, queue: asyncio.Queue) -> None:
+        while True:
+            job = await queue.get()
+            job.state = JobState.RUNNING
+            try:
+                job.result = await job.factory()
+                job.state = JobState.SUCCEEDED
+                self.succeeded += 1
+            except Exception as e:
+                job.state = JobState.FAILED
+                job.error = str(e)
+                self.failed += 1
+                logger.warning(
+                    "Background job failed",
+                    extra={"job_id": job.job_id, "kind": job.kind},
+                    exc_info=e
+                )
+            finally:
+                self._finish(job)
+                queue.task_done()
+
+    def _finish(self, job: Job) -> None:
+        job.finished_at = time.time()
+        job.factory = None
+        heapq.heappush(self._expiry, (time.monotonic() + self.ttl, job.job_id))
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        while self._expiry and self._expiry[0][0] <= now:
+            _, job_id = heapq.heappop(self._expiry)
+            if self._jobs.pop(job_id, None) is not None:
+                self.evicted += 1
+
+    def close(self) -> None:
+        """Cancel the workers; queued jobs are dropped"""
+        for worker in self._workers:
+            worker.cancel()
+        self._workers = []
+        for job in self._jobs.values():
+            if job.state in (JobState.QUEUED, JobState.RUNNING):
+                job.state = JobState.FAILED
+                job.error = "Job queue was shut down"
+                self._finish(job)
+        self._queue = None
+        self._loop = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue depth and job counters"""
+        return {
+            "workers": self.worker_count,
+            "pending": self.pending,
+            "max_pending": self.max_pending,
+            "retained": len(self._jobs),
+            "submitted": self.submitted,
+            "rejected": self.rejected,
+            "succeeded": self.succeeded,
+            "failed": self.failed,
+            "evicted": self.evicted
+        }
+
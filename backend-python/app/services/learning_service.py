@@ -2,7 +2,7 @@
 Learning Content Service
 Handles learning material generation and personalization
 """
-from typing import Dict, Any, List
+from typing import Dict, Any, List, AsyncIterator, Tuple
 
 from app.models.quiz_models import (
     LearningContentRequest,
@@ -12,19 +12,22 @@ from app.models.quiz_models import (
     SkillLevel
 )
 from app.services.adk_agent_service import ADKAgentService
+from app.services.registry import registry
 from app.core.config import settings
+from app.core.deadline import Deadline
 
 
 class LearningService:
     """Service for learning content generation"""
     
-    def __init__(self):
-        self.adk_service = ADKAgentService()
+    def __init__(self, adk_service: ADKAgentService = None):
+        self.adk_service = adk_service or registry.adk_service()
         self.adk_enabled = settings.ADK_ENABLED
     
     async def generate_learning_content(
         self,
-        request: LearningContentRequest
+        request: LearningContentRequest,
+        deadline: Deadline = None
     ) -> LearningContentResponse:
         """
         Generate personalized learning content
@@ -39,7 +42,8 @@ class LearningService:
             format_preference=request.format_preference or "mixed",
             weak_concepts=request.weak_concepts,
             user_id=request.user_id,
-            module_id=request.module_id
+            module_id=request.module_id,
+            deadline=deadline
         )
         
         # Estimate learning time
@@ -66,6 +70,48 @@ class LearningService:
             estimated_time=estimated_time
         )
     
+    async def stream_learning_content(
+        self,
+        request: LearningContentRequest
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Stream personalized learning content
+        
+        Forwards ("field", (name, value)) events as module fields complete,
+        then yields ("complete", LearningContentResponse) once the module is
+        validated and personalized.
+        """
+        events = self.adk_service.stream_learning_module(
+            domain=request.domain,
+            topic=request.topic,
+            skill_level=request.skill_level,
+            format_preference=request.format_preference or "mixed",
+            weak_concepts=request.weak_concepts,
+            user_id=request.user_id,
+            module_id=request.module_id
+        )
+        
+        async for event, payload in events:
+            if event != "module":
+                yield event, payload
+                continue
+            
+            module = payload
+            yield "complete", LearningContentResponse(
+                status="success",
+                message="Learning content generated successfully",
+                user_id=request.user_id,
+                domain=request.domain,
+                topic=request.topic,
+                module=module,
+                personalization_notes=self._generate_personalization_notes(request, module),
+                estimated_time=self._estimate_learning_time(
+                    module,
+                    request.skill_level,
+                    request.weak_concepts
+                )
+            )
+    
     def _estimate_learning_time(
         self,
         module: LearningModule,
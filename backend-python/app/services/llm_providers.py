@@ -0,0 +1,422 @@
+"""
+LLM Providers
+Interchangeable sources of LLM completions: Gemini, a local stub and record/replay
+"""
+from typing import Any, AsyncIterator, Dict, List, Optional
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+import asyncio
+import hashlib
+import json
+import math
+import os
+import queue
+import random
+import re
+import threading
+
+from app.core.config import settings
+from app.core.log import get_logger
+from app.services.prompt_templates import MODULE_SECTION_FIELDS, prompt_kind
+
+
+logger = get_logger(__name__)
+
+# Characters per chunk when a complete response is replayed as a stream
+STREAM_CHUNK_CHARS = 64
+
+
+@dataclass(frozen=True)
+class LLMResponse:
+    """A completion, or one chunk of a streamed completion"""
+    text: str
+
+
+async def _stream(text: str) -> AsyncIterator[LLMResponse]:
+    for start in range(0, len(text), STREAM_CHUNK_CHARS):
+        yield LLMResponse(text[start:start + STREAM_CHUNK_CHARS])
+
+
+class LLMProvider(ABC):
+    """
+    Source of completions, called like google.generativeai's GenerativeModel
+
+    generate_content_async returns an object with .text, or with
+    stream=True an async iterator of such chunks. Every provider implements
+    generate() for whole responses; unless generate_content_async is
+    overridden, streams replay that response in fixed-size chunks.
+    """
+
+    name = "base"
+
+    async def generate_content_async(
+        self,
+        prompt: str,
+        generation_config: Optional[Dict[str, Any]] = None,
+        stream: bool = False
+    ) -> Any:
+        text = await self.generate(prompt, generation_config or {})
+        return _stream(text) if stream else LLMResponse(text)
+
+    @abstractmethod
+    async def generate(self, prompt: str, generation_config: Dict[str, Any]) -> str:
+        """Complete response text for prompt"""
+
+    def stats(self) -> Dict[str, Any]:
+        return {"provider": self.name}
+
+    def close(self) -> None:
+        pass
+
+
+class GeminiProvider(LLMProvider):
+    """Google Gemini through google.generativeai"""
+
+    name = "gemini"
+
+    def __init__(self, api_key: str, model: str):
+        import google.generativeai as genai
+        genai.configure(api_key=api_key)
+        self.model = genai.GenerativeModel(model)
+
+    async def generate_content_async(
+        self,
+        prompt: str,
+        generation_config: Optional[Dict[str, Any]] = None,
+        stream: bool = False
+    ) -> Any:
+        return await self.model.generate_content_async(
+            prompt, generation_config=generation_config, stream=stream
+        )
+
+    async def generate(self, prompt: str, generation_config: Dict[str, Any]) -> str:
+        return (await self.model.generate_content_async(prompt, generation_config=generation_config)).text
+
+
+class StubProviderError(RuntimeError):
+    """Injected provider failure; code makes it look like an HTTP error"""
+
+    def __init__(self, code: int):
+        super().__init__(f"Stub provider error {code}")
+        self.code = code
+
+
+# Canned learning module, also split up for the section prompts
+STUB_MODULE = {
+    "title": "Stub Module",
+    "tldr": "Canned module from the stub LLM provider.",
+    "text_content": "Canned explanation from the stub LLM provider.",
+    "key_concepts": ["concept 1", "concept 2", "concept 3"],
+    "examples": ["example 1", "example 2", "example 3"],
+    "practice_exercises": ["exercise 1", "exercise 2"],
+    "video_links": [{"title": "Stub video", "url": "https://example.com/video", "duration": "10 min"}],
+    "additional_resources": [{"type": "article", "title": "Stub article", "url": "https://example.com/article"}]
+}
+
+STUB_RESPONSES: Dict[str, str] = {
+    "roadmap": json.dumps({"topics": [
+        {
+            "name": f"Stub Topic {i}",
+            "description": f"Canned topic {i} from the stub LLM provider",
+            "estimated_time": "1-2 weeks",
+            "difficulty": "beginner" if i < 3 else "intermediate",
+            "priority": i,
+            "concepts": [f"concept {i}"],
+            "prerequisites": []
+        }
+        for i in range(1, 6)
+    ]}),
+    "module": json.dumps(STUB_MODULE),
+    **{
+        f"module_{section}": json.dumps({name: STUB_MODULE[name] for name in fields})
+        for section, fields in MODULE_SECTION_FIELDS.items()
+    }
+}
+
+_WEAK_CONCEPTS = re.compile(r"^Weak concepts: (.*)$", re.MULTILINE)
+
+
+class StubProvider(LLMProvider):
+    """
+    Local provider with synthetic latency, injected errors and canned JSON
+
+    Latency is drawn per call from the named distribution with the given
+    mean and spread in milliseconds: "fixed", "uniform" (mean +/- jitter),
+    "normal" or "lognormal" (jitter as standard deviation). A fraction
+    error_rate of calls fails with StubProviderError(error_code), which the
+    outbound limiter retries like a real 429/5xx. Responses are chosen by
+    the prompt's template kind, from responses (kind -> text) or else the
+    built-in STUB_RESPONSES; built-in revision responses cover each
+    requested concept. Draws come from a seeded generator, so a run is
+    repeatable.
+    """
+
+    name = "stub"
+
+    def __init__(
+        self,
+        latency_ms: float = 200.0,
+        jitter_ms: float = 50.0,
+        distribution: str = "lognormal",
+        error_rate: float = 0.0,
+        error_code: int = 503,
+        responses: Optional[Dict[str, str]] = None,
+        seed: int = 0
+    ):
+        if distribution not in ("fixed", "uniform", "normal", "lognormal"):
+            raise ValueError(f"Unknown latency distribution: {distribution}")
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.distribution = distribution
+        self.error_rate = error_rate
+        self.error_code = error_code
+        self.responses = dict(responses or {})
+        self._random = random.Random(seed)
+        self.calls = 0
+        self.errors = 0
+
+    def latency(self) -> float:
+        """One latency draw, in seconds"""
+        mean, spread = self.latency_ms, self.jitter_ms
+        if self.distribution == "fixed" or spread <= 0 or mean <= 0:
+            ms = mean
+        elif self.distribution == "uniform":
+            ms = self._random.uniform(mean - spread, mean + spread)
+        elif self.distribution == "normal":
+            ms = self._random.gauss(mean, spread)
+        else:
+            sigma2 = math.log(1 + (spread / mean) ** 2)
+            ms = self._random.lognormvariate(math.log(mean) - sigma2 / 2, math.sqrt(sigma2))
+        return max(ms, 0.0) / 1000
+
+    def respond(self, prompt: str) -> str:
+        """Canned response for the template the prompt was rendered from"""
+        kind = prompt_kind(prompt)
+        if kind in self.responses:
+            return self.responses[kind]
+        if kind == "revision":
+            match = _WEAK_CONCEPTS.search(prompt)
+            concepts = [c for c in match.group(1).split(", ") if c] if match else []
+            return json.dumps({"revisions": [
+                {
+                    "concept": concept,
+                    "explanation": f"Canned explanation of {concept}",
+                    "examples": [f"{concept} example"],
+                    "practice_problems": [f"{concept} problem"],
+                    "resources": []
+                }
+                for concept in concepts
+            ]})
+        return STUB_RESPONSES.get(kind, "{}")
+
+    async def generate(self, prompt: str, generation_config: Dict[str, Any]) -> str:
+        self.calls += 1
+        delay = self.latency()
+        failed = self._random.random() < self.error_rate
+        await asyncio.sleep(delay)
+        if failed:
+            self.errors += 1
+            raise StubProviderError(self.error_code)
+        return self.respond(prompt)
+
+    def stats(self) -> Dict[str, Any]:
+        return {"provider": self.name, "calls": self.calls, "errors": self.errors}
+
+
+def recording_key(prompt: str, generation_config: Optional[Dict[str, Any]]) -> str:
+    """Identity of a call: the prompt together with its generation settings"""
+    digest = hashlib.sha256()
+    digest.update(json.dumps(generation_config or {}, sort_keys=True).encode("utf-8"))
+    digest.update(b"\x00")
+    digest.update(prompt.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class RecordingProvider(LLMProvider):
+    """
+    Pass-through to another provider that appends each response to a file
+
+    Every successful completion is written as one JSON line
+    {"key", "kind", "text"}; streamed completions are recorded once the
+    stream ends. Calls only enqueue the line: a background writer thread,
+    started on the first recording, appends queued lines in batches. The
+    file is what ReplayProvider serves once close() has drained the queue;
+    responses that finish after close() are appended directly.
+    """
+
+    _STOP = object()
+
+    def __init__(self, inner: LLMProvider, path: str):
+        self.inner = inner
+        self.path = path
+        self.name = f"{inner.name}+record"
+        self._queue: "queue.Queue" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self.recorded = 0
+
+    async def generate_content_async(
+        self,
+        prompt: str,
+        generation_config: Optional[Dict[str, Any]] = None,
+        stream: bool = False
+    ) -> Any:
+        if not stream:
+            return LLMResponse(await self.generate(prompt, generation_config or {}))
+        key = recording_key(prompt, generation_config)
+        chunks = await self.inner.generate_content_async(prompt, generation_config=generation_config, stream=True)
+        return self._recorded_stream(key, prompt, chunks)
+
+    async def generate(self, prompt: str, generation_config: Dict[str, Any]) -> str:
+        response = await self.inner.generate_content_async(prompt, generation_config=generation_config)
+        self._record(recording_key(prompt, generation_config), prompt, response.text)
+        return response.text
+
+    async def _recorded_stream(self, key: str, prompt: str, chunks: Any) -> AsyncIterator[Any]:
+        texts: List[str] = []
+        async for chunk in chunks:
+            texts.append(chunk.text)
+            yield chunk
+        self._record(key, prompt, "".join(texts))
+
+    def _record(self, key: str, prompt: str, text: str) -> None:
+        line = json.dumps({"key": key, "kind": prompt_kind(prompt), "text": text}) + "\n"
+        with self._lock:
+            if self._closed:
+                self._write([line])
+                return
+            self._queue.put(line)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="llm-recorder", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        running = True
+        while running:
+            lines = [self._queue.get()]
+            while True:
+                try:
+                    lines.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if lines[-1] is self._STOP:
+                lines.pop()
+                running = False
+            if lines:
+                self._write(lines)
+
+    def _write(self, lines: List[str]) -> None:
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write("".join(lines))
+        self.recorded += len(lines)
+
+    def close(self) -> None:
+        """Write everything still queued and stop the writer thread"""
+        with self._lock:
+            self._closed = True
+            if self._thread is not None:
+                self._queue.put(self._STOP)
+                self._thread.join(timeout=5.0)
+                self._thread = None
+        self.inner.close()
+
+    def stats(self) -> Dict[str, Any]:
+        return {**self.inner.stats(), "provider": self.name, "recorded": self.recorded}
+
+
+class ReplayMissError(LookupError):
+    """Raised for a call that has no recorded response"""
+
+
+class ReplayProvider(LLMProvider):
+    """
+    Serves responses captured by RecordingProvider, without latency
+
+    Calls are matched on prompt and generation settings; for a key
+    recorded more than once the latest response wins. An unrecorded call
+    raises ReplayMissError, which callers treat like any provider failure.
+    """
+
+    name = "replay"
+
+    def __init__(self, path: str):
+        self.path = path
+        self._responses: Dict[str, str] = {}
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    self._responses[entry["key"]] = entry["text"]
+        self.hits = 0
+        self.misses = 0
+
+    async def generate(self, prompt: str, generation_config: Dict[str, Any]) -> str:
+        text = self._responses.get(recording_key(prompt, generation_config))
+        if text is None:
+            self.misses += 1
+            raise ReplayMissError(f"No recorded response for {prompt_kind(prompt) or 'unknown'} prompt")
+        self.hits += 1
+        return text
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "provider": self.name,
+            "recorded": len(self._responses),
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
+def _stub_from_settings() -> StubProvider:
+    responses = None
+    if settings.LLM_STUB_RESPONSES_PATH:
+        with open(settings.LLM_STUB_RESPONSES_PATH, encoding="utf-8") as f:
+            responses = {
+                kind: value if isinstance(value, str) else json.dumps(value)
+                for kind, value in json.load(f).items()
+            }
+    return StubProvider(
+        latency_ms=settings.LLM_STUB_LATENCY_MS,
+        jitter_ms=settings.LLM_STUB_LATENCY_JITTER_MS,
+        distribution=settings.LLM_STUB_LATENCY_DIST,
+        error_rate=settings.LLM_STUB_ERROR_RATE,
+        error_code=settings.LLM_STUB_ERROR_CODE,
+        responses=responses,
+        seed=settings.LLM_STUB_SEED
+    )
+
+
+def create_provider(kind: str) -> Optional[LLMProvider]:
+    """
+    Provider named by LLM_PROVIDER, wrapped for recording if LLM_RECORD_PATH is set
+
+    Gemini needs ADK_ENABLED, GEMINI_API_KEY and google-generativeai;
+    without them None is returned and callers serve mock content.
+    """
+    if kind == "gemini":
+        if not (settings.ADK_ENABLED and settings.GEMINI_API_KEY):
+            logger.debug("ADK client not initialized (missing key or disabled)")
+            return None
+        try:
+            provider: LLMProvider = GeminiProvider(settings.GEMINI_API_KEY, settings.DEFAULT_MODEL)
+        except ImportError:
+            logger.error("Google Generative AI package not installed. ADK features limited.")
+            return None
+        except Exception as e:
+            logger.error("Error initializing ADK client", exc_info=e)
+            return None
+    elif kind == "stub":
+        provider = _stub_from_settings()
+    elif kind == "replay":
+        if not os.path.exists(settings.LLM_REPLAY_PATH):
+            logger.error("LLM replay file not found", extra={"path": settings.LLM_REPLAY_PATH})
+            return None
+        return ReplayProvider(settings.LLM_REPLAY_PATH)
+    else:
+        raise ValueError(f"Unknown LLM provider: {kind}")
+
+    logger.debug("LLM provider initialized", extra={"provider": provider.name, "model": settings.DEFAULT_MODEL})
+    if settings.LLM_RECORD_PATH:
+        return RecordingProvider(provider, settings.LLM_RECORD_PATH)
+    return provider
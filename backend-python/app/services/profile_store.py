@@ -0,0 +1,236 @@
+"""
+Learner Profile Store
+Cumulative per-learner, per-concept mastery across quiz submissions
+"""
+from typing import Any, Dict, List, Optional
+from collections import OrderedDict
+from dataclasses import dataclass, field
+import math
+import sqlite3
+import threading
+import time
+
+from app.services.quiz_stats import QuizStats
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS learner_profiles (
+    user_id TEXT PRIMARY KEY,
+    quiz_count INTEGER NOT NULL DEFAULT 0,
+    updated_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS learner_concepts (
+    user_id TEXT NOT NULL,
+    concept TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    correct INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (user_id, concept)
+);
+CREATE TABLE IF NOT EXISTS learner_baselines (
+    user_id TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    mean REAL NOT NULL,
+    m2 REAL NOT NULL,
+    min REAL NOT NULL,
+    max REAL NOT NULL,
+    PRIMARY KEY (user_id, metric)
+);
+"""
+
+# LearnerProfile attributes persisted in learner_baselines
+_BASELINE_METRICS = ("time_per_question", "option_changes")
+
+
+@dataclass
+class RunningStats:
+    """
+    Streaming count / mean / M2 / min / max over every value ever added
+
+    A submission is folded in as a whole from its own count, mean and
+    standard deviation (Chan et al.'s pairwise form of Welford's update),
+    so each update is O(1) regardless of history or quiz length.
+    """
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+    min: float = 0.0
+    max: float = 0.0
+
+    @property
+    def stdev(self) -> float:
+        return math.sqrt(self.m2 / (self.count - 1)) if self.count > 1 else 0.0
+
+    def merge(self, count: int, mean: float, stdev: float, minimum: float, maximum: float) -> None:
+        """Fold in a sample of count values with the given summary statistics"""
+        if count <= 0:
+            return
+        m2 = stdev * stdev * (count - 1)
+        if self.count == 0:
+            self.count, self.mean, self.m2, self.min, self.max = count, mean, m2, minimum, maximum
+            return
+
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.min = min(self.min, minimum)
+        self.max = max(self.max, maximum)
+        self.count = total
+
+
+@dataclass
+class LearnerProfile:
+    """Running totals for one learner, updated once per submission"""
+    user_id: str
+    quiz_count: int = 0
+    # concept -> [attempts, correct] over every recorded submission
+    concept_tallies: Dict[str, List[int]] = field(default_factory=dict)
+    # Per-question baselines over every recorded submission
+    time_per_question: RunningStats = field(default_factory=RunningStats)
+    option_changes: RunningStats = field(default_factory=RunningStats)
+
+    def mastery(self, concept: str) -> Optional[float]:
+        """Cumulative accuracy on a concept, or None if never attempted"""
+        tally = self.concept_tallies.get(concept)
+        if not tally or not tally[0]:
+            return None
+        return tally[1] / tally[0]
+
+    def add(self, stats: QuizStats) -> None:
+        """Fold one submission in; O(concepts in the quiz)"""
+        self.quiz_count += 1
+        for concept, (attempts, correct) in stats.concept_tallies.items():
+            tally = self.concept_tallies.get(concept)
+            if tally is None:
+                tally = self.concept_tallies[concept] = [0, 0]
+            tally[0] += attempts
+            tally[1] += correct
+
+        self.time_per_question.merge(
+            stats.question_count, stats.average_time, stats.time_stdev,
+            stats.min_time, stats.max_time
+        )
+        self.option_changes.merge(
+            stats.option_change_count, stats.average_option_changes, stats.option_change_stdev,
+            stats.min_option_changes, stats.max_option_changes
+        )
+
+
+class ProfileStore:
+    """
+    Learner profiles in an LRU memory tier over an embedded SQLite file
+
+    Reads are served from memory once a profile has been loaded. Each
+    submission updates the in-memory profile and upserts only the concepts
+    it touched, so recording is O(concepts) and history is never re-read.
+    """
+
+    def __init__(self, path: str = ":memory:", cache_size: int = 10000):
+        self.path = path
+        self.cache_size = cache_size
+        self._profiles: "OrderedDict[str, LearnerProfile]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+        self.hits = 0
+        self.loads = 0
+
+    def get(self, user_id: str) -> LearnerProfile:
+        """Profile for user_id; an empty profile for unknown learners"""
+        with self._lock:
+            profile = self._profiles.get(user_id)
+            if profile is not None:
+                self._profiles.move_to_end(user_id)
+                self.hits += 1
+                return profile
+
+            profile = self._load(user_id)
+            self.loads += 1
+            self._profiles[user_id] = profile
+            while len(self._profiles) > self.cache_size:
+                self._profiles.popitem(last=False)
+            return profile
+
+    def record(self, user_id: str, stats: QuizStats) -> LearnerProfile:
+        """Add one submission to the learner's profile and persist the change"""
+        now = time.time()
+        with self._lock:
+            profile = self.get(user_id)
+            profile.add(stats)
+            self._conn.execute(
+                "INSERT INTO learner_profiles (user_id, quiz_count, updated_at) VALUES (?, 1, ?) "
+                "ON CONFLICT(user_id) DO UPDATE SET "
+                "quiz_count = quiz_count + 1, updated_at = excluded.updated_at",
+                (user_id, now)
+            )
+            if stats.concept_tallies:
+                self._conn.executemany(
+                    "INSERT INTO learner_concepts (user_id, concept, attempts, correct) VALUES (?, ?, ?, ?) "
+                    "ON CONFLICT(user_id, concept) DO UPDATE SET "
+                    "attempts = attempts + excluded.attempts, correct = correct + excluded.correct",
+                    [
+                        (user_id, concept, attempts, correct)
+                        for concept, (attempts, correct) in stats.concept_tallies.items()
+                    ]
+                )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO learner_baselines "
+                "(user_id, metric, count, mean, m2, min, max) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (user_id, metric, acc.count, acc.mean, acc.m2, acc.min, acc.max)
+                    for metric in _BASELINE_METRICS
+                    for acc in (getattr(profile, metric),)
+                    if acc.count
+                ]
+            )
+            self._conn.commit()
+            return profile
+
+    def _load(self, user_id: str) -> LearnerProfile:
+        profile = LearnerProfile(user_id=user_id)
+        row = self._conn.execute(
+            "SELECT quiz_count FROM learner_profiles WHERE user_id = ?", (user_id,)
+        ).fetchone()
+        if row is None:
+            return profile
+        profile.quiz_count = row[0]
+        for concept, attempts, correct in self._conn.execute(
+            "SELECT concept, attempts, correct FROM learner_concepts WHERE user_id = ?", (user_id,)
+        ):
+            profile.concept_tallies[concept] = [attempts, correct]
+        for metric, count, mean, m2, minimum, maximum in self._conn.execute(
+            "SELECT metric, count, mean, m2, min, max FROM learner_baselines WHERE user_id = ?",
+            (user_id,)
+        ):
+            if metric in _BASELINE_METRICS:
+                setattr(profile, metric, RunningStats(count, mean, m2, minimum, maximum))
+        return profile
+
+    def clear(self) -> None:
+        """Delete every profile, in memory and on disk"""
+        with self._lock:
+            self._profiles.clear()
+            self._conn.execute("DELETE FROM learner_profiles")
+            self._conn.execute("DELETE FROM learner_concepts")
+            self._conn.execute("DELETE FROM learner_baselines")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._profiles.clear()
+            self._conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Memory tier size and hit counters"""
+        return {
+            "cached_profiles": len(self._profiles),
+            "cache_size": self.cache_size,
+            "hits": self.hits,
+            "loads": self.loads
+        }
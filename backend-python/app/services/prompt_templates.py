@@ -0,0 +1,352 @@
+"""
+Prompt Templates
+Precompiled LLM prompts: a static, cacheable prefix followed by a small per-request body
+"""
+from typing import Any, Dict, Iterable, List, Optional
+from dataclasses import dataclass
+import math
+import threading
+
+from app.core.config import settings
+
+
+# Rough size of a token in characters for English prose and JSON
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of text (about 4 characters per token)"""
+    return math.ceil(len(text) / CHARS_PER_TOKEN)
+
+
+def cap_concepts(concepts: Optional[Iterable[str]], limit: int) -> List[str]:
+    """Concepts stripped, de-duplicated case-insensitively in first-seen order, at most limit"""
+    capped: List[str] = []
+    seen = set()
+    for concept in concepts or ():
+        concept = concept.strip()
+        folded = concept.casefold()
+        if not concept or folded in seen:
+            continue
+        seen.add(folded)
+        capped.append(concept)
+        if len(capped) >= limit:
+            break
+    return capped
+
+
+@dataclass(frozen=True)
+class CompiledPrompt:
+    """A rendered prompt; prefix is identical for every request of its template"""
+    kind: str
+    prefix: str
+    body: str
+
+    @property
+    def text(self) -> str:
+        return f"{self.prefix}\n\n{self.body}"
+
+    @property
+    def estimated_tokens(self) -> int:
+        return estimate_tokens(self.prefix) + estimate_tokens(self.body) + 1
+
+
+class PromptTemplate:
+    """
+    Static instructions and output schema, joined once at import
+
+    Every prompt of a template starts with the same prefix (system role,
+    requirements, JSON shape), so providers that cache prompt prefixes
+    can reuse it across requests; only the short body is rendered per call.
+    """
+
+    def __init__(self, kind: str, system: str, instructions: str, schema: str, body: str):
+        self.kind = kind
+        self.prefix = (
+            f"{system}\n\n{instructions}\n\n"
+            f"Return ONLY valid JSON, no markdown formatting, with this structure:\n{schema}"
+        )
+        self.prefix_tokens = estimate_tokens(self.prefix)
+        self.body = body
+
+    def render(self, **fields: Any) -> CompiledPrompt:
+        prompt = CompiledPrompt(self.kind, self.prefix, self.body.format_map(fields).strip())
+        prompt_metrics.record(prompt)
+        return prompt
+
+
+class PromptMetrics:
+    """Estimated input tokens per prompt kind"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._kinds: Dict[str, Dict[str, int]] = {}
+
+    def record(self, prompt: CompiledPrompt) -> None:
+        tokens = prompt.estimated_tokens
+        with self._lock:
+            kind = self._kinds.setdefault(prompt.kind, {"prompts": 0, "total_tokens": 0, "max_tokens": 0})
+            kind["prompts"] += 1
+            kind["total_tokens"] += tokens
+            kind["max_tokens"] = max(kind["max_tokens"], tokens)
+
+    def reset(self) -> None:
+        with self._lock:
+            self._kinds.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Prompt count and average/max estimated tokens per kind"""
+        with self._lock:
+            return {
+                kind: {
+                    "prompts": counts["prompts"],
+                    "average_tokens": round(counts["total_tokens"] / counts["prompts"], 1),
+                    "max_tokens": counts["max_tokens"]
+                }
+                for kind, counts in self._kinds.items()
+            }
+
+
+prompt_metrics = PromptMetrics()
+
+
+ROADMAP_PROMPT = PromptTemplate(
+    kind="roadmap",
+    system=(
+        "You are an expert educational content designer specializing in personalized "
+        "learning paths. Generate structured, detailed roadmaps in JSON format."
+    ),
+    instructions=(
+        "Requirements:\n"
+        "1. Create 5-8 topics tailored to the learner's level and gaps\n"
+        "2. Prioritize weak areas while building on strengths\n"
+        "3. Include clear learning objectives and prerequisites\n"
+        "4. Estimate realistic time commitments\n"
+        "5. Structure for progressive difficulty"
+    ),
+    schema=(
+        '{"topics":[{"name":"Topic Name","description":"Detailed description",'
+        '"estimated_time":"1-2 weeks","difficulty":"beginner/intermediate/advanced",'
+        '"priority":1,"concepts":["concept1"],"prerequisites":["prerequisite1"]}]}'
+    ),
+    body=(
+        "Generate a personalized learning roadmap for a {skill_level} learner in {domain}.\n"
+        "Proficiency: {proficiency:.2f}/1.0\n"
+        "Strengths: {strengths}\n"
+        "Weaknesses: {weaknesses}\n"
+        "{behavior}"
+    )
+)
+
+REVISION_PROMPT = PromptTemplate(
+    kind="revision",
+    system=(
+        "You are an expert tutor creating targeted revision materials. Provide clear "
+        "explanations, examples, and practice problems in JSON format."
+    ),
+    instructions=(
+        "For each concept, provide:\n"
+        "1. Clear, simplified explanation\n"
+        "2. 2-3 practical examples\n"
+        "3. 2-3 practice problems with hints\n"
+        "4. Recommended resources (videos, articles)"
+    ),
+    schema=(
+        '{"revisions":[{"concept":"Concept Name","explanation":"Clear explanation",'
+        '"examples":["example1"],"practice_problems":["problem1"],'
+        '"resources":[{"type":"video","title":"...","url":"..."}]}]}'
+    ),
+    body=(
+        "Create revision materials for these {domain} concepts the learner needs to improve.\n"
+        "Weak concepts: {concepts}\n"
+        "Module: {module_id}"
+    )
+)
+
+MODULE_SYSTEM = (
+    "You are an expert content creator for educational platforms. Create comprehensive, "
+    "engaging learning modules in JSON format."
+)
+
+MODULE_BODY = (
+    "Create a learning module on {topic} in {domain}.\n"
+    "Learner level: {skill_level}\n"
+    "Format preference: {format_preference}\n"
+    "{focus}"
+)
+
+MODULE_PROMPT = PromptTemplate(
+    kind="module",
+    system=MODULE_SYSTEM,
+    instructions=(
+        "Include:\n"
+        "1. Engaging title and TL;DR summary (2-3 sentences)\n"
+        "2. Core content (text explanation)\n"
+        "3. Key concepts list\n"
+        "4. 3-5 practical examples\n"
+        "5. Practice exercises\n"
+        "6. Video recommendations (if applicable)\n"
+        "7. Additional resources"
+    ),
+    schema=(
+        '{"title":"Module Title","tldr":"Brief summary","text_content":"Comprehensive explanation",'
+        '"key_concepts":["concept1"],"examples":["example1"],"practice_exercises":["exercise1"],'
+        '"video_links":[{"title":"Video Title","url":"YouTube URL","duration":"10 min"}],'
+        '"additional_resources":[{"type":"article","title":"...","url":"..."}]}'
+    ),
+    body=MODULE_BODY
+)
+
+# LearningModule fields produced by each section of a sectioned module
+MODULE_SECTION_FIELDS = {
+    "overview": ("title", "tldr", "key_concepts"),
+    "content": ("text_content",),
+    "practice": ("examples", "practice_exercises"),
+    "media": ("video_links", "additional_resources")
+}
+
+# One independent prompt per section; together they cover MODULE_PROMPT
+MODULE_SECTION_PROMPTS = {
+    "overview": PromptTemplate(
+        kind="module_overview",
+        system=MODULE_SYSTEM,
+        instructions=(
+            "Write only the module overview:\n"
+            "1. Engaging title\n"
+            "2. TL;DR summary (2-3 sentences)\n"
+            "3. Key concepts list"
+        ),
+        schema='{"title":"Module Title","tldr":"Brief summary","key_concepts":["concept1"]}',
+        body=MODULE_BODY
+    ),
+    "content": PromptTemplate(
+        kind="module_content",
+        system=MODULE_SYSTEM,
+        instructions=(
+            "Write only the core content: a comprehensive text explanation of the topic "
+            "for the learner's level, covering the focus areas"
+        ),
+        schema='{"text_content":"Comprehensive explanation"}',
+        body=MODULE_BODY
+    ),
+    "practice": PromptTemplate(
+        kind="module_practice",
+        system=MODULE_SYSTEM,
+        instructions=(
+            "Write only the learning aids:\n"
+            "1. 3-5 practical examples\n"
+            "2. Practice exercises"
+        ),
+        schema='{"examples":["example1"],"practice_exercises":["exercise1"]}',
+        body=MODULE_BODY
+    ),
+    "media": PromptTemplate(
+        kind="module_media",
+        system=MODULE_SYSTEM,
+        instructions=(
+            "Recommend only external material:\n"
+            "1. Videos (if applicable)\n"
+            "2. Additional resources"
+        ),
+        schema=(
+            '{"video_links":[{"title":"Video Title","url":"YouTube URL","duration":"10 min"}],'
+            '"additional_resources":[{"type":"article","title":"...","url":"..."}]}'
+        ),
+        body=MODULE_BODY
+    )
+}
+
+# Every template by kind, for recognising which template a prompt came from
+PROMPT_TEMPLATES = {
+    template.kind: template
+    for template in (ROADMAP_PROMPT, REVISION_PROMPT, MODULE_PROMPT, *MODULE_SECTION_PROMPTS.values())
+}
+
+
+def prompt_kind(text: str) -> Optional[str]:
+    """Kind of the template a prompt was rendered from; None if it matches none"""
+    for kind, template in PROMPT_TEMPLATES.items():
+        if text.startswith(template.prefix):
+            return kind
+    return None
+
+
+# Behavioral profile entries that shape a roadmap, with their prompt labels
+ROADMAP_BEHAVIOR_FIELDS = (
+    ("overall_behavior_profile", "Learning style"),
+    ("decision_pattern", "Decision pattern"),
+    ("time_management", "Time management")
+)
+
+
+def roadmap_prompt(
+    domain: str,
+    skill_level: str,
+    proficiency_score: float,
+    strengths: List[str],
+    weaknesses: List[str],
+    behavioral_profile: Dict[str, Any]
+) -> CompiledPrompt:
+    limit = settings.PROMPT_MAX_CONCEPTS
+    behavior = "\n".join(
+        f"{label}: {behavioral_profile[name]}"
+        for name, label in ROADMAP_BEHAVIOR_FIELDS
+        if behavioral_profile.get(name)
+    )
+    return ROADMAP_PROMPT.render(
+        domain=domain,
+        skill_level=skill_level,
+        proficiency=proficiency_score,
+        strengths=", ".join(cap_concepts(strengths, limit)) or "None identified",
+        weaknesses=", ".join(cap_concepts(weaknesses, limit)) or "None identified",
+        behavior=behavior
+    )
+
+
+def revision_prompt(domain: str, weak_concepts: List[str], module_id: Optional[str]) -> CompiledPrompt:
+    return REVISION_PROMPT.render(
+        domain=domain,
+        concepts=", ".join(cap_concepts(weak_concepts, settings.PROMPT_MAX_CONCEPTS)),
+        module_id=module_id or "general"
+    )
+
+
+def _module_fields(
+    domain: str,
+    topic: str,
+    skill_level: str,
+    format_preference: str,
+    weak_concepts: List[str]
+) -> Dict[str, Any]:
+    focus = cap_concepts(weak_concepts, settings.PROMPT_MAX_CONCEPTS)
+    return dict(
+        domain=domain,
+        topic=topic,
+        skill_level=skill_level,
+        format_preference=format_preference,
+        focus=f"Focus areas: {', '.join(focus)}" if focus else ""
+    )
+
+
+def module_prompt(
+    domain: str,
+    topic: str,
+    skill_level: str,
+    format_preference: str,
+    weak_concepts: List[str]
+) -> CompiledPrompt:
+    return MODULE_PROMPT.render(
+        **_module_fields(domain, topic, skill_level, format_preference, weak_concepts)
+    )
+
+
+def module_section_prompts(
+    domain: str,
+    topic: str,
+    skill_level: str,
+    format_preference: str,
+    weak_concepts: List[str]
+) -> Dict[str, CompiledPrompt]:
+    """One prompt per module section, keyed like MODULE_SECTION_FIELDS"""
+    fields = _module_fields(domain, topic, skill_level, format_preference, weak_concepts)
+    return {section: template.render(**fields) for section, template in MODULE_SECTION_PROMPTS.items()}
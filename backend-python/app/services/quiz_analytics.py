@@ -0,0 +1,364 @@
+"""
+Quiz Analytics Aggregator
+Merges quiz submissions per quiz_analytics row in memory and flushes them as bulk upserts
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import json
+import sqlite3
+import threading
+import time
+
+from app.core.log import get_logger
+
+
+logger = get_logger(__name__)
+
+# (user_id, module, quiz_type): the unique key of quiz_analytics
+AnalyticsKey = Tuple[str, str, str]
+
+_COLUMNS = (
+    "user_id", "module", "quiz_type", "domain", "course", "average_score", "total_attempts",
+    "average_time_taken", "concepts_covered", "recommended_format", "passed",
+    "first_attempted_at", "last_attempted_at", "updated_at"
+)
+
+# Running averages are re-weighted by attempts, so merging a flushed delta
+# into an existing row gives the same result as applying its submissions
+# one at a time. 1.0 * keeps the division fractional on Postgres.
+_UPSERT_SUFFIX = """
+ON CONFLICT (user_id, module, quiz_type) DO UPDATE SET
+    domain = excluded.domain,
+    course = COALESCE(excluded.course, quiz_analytics.course),
+    average_score = 1.0 * (
+        quiz_analytics.average_score * quiz_analytics.total_attempts
+        + excluded.average_score * excluded.total_attempts
+    ) / (quiz_analytics.total_attempts + excluded.total_attempts),
+    average_time_taken = CAST(ROUND(1.0 * (
+        quiz_analytics.average_time_taken * quiz_analytics.total_attempts
+        + excluded.average_time_taken * excluded.total_attempts
+    ) / (quiz_analytics.total_attempts + excluded.total_attempts)) AS INTEGER),
+    total_attempts = quiz_analytics.total_attempts + excluded.total_attempts,
+    concepts_covered = excluded.concepts_covered,
+    recommended_format = COALESCE(excluded.recommended_format, quiz_analytics.recommended_format),
+    passed = excluded.passed,
+    last_attempted_at = excluded.last_attempted_at,
+    updated_at = excluded.updated_at
+"""
+
+# Stand-in for the quiz_analytics table of backend/db/analyticsSchema.sql
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS quiz_analytics (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    user_id TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    course TEXT,
+    module TEXT NOT NULL,
+    quiz_type TEXT NOT NULL,
+    average_score REAL DEFAULT 0,
+    total_attempts INTEGER DEFAULT 0,
+    average_time_taken INTEGER DEFAULT 0,
+    concepts_covered TEXT DEFAULT '[]',
+    recommended_format TEXT,
+    passed INTEGER DEFAULT 0,
+    first_attempted_at TEXT,
+    last_attempted_at TEXT,
+    created_at TEXT DEFAULT CURRENT_TIMESTAMP,
+    updated_at TEXT,
+    UNIQUE (user_id, module, quiz_type)
+)
+"""
+
+
+@dataclass
+class AnalyticsDelta:
+    """Submissions for one quiz_analytics row that have not been flushed yet"""
+    domain: str
+    course: Optional[str]
+    attempts: int = 0
+    score_sum: float = 0.0
+    time_sum: float = 0.0
+    concepts: List[str] = field(default_factory=list)
+    recommended_format: Optional[str] = None
+    passed: bool = False
+    first_at: float = 0.0
+    last_at: float = 0.0
+
+    def merge(self, newer: "AnalyticsDelta") -> None:
+        """Fold in a later delta for the same row; latest-wins fields come from it"""
+        self.attempts += newer.attempts
+        self.score_sum += newer.score_sum
+        self.time_sum += newer.time_sum
+        self.first_at = min(self.first_at, newer.first_at)
+        self.last_at = max(self.last_at, newer.last_at)
+        self.domain = newer.domain
+        self.course = newer.course or self.course
+        self.concepts = newer.concepts
+        self.recommended_format = newer.recommended_format or self.recommended_format
+        self.passed = newer.passed
+
+
+def delta_from_event(event: Dict[str, Any]) -> Tuple[AnalyticsKey, AnalyticsDelta]:
+    """Row key and one-submission delta for a quiz completion event"""
+    at = datetime.fromisoformat(event["timestamp"]).timestamp()
+    if event["event_type"] == "diagnostic_quiz_completed":
+        key = (event["user_id"], "diagnostic", "diagnostic")
+        concepts = event["concepts_covered"]
+        passed = False
+    else:
+        key = (event["user_id"], event["module"], "module")
+        concepts = event["concepts_tested"]
+        passed = event["passed"]
+    return key, AnalyticsDelta(
+        domain=event["domain"],
+        course=event.get("course"),
+        attempts=1,
+        score_sum=float(event["score"]),
+        time_sum=float(event["total_time_seconds"]),
+        concepts=list(concepts),
+        recommended_format=event.get("recommended_format"),
+        passed=passed,
+        first_at=at,
+        last_at=at
+    )
+
+
+class AnalyticsBackend(ABC):
+    """Bulk upsert target for quiz_analytics rows"""
+
+    # Rows per INSERT statement
+    chunk_size = 500
+
+    @abstractmethod
+    def upsert(self, deltas: Dict[AnalyticsKey, AnalyticsDelta]) -> None:
+        """Merge the deltas into their quiz_analytics rows"""
+
+    def close(self) -> None:
+        pass
+
+    def _rows(self, deltas: Dict[AnalyticsKey, AnalyticsDelta]) -> List[Tuple[Any, ...]]:
+        now = time.time()
+        return [
+            (
+                user_id, module, quiz_type, delta.domain, delta.course,
+                delta.score_sum / delta.attempts, delta.attempts,
+                round(delta.time_sum / delta.attempts),
+                self._concepts(delta.concepts), delta.recommended_format, delta.passed,
+                self._timestamp(delta.first_at), self._timestamp(delta.last_at), self._timestamp(now)
+            )
+            for (user_id, module, quiz_type), delta in deltas.items()
+        ]
+
+    def _statement(self, row_count: int, placeholder: str) -> str:
+        row = "(" + ", ".join([placeholder] * len(_COLUMNS)) + ")"
+        return (
+            f"INSERT INTO quiz_analytics ({', '.join(_COLUMNS)}) VALUES "
+            + ", ".join([row] * row_count)
+            + _UPSERT_SUFFIX
+        )
+
+    def _chunks(self, rows: Sequence[Tuple[Any, ...]]) -> List[Sequence[Tuple[Any, ...]]]:
+        return [rows[i:i + self.chunk_size] for i in range(0, len(rows), self.chunk_size)]
+
+    def _concepts(self, concepts: List[str]) -> Any:
+        return concepts
+
+    def _timestamp(self, at: float) -> Any:
+        return datetime.fromtimestamp(at, tz=timezone.utc)
+
+
+class SQLiteAnalyticsBackend(AnalyticsBackend):
+    """Local stand-in for the analytics database, over one shared connection"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute(_SQLITE_SCHEMA)
+        self._conn.commit()
+        self._lock = threading.Lock()
+
+    def upsert(self, deltas: Dict[AnalyticsKey, AnalyticsDelta]) -> None:
+        rows = self._rows(deltas)
+        with self._lock:
+            try:
+                for chunk in self._chunks(rows):
+                    self._conn.execute(
+                        self._statement(len(chunk), "?"),
+                        [value for row in chunk for value in row]
+                    )
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+
+    def fetch(self, user_id: str, module: str, quiz_type: str) -> Optional[Dict[str, Any]]:
+        """One row as a dict, or None"""
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT * FROM quiz_analytics WHERE user_id = ? AND module = ? AND quiz_type = ?",
+                (user_id, module, quiz_type)
+            )
+            row = cursor.fetchone()
+            if row is None:
+                return None
+            record = dict(zip([c[0] for c in cursor.description], row))
+        record["concepts_covered"] = json.loads(record["concepts_covered"])
+        record["passed"] = bool(record["passed"])
+        return record
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _concepts(self, concepts: List[str]) -> Any:
+        return json.dumps(concepts)
+
+    def _timestamp(self, at: float) -> Any:
+        return datetime.fromtimestamp(at, tz=timezone.utc).isoformat()
+
+
+class PostgresAnalyticsBackend(AnalyticsBackend):
+    """The analytics Postgres database, through a psycopg connection pool"""
+
+    def __init__(self, dsn: str, pool_size: int = 4):
+        from psycopg_pool import ConnectionPool
+
+        self.pool = ConnectionPool(dsn, min_size=1, max_size=pool_size, open=True)
+
+    def upsert(self, deltas: Dict[AnalyticsKey, AnalyticsDelta]) -> None:
+        rows = self._rows(deltas)
+        with self.pool.connection() as conn:
+            with conn.transaction():
+                for chunk in self._chunks(rows):
+                    conn.execute(
+                        self._statement(len(chunk), "%s"),
+                        [value for row in chunk for value in row]
+                    )
+
+    def close(self) -> None:
+        self.pool.close()
+
+
+def create_backend(url: str, pool_size: int = 4) -> AnalyticsBackend:
+    """Backend for ANALYTICS_DB_URL: sqlite:///<path> or postgresql://..."""
+    if url.startswith("sqlite:///"):
+        return SQLiteAnalyticsBackend(url[len("sqlite:///"):])
+    if url.startswith(("postgres://", "postgresql://")):
+        return PostgresAnalyticsBackend(url, pool_size=pool_size)
+    raise ValueError(f"Unsupported analytics database URL: {url}")
+
+
+class QuizAnalyticsAggregator:
+    """
+    Write-behind buffer for quiz_analytics
+
+    record() merges a submission into the pending delta for its
+    (user, module, quiz_type) row; nothing touches the database. A flusher
+    thread writes all pending rows as multi-row upserts every
+    flush_interval seconds, or early once max_pending rows are waiting, so
+    round trips scale with flushes rather than submissions. A failed flush
+    merges its rows back into the buffer for the next attempt.
+    """
+
+    def __init__(
+        self,
+        backend: AnalyticsBackend,
+        flush_interval: float = 5.0,
+        max_pending: int = 5000
+    ):
+        self.backend = backend
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._pending: Dict[AnalyticsKey, AnalyticsDelta] = {}
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread: Optional[threading.Thread] = None
+
+        self.recorded = 0
+        self.flushed_rows = 0
+        self.flushes = 0
+        self.failures = 0
+
+    def record(self, event: Dict[str, Any]) -> None:
+        """Merge a diagnostic or module quiz completion event into the buffer"""
+        key, delta = delta_from_event(event)
+        with self._lock:
+            pending = self._pending.get(key)
+            if pending is None:
+                self._pending[key] = delta
+            else:
+                pending.merge(delta)
+            self.recorded += 1
+            full = len(self._pending) >= self.max_pending
+        self.start()
+        if full:
+            self._wake.set()
+
+    def start(self) -> None:
+        """Start the flusher thread if it is not running"""
+        if self._thread is not None or self._stopping:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="quiz-analytics", daemon=True)
+                self._thread.start()
+
+    def flush(self) -> int:
+        """Upsert every pending row; returns the number of rows written"""
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+            if not batch:
+                return 0
+
+            try:
+                self.backend.upsert(batch)
+            except Exception as e:
+                self.failures += 1
+                logger.warning(
+                    "quiz_analytics flush failed; rows kept for retry",
+                    extra={"rows": len(batch), "error": str(e)}
+                )
+                with self._lock:
+                    for key, newer in self._pending.items():
+                        older = batch.get(key)
+                        if older is None:
+                            batch[key] = newer
+                        else:
+                            older.merge(newer)
+                    self._pending = batch
+                return 0
+
+            self.flushes += 1
+            self.flushed_rows += len(batch)
+            return len(batch)
+
+    def _run(self) -> None:
+        while not self._stopping:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def close(self) -> None:
+        """Stop the flusher, write what is pending and close the backend"""
+        self._stopping = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            self._thread = None
+        self.flush()
+        self.backend.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Buffer size and flush counters"""
+        return {
+            "pending_rows": len(self._pending),
+            "recorded": self.recorded,
+            "flushes": self.flushes,
+            "flushed_rows": self.flushed_rows,
+            "failures": self.failures
+        }
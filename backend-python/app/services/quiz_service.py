@@ -2,9 +2,10 @@
 Quiz Processing Service
 Handles quiz analysis, scoring, and decision-making logic
 """
-from typing import Dict, Any, List, Tuple
-import statistics
-from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple, Union
+import asyncio
+from datetime import datetime, timezone
+import re
 
 from app.models.quiz_models import (
     QuizSubmissionRequest,
@@ -12,24 +13,49 @@ from app.models.quiz_models import (
     ModuleQuizResponse,
     RoadmapTopic,
     RevisionData,
-    SkillLevel
+    SkillLevel,
+    QuizFormType
 )
 from app.services.adk_agent_service import ADKAgentService
+from app.services.registry import registry
+from app.services.quiz_stats import QuizStats, batch_quiz_stats
+from app.services.profile_store import LearnerProfile, ProfileStore
+from app.services.revision_scheduler import RevisionScheduler
+from app.services.quiz_analytics import QuizAnalyticsAggregator
 from app.core.config import settings
+from app.core.event_outbox import EVENT_DOMAINS, EVENT_PASS_SCORE, EventOutbox
+from app.core.deadline import Deadline
 
 
 class QuizService:
     """Service for quiz processing and analysis"""
     
-    def __init__(self):
-        self.adk_service = ADKAgentService()
+    def __init__(
+        self,
+        adk_service: ADKAgentService = None,
+        profile_store: ProfileStore = None,
+        scheduler: RevisionScheduler = None,
+        outbox: EventOutbox = None,
+        analytics: QuizAnalyticsAggregator = None
+    ):
+        self.adk_service = adk_service or registry.adk_service()
+        self.profile_store = profile_store or registry.profile_store()
+        self.scheduler = scheduler or registry.revision_scheduler()
+        self.outbox = outbox or registry.event_outbox()
+        self.analytics = analytics or registry.quiz_analytics()
         self.adk_enabled = settings.ADK_ENABLED
         self.pass_threshold = settings.PASS_THRESHOLD
         self.revision_threshold = settings.REVISION_THRESHOLD
+        self.batch_max_submissions = settings.BATCH_MAX_SUBMISSIONS
+        self.batch_concurrency = settings.BATCH_LLM_CONCURRENCY
+        self.batch_submission_deadline = settings.BATCH_SUBMISSION_DEADLINE_SECONDS
     
     async def process_prerequisite_quiz(
         self, 
-        request: QuizSubmissionRequest
+        request: QuizSubmissionRequest,
+        stats: QuizStats = None,
+        deadline: Deadline = None,
+        record: bool = True
     ) -> RoadmapResponse:
         """
         Process prerequisite/diagnostic quiz and generate personalized roadmap
@@ -40,12 +66,38 @@ class QuizService:
         3. Identify strengths and weaknesses
         4. Analyze behavioral patterns
         5. Generate personalized roadmap using ADK
+        
+        Behavior is compared against the learner's baseline from earlier
+        submissions; strengths and weaknesses come from cumulative concept
+        mastery, which this submission is then added to. A
+        diagnostic_quiz_completed event is appended to the event outbox and
+        folded into quiz_analytics.
+        
+        With record=False (re-grading) nothing is recorded or emitted and
+        concepts are judged on this submission alone.
         """
+        stats = stats or QuizStats.from_request(request)
+        
         # Calculate performance metrics
-        accuracy = self._calculate_accuracy(request)
-        time_analysis = self._analyze_time_patterns(request)
-        behavioral_insights = await self.analyze_behavior(request)
-        concept_analysis = self._analyze_concepts(request)
+        accuracy = self._calculate_accuracy(request, stats)
+        time_analysis = self._analyze_time_patterns(request, stats)
+        behavioral_insights = await self.analyze_behavior(request, stats)
+        profile = await asyncio.to_thread(self.profile_store.record, request.user_id, stats) if record else None
+        concept_analysis = self._analyze_concepts(request, stats, profile)
+        if record:
+            await self._emit({
+                "event_type": "diagnostic_quiz_completed",
+                "user_id": request.user_id,
+                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "domain": EVENT_DOMAINS[request.domain.value],
+                "score": round(accuracy * 100),
+                "max_score": 100,
+                "total_time_seconds": round(request.total_time),
+                # No format is recommended yet; roadmap topics mix formats
+                "recommended_format": "mixed",
+                "concepts_covered": list(stats.concept_tallies),
+                "questions_attempted": len(request.answers)
+            })
         
         # Calculate proficiency score (weighted)
         proficiency_score = self._calculate_proficiency(
@@ -63,7 +115,8 @@ class QuizService:
             strengths=concept_analysis["strong_concepts"],
             weaknesses=concept_analysis["weak_concepts"],
             behavioral_profile=behavioral_insights,
-            user_id=request.user_id
+            user_id=request.user_id,
+            deadline=deadline
         )
         
         # Determine recommended starting point
@@ -88,7 +141,11 @@ class QuizService:
     
     async def process_module_quiz(
         self,
-        request: QuizSubmissionRequest
+        request: QuizSubmissionRequest,
+        stats: QuizStats = None,
+        deadline: Deadline = None,
+        include_revision: bool = True,
+        record: bool = True
     ) -> ModuleQuizResponse:
         """
         Process module quiz and determine if revision is needed
@@ -98,15 +155,39 @@ class QuizService:
         2. Analyze concept mastery
         3. Determine if user passes
         4. Generate revision content if needed
+        
+        With include_revision=False step 4 is skipped and data is left empty;
+        the caller generates it separately (see generate_revision_data).
+        
+        Concept mastery (and so the revision decision) is cumulative over the
+        learner's recorded submissions, including this one. The module is
+        (re)scheduled for spaced-repetition review from this score, and a
+        module_quiz_completed event is appended to the event outbox and
+        folded into quiz_analytics. With record=False (re-grading) none of
+        that happens and concepts are judged on this submission alone.
         """
+        stats = stats or QuizStats.from_request(request)
+        
         # Calculate score
-        accuracy = self._calculate_accuracy(request)
-        time_performance = self._evaluate_time_performance(request)
-        behavioral_insights = await self.analyze_behavior(request)
-        concept_analysis = self._analyze_concepts(request)
+        accuracy = self._calculate_accuracy(request, stats)
+        time_performance = self._evaluate_time_performance(request, stats)
+        behavioral_insights = await self.analyze_behavior(request, stats)
+        profile = await asyncio.to_thread(self.profile_store.record, request.user_id, stats) if record else None
+        concept_analysis = self._analyze_concepts(request, stats, profile)
         
         # Determine pass/fail
         passed = accuracy >= self.pass_threshold
+        if record:
+            attempts = 1
+            if request.module_id:
+                attempts = (await asyncio.to_thread(
+                    self.scheduler.record,
+                    request.user_id,
+                    request.module_id,
+                    request.domain.value,
+                    accuracy * 100
+                )).attempts
+            await self._emit(self._module_quiz_event(request, stats, accuracy, attempts))
         
         # Check if revision is needed
         revision_need = accuracy < self.revision_threshold or \
@@ -122,12 +203,11 @@ class QuizService:
         
         # Generate revision content if needed
         revision_data = None
-        if revision_need and concept_analysis["weak_concepts"]:
-            revision_data = await self.adk_service.generate_revision_content(
-                domain=request.domain,
-                weak_concepts=concept_analysis["weak_concepts"],
-                module_id=request.module_id,
-                user_id=request.user_id
+        if include_revision and revision_need and concept_analysis["weak_concepts"]:
+            revision_data = await self.generate_revision_data(
+                request,
+                concept_analysis["weak_concepts"],
+                deadline=deadline
             )
         
         # Determine next action
@@ -155,7 +235,26 @@ class QuizService:
             unlock_next_module=passed
         )
     
-    async def analyze_behavior(self, request: QuizSubmissionRequest) -> Dict[str, Any]:
+    async def generate_revision_data(
+        self,
+        request: QuizSubmissionRequest,
+        weak_concepts: List[str],
+        deadline: Deadline = None
+    ) -> List[RevisionData]:
+        """Revision materials for the weak concepts of a module quiz"""
+        return await self.adk_service.generate_revision_content(
+            domain=request.domain,
+            weak_concepts=weak_concepts,
+            module_id=request.module_id,
+            user_id=request.user_id,
+            deadline=deadline
+        )
+    
+    async def analyze_behavior(
+        self,
+        request: QuizSubmissionRequest,
+        stats: QuizStats = None
+    ) -> Dict[str, Any]:
         """
         Analyze quiz-taking behavioral patterns
         
@@ -164,90 +263,221 @@ class QuizService:
         - Time management
         - Answer patterns
         - Intuition quality
+        
+        "baseline" compares this quiz with the learner's recorded history
+        (None for a first quiz); the submission itself is not recorded.
         """
+        stats = stats or QuizStats.from_request(request)
+        profile = await asyncio.to_thread(self.profile_store.get, request.user_id)
+        
         # Option switching analysis
-        total_changes = sum(request.num_option_changes)
-        avg_changes = statistics.mean(request.num_option_changes) if request.num_option_changes else 0
-        high_uncertainty_questions = sum(1 for x in request.num_option_changes if x > 2)
+        avg_changes = stats.average_option_changes
         
         # Time analysis
-        avg_time = statistics.mean(request.question_time) if request.question_time else 0
-        time_variance = statistics.stdev(request.question_time) if len(request.question_time) > 1 else 0
-        rushed_questions = sum(1 for t in request.question_time if t < avg_time * 0.5)
+        avg_time = stats.average_time
+        time_variance = stats.time_stdev
         
         # Confidence scoring
-        confidence_score = self._calculate_confidence_score(
-            request.num_option_changes,
-            request.question_time
-        )
+        confidence_score = self._calculate_confidence_score(stats)
         
         return {
             "confidence_score": confidence_score,
             "average_option_changes": round(avg_changes, 2),
-            "total_option_changes": total_changes,
-            "high_uncertainty_count": high_uncertainty_questions,
+            "total_option_changes": stats.total_option_changes,
+            "high_uncertainty_count": stats.high_uncertainty_count,
             "average_time_per_question": round(avg_time, 2),
             "time_variance": round(time_variance, 2),
-            "rushed_questions": rushed_questions,
+            "rushed_questions": stats.rushed_questions,
             "decision_pattern": self._classify_decision_pattern(avg_changes, confidence_score),
             "time_management": self._classify_time_management(avg_time, time_variance),
             "overall_behavior_profile": self._generate_behavior_profile(
                 confidence_score,
                 avg_changes,
                 avg_time
+            ),
+            "baseline": self._compare_to_baseline(stats, profile)
+        }
+    
+    async def process_batch(
+        self,
+        requests: List[QuizSubmissionRequest],
+        regrade: bool = False
+    ) -> List[Union[RoadmapResponse, ModuleQuizResponse]]:
+        """
+        Process many quiz submissions at once
+        
+        QuizStats for the whole batch are computed as array operations, then
+        each submission runs through the regular per-request path. Only
+        roadmap and revision generation touch the LLM, fanned out with
+        bounded concurrency. Results are returned in submission order.
+        
+        There is no deadline for the batch as a whole. Each submission gets
+        its own budget of batch_submission_deadline seconds, counted from
+        when it gets a concurrency slot, so submissions queued behind others
+        in a long backfill still get generated content.
+        
+        A backfill records every submission like a live one. With regrade=True
+        the submissions are only graded: profiles, the review schedule and
+        analytics events are left untouched, so re-grading history does not
+        count it twice.
+        """
+        if len(requests) > self.batch_max_submissions:
+            raise ValueError(
+                f"Batch of {len(requests)} exceeds limit of {self.batch_max_submissions} submissions"
             )
+        
+        for idx, request in enumerate(requests):
+            if request.quiz_form not in (QuizFormType.PREREQUISITE, QuizFormType.MODULE_QUIZ):
+                raise ValueError(f"Invalid quiz_form type at index {idx}: {request.quiz_form}")
+        
+        semaphore = asyncio.Semaphore(self.batch_concurrency)
+        
+        async def process(request: QuizSubmissionRequest, stats: QuizStats):
+            async with semaphore:
+                timeout = self.batch_submission_deadline
+                deadline = Deadline(timeout) if timeout > 0 else None
+                record = not regrade
+                if request.quiz_form == QuizFormType.PREREQUISITE:
+                    return await self.process_prerequisite_quiz(request, stats, deadline, record=record)
+                return await self.process_module_quiz(request, stats, deadline, record=record)
+        
+        return await asyncio.gather(*(
+            process(request, stats)
+            for request, stats in zip(requests, batch_quiz_stats(requests))
+        ))
+    
+    async def _emit(self, event: Dict[str, Any]) -> None:
+        """
+        Publish a quiz completion event to the outbox and analytics buffer, where configured
+        
+        The outbox insert commits to SQLite, so it runs in a worker thread;
+        the analytics buffer is in memory.
+        """
+        if self.outbox is not None:
+            await asyncio.to_thread(self.outbox.append, event)
+        if self.analytics is not None:
+            self.analytics.record(event)
+    
+    def _module_quiz_event(
+        self,
+        request: QuizSubmissionRequest,
+        stats: QuizStats,
+        accuracy: float,
+        attempts: int
+    ) -> Dict[str, Any]:
+        """
+        module_quiz_completed event (ModuleQuizEvent in backend/events/types.ts)
+        
+        passed follows the event contract (score >= EVENT_PASS_SCORE), not
+        the API response, which uses PASS_THRESHOLD to unlock the next module.
+        """
+        module = request.module_id or "unknown"
+        index = re.search(r"(\d+)$", module)
+        score = round(accuracy * 100)
+        event = {
+            "event_type": "module_quiz_completed",
+            "user_id": request.user_id,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "domain": EVENT_DOMAINS[request.domain.value],
+            "module": module,
+            "module_index": int(index.group(1)) if index else 0,
+            "score": score,
+            "max_score": 100,
+            "total_time_seconds": round(request.total_time),
+            "attempts": attempts,
+            "concepts_tested": list(stats.concept_tallies),
+            "passed": score >= EVENT_PASS_SCORE,
+            "questions_answered": len(request.answers)
         }
+        if request.course_id:
+            event["course"] = request.course_id
+        return event
     
-    def _calculate_accuracy(self, request: QuizSubmissionRequest) -> float:
+    def _calculate_accuracy(
+        self,
+        request: QuizSubmissionRequest,
+        stats: QuizStats = None
+    ) -> float:
         """Calculate quiz accuracy"""
         if not request.correct_answers:
             # If correctness not provided, estimate from answers
             return 0.0
         
-        correct_count = sum(1 for is_correct in request.correct_answers if is_correct)
-        total = len(request.correct_answers)
-        return correct_count / total if total > 0 else 0.0
+        stats = stats or QuizStats.from_request(request)
+        return stats.accuracy
     
-    def _analyze_time_patterns(self, request: QuizSubmissionRequest) -> Dict[str, float]:
+    def _analyze_time_patterns(
+        self,
+        request: QuizSubmissionRequest,
+        stats: QuizStats = None
+    ) -> Dict[str, float]:
         """Analyze time-related patterns"""
         if not request.question_time:
             return {"average": 0.0, "variance": 0.0, "efficiency": 0.5}
         
-        avg_time = statistics.mean(request.question_time)
-        variance = statistics.stdev(request.question_time) if len(request.question_time) > 1 else 0
+        stats = stats or QuizStats.from_request(request)
+        avg_time = stats.average_time
         
         # Efficiency score (lower time with consistency is better)
         efficiency = 1.0 / (1.0 + (avg_time / 60.0))  # Normalize around 60 seconds
         
         return {
             "average": avg_time,
-            "variance": variance,
+            "variance": stats.time_stdev,
             "efficiency": efficiency
         }
     
-    def _analyze_concepts(self, request: QuizSubmissionRequest) -> Dict[str, List[str]]:
-        """Analyze concept-level performance"""
+    def _compare_to_baseline(
+        self,
+        stats: QuizStats,
+        profile: LearnerProfile
+    ) -> Optional[Dict[str, Any]]:
+        """This quiz's per-question time and option changes vs. the learner's history"""
+        times = profile.time_per_question
+        changes = profile.option_changes
+        if not times.count and not changes.count:
+            return None
+        
+        time_delta = stats.average_time - times.mean
+        return {
+            "quizzes": profile.quiz_count,
+            "average_time_per_question": round(times.mean, 2),
+            "time_stdev": round(times.stdev, 2),
+            "min_time": round(times.min, 2),
+            "max_time": round(times.max, 2),
+            "average_option_changes": round(changes.mean, 2),
+            "option_change_stdev": round(changes.stdev, 2),
+            "time_delta": round(time_delta, 2),
+            "time_delta_percent": round(time_delta / times.mean * 100, 1) if times.mean else None,
+            "time_z_score": round(time_delta / times.stdev, 2) if times.stdev else None,
+            "option_change_delta": round(stats.average_option_changes - changes.mean, 2)
+        }
+    
+    def _analyze_concepts(
+        self,
+        request: QuizSubmissionRequest,
+        stats: QuizStats = None,
+        profile: LearnerProfile = None
+    ) -> Dict[str, List[str]]:
+        """
+        Analyze concept-level performance
+        
+        Classifies the concepts of this quiz; with a learner profile their
+        cumulative tallies are used instead of this submission's alone.
+        """
         if not request.concepts or not request.correct_answers:
             return {"strong_concepts": [], "weak_concepts": []}
         
-        # Map concepts to performance
-        concept_performance: Dict[str, List[bool]] = {}
-        
-        for i, answer in enumerate(request.answers):
-            if i < len(request.concepts):
-                concept = request.concepts[i]
-                is_correct = request.correct_answers[i] if i < len(request.correct_answers) else False
-                
-                if concept not in concept_performance:
-                    concept_performance[concept] = []
-                concept_performance[concept].append(is_correct)
+        stats = stats or QuizStats.from_request(request)
+        tallies = profile.concept_tallies if profile is not None else stats.concept_tallies
         
         # Classify concepts
         strong_concepts = []
         weak_concepts = []
         
-        for concept, results in concept_performance.items():
-            accuracy = sum(results) / len(results)
+        for concept in stats.concept_tallies:
+            attempts, correct = tallies[concept]
+            accuracy = correct / attempts
             if accuracy >= 0.7:
                 strong_concepts.append(concept)
             elif accuracy < 0.5:
@@ -289,21 +519,16 @@ class QuizService:
         
         return round(proficiency, 3)
     
-    def _calculate_confidence_score(
-        self,
-        option_changes: List[int],
-        question_times: List[float]
-    ) -> float:
+    def _calculate_confidence_score(self, stats: QuizStats) -> float:
         """Calculate decision confidence score"""
-        if not option_changes:
+        if not stats.option_change_count:
             return 0.5
         
         # Lower changes = higher confidence
-        avg_changes = statistics.mean(option_changes)
-        confidence_from_changes = 1.0 / (1.0 + avg_changes)
+        confidence_from_changes = 1.0 / (1.0 + stats.average_option_changes)
         
         # Moderate time suggests thoughtful confidence
-        avg_time = statistics.mean(question_times) if question_times else 30
+        avg_time = stats.average_time if stats.question_count else 30
         time_confidence = 1.0 - abs(avg_time - 45) / 100  # Optimal around 45 seconds
         time_confidence = max(0, min(1, time_confidence))
         
@@ -368,12 +593,17 @@ class QuizService:
         else:
             return "basics"
     
-    def _evaluate_time_performance(self, request: QuizSubmissionRequest) -> str:
+    def _evaluate_time_performance(
+        self,
+        request: QuizSubmissionRequest,
+        stats: QuizStats = None
+    ) -> str:
         """Evaluate time performance"""
         if not request.question_time:
             return "unknown"
         
-        avg_time = statistics.mean(request.question_time)
+        stats = stats or QuizStats.from_request(request)
+        avg_time = stats.average_time
         
         if avg_time < 30:
             return "very_fast"
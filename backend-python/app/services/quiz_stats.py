@@ -0,0 +1,264 @@
+"""
+Quiz Statistics
+Precomputed per-submission statistics shared by all QuizService analyses
+
+NumPy is only needed by the batch kernels and is imported inside them, so
+loading this module (and the API) does not pay its import cost.
+"""
+from dataclasses import dataclass, field
+from typing import Dict, List, Sequence, Tuple, TYPE_CHECKING
+import math
+
+from app.models.quiz_models import QuizSubmissionRequest
+
+if TYPE_CHECKING:
+    import numpy as np
+
+
+@dataclass
+class QuizStats:
+    """
+    Summary statistics for one quiz submission
+
+    Built once per request; every downstream analysis reads from it instead
+    of re-scanning the raw question_time / num_option_changes lists.
+    """
+    # Time per question
+    question_count: int = 0
+    average_time: float = 0.0
+    time_stdev: float = 0.0
+    min_time: float = 0.0
+    max_time: float = 0.0
+    rushed_questions: int = 0
+
+    # Option changes
+    option_change_count: int = 0
+    total_option_changes: int = 0
+    average_option_changes: float = 0.0
+    option_change_stdev: float = 0.0
+    min_option_changes: int = 0
+    max_option_changes: int = 0
+    high_uncertainty_count: int = 0
+
+    # Correctness
+    graded_count: int = 0
+    correct_count: int = 0
+
+    # concept -> [attempts, correct], in first-seen order
+    concept_tallies: Dict[str, List[int]] = field(default_factory=dict)
+
+    @property
+    def accuracy(self) -> float:
+        return self.correct_count / self.graded_count if self.graded_count else 0.0
+
+    @classmethod
+    def from_request(cls, request: QuizSubmissionRequest) -> "QuizStats":
+        """Compute all statistics in one pass over each input list"""
+        stats = cls()
+
+        # Welford's update gives mean and variance in a single pass
+        times = request.question_time
+        mean = 0.0
+        m2 = 0.0
+        for n, t in enumerate(times, start=1):
+            delta = t - mean
+            mean += delta / n
+            m2 += delta * (t - mean)
+        stats.question_count = len(times)
+        stats.average_time = mean
+        stats.time_stdev = math.sqrt(m2 / (len(times) - 1)) if len(times) > 1 else 0.0
+        if times:
+            stats.min_time = min(times)
+            stats.max_time = max(times)
+        # Rushing is relative to the final mean, so it cannot share the pass above
+        rushed_cutoff = mean * 0.5
+        stats.rushed_questions = sum(1 for t in times if t < rushed_cutoff)
+
+        total_changes = 0
+        high_uncertainty = 0
+        mean = 0.0
+        m2 = 0.0
+        for n, changes in enumerate(request.num_option_changes, start=1):
+            total_changes += changes
+            if changes > 2:
+                high_uncertainty += 1
+            delta = changes - mean
+            mean += delta / n
+            m2 += delta * (changes - mean)
+        count = len(request.num_option_changes)
+        stats.option_change_count = count
+        stats.total_option_changes = total_changes
+        stats.average_option_changes = total_changes / count if count else 0.0
+        stats.option_change_stdev = math.sqrt(m2 / (count - 1)) if count > 1 else 0.0
+        if count:
+            stats.min_option_changes = min(request.num_option_changes)
+            stats.max_option_changes = max(request.num_option_changes)
+        stats.high_uncertainty_count = high_uncertainty
+
+        correct_answers = request.correct_answers or []
+        stats.graded_count = len(correct_answers)
+        stats.correct_count = sum(1 for is_correct in correct_answers if is_correct)
+
+        if request.concepts and correct_answers:
+            tallies = stats.concept_tallies
+            graded = len(correct_answers)
+            for i in range(min(len(request.answers), len(request.concepts))):
+                tally = tallies.get(request.concepts[i])
+                if tally is None:
+                    tally = tallies[request.concepts[i]] = [0, 0]
+                tally[0] += 1
+                if i < graded and correct_answers[i]:
+                    tally[1] += 1
+
+        return stats
+
+
+def _flatten(rows: Sequence[Sequence[float]], dtype) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Concatenate ragged rows into (values, segment ids, lengths)"""
+    import numpy as np
+
+    lengths = np.fromiter((len(row) for row in rows), dtype=np.int64, count=len(rows))
+    total = int(lengths.sum())
+    values = np.fromiter((x for row in rows for x in row), dtype=dtype, count=total)
+    segments = np.repeat(np.arange(len(rows)), lengths)
+    return values, segments, lengths
+
+
+def _segment_mean(values: "np.ndarray", segments: "np.ndarray", lengths: "np.ndarray") -> "np.ndarray":
+    import numpy as np
+
+    sums = np.bincount(segments, weights=values, minlength=len(lengths))
+    return np.divide(sums, lengths, out=np.zeros(len(lengths)), where=lengths > 0)
+
+
+def _segment_stdev(
+    values: "np.ndarray",
+    segments: "np.ndarray",
+    lengths: "np.ndarray",
+    means: "np.ndarray"
+) -> "np.ndarray":
+    """Sample standard deviation per segment (0 for fewer than two values)"""
+    import numpy as np
+
+    squared_dev = (values - means[segments]) ** 2
+    sums = np.bincount(segments, weights=squared_dev, minlength=len(lengths))
+    return np.sqrt(np.divide(sums, lengths - 1, out=np.zeros(len(lengths)), where=lengths > 1))
+
+
+def _segment_min_max(
+    values: "np.ndarray",
+    segments: "np.ndarray",
+    lengths: "np.ndarray"
+) -> Tuple["np.ndarray", "np.ndarray"]:
+    """Minimum and maximum per segment (0 for empty segments)"""
+    import numpy as np
+
+    mins = np.full(len(lengths), np.inf)
+    maxs = np.full(len(lengths), -np.inf)
+    np.minimum.at(mins, segments, values)
+    np.maximum.at(maxs, segments, values)
+    empty = lengths == 0
+    mins[empty] = 0.0
+    maxs[empty] = 0.0
+    return mins, maxs
+
+
+def batch_quiz_stats(requests: Sequence[QuizSubmissionRequest]) -> List[QuizStats]:
+    """
+    Compute QuizStats for a whole batch of submissions at once
+
+    Each statistic is one segment reduction over the flattened lists of all
+    submissions, instead of one Python loop per submission.
+    """
+    import numpy as np
+
+    count = len(requests)
+
+    # Correctness
+    correct, correct_seg, correct_len = _flatten(
+        [r.correct_answers or [] for r in requests], np.float64
+    )
+    correct_count = np.bincount(correct_seg, weights=correct, minlength=count)
+
+    # Time per question
+    times, time_seg, time_len = _flatten([r.question_time for r in requests], np.float64)
+    avg_time = _segment_mean(times, time_seg, time_len)
+    time_stdev = _segment_stdev(times, time_seg, time_len, avg_time)
+    min_time, max_time = _segment_min_max(times, time_seg, time_len)
+    rushed = np.bincount(time_seg, weights=times < avg_time[time_seg] * 0.5, minlength=count)
+
+    # Option changes
+    changes, change_seg, change_len = _flatten([r.num_option_changes for r in requests], np.float64)
+    total_changes = np.bincount(change_seg, weights=changes, minlength=count)
+    avg_changes = _segment_mean(changes, change_seg, change_len)
+    change_stdev = _segment_stdev(changes, change_seg, change_len, avg_changes)
+    min_changes, max_changes = _segment_min_max(changes, change_seg, change_len)
+    high_uncertainty = np.bincount(change_seg, weights=changes > 2, minlength=count)
+
+    tallies = batch_concept_tallies(requests)
+
+    return [
+        QuizStats(
+            question_count=int(time_len[i]),
+            average_time=float(avg_time[i]),
+            time_stdev=float(time_stdev[i]),
+            min_time=float(min_time[i]),
+            max_time=float(max_time[i]),
+            rushed_questions=int(rushed[i]),
+            option_change_count=int(change_len[i]),
+            total_option_changes=int(total_changes[i]),
+            average_option_changes=float(avg_changes[i]),
+            option_change_stdev=float(change_stdev[i]),
+            min_option_changes=int(min_changes[i]),
+            max_option_changes=int(max_changes[i]),
+            high_uncertainty_count=int(high_uncertainty[i]),
+            graded_count=int(correct_len[i]),
+            correct_count=int(correct_count[i]),
+            concept_tallies=tallies[i]
+        )
+        for i in range(count)
+    ]
+
+
+def batch_concept_tallies(requests: Sequence[QuizSubmissionRequest]) -> List[Dict[str, List[int]]]:
+    """
+    Tally per-concept attempts and correct answers for every submission
+
+    All (submission, concept) pairs are counted with a single unique/bincount
+    pass. Concepts keep first-seen order within each submission.
+    """
+    import numpy as np
+
+    concept_ids: Dict[str, int] = {}
+    pair_submission: List[int] = []
+    pair_concept: List[int] = []
+    pair_correct: List[bool] = []
+
+    for idx, request in enumerate(requests):
+        if not request.concepts or not request.correct_answers:
+            continue
+        answered = min(len(request.answers), len(request.concepts))
+        graded = len(request.correct_answers)
+        for i in range(answered):
+            concept_id = concept_ids.setdefault(request.concepts[i], len(concept_ids))
+            pair_submission.append(idx)
+            pair_concept.append(concept_id)
+            pair_correct.append(request.correct_answers[i] if i < graded else False)
+
+    tallies: List[Dict[str, List[int]]] = [{} for _ in requests]
+    if not pair_submission:
+        return tallies
+
+    submissions = np.asarray(pair_submission, dtype=np.int64)
+    pair_keys = submissions * len(concept_ids) + np.asarray(pair_concept, dtype=np.int64)
+    unique_keys, first_index, inverse = np.unique(pair_keys, return_index=True, return_inverse=True)
+    inverse = inverse.ravel()
+    attempts = np.bincount(inverse)
+    correct = np.bincount(inverse, weights=np.asarray(pair_correct, dtype=np.float64))
+
+    names = list(concept_ids)
+    for u in np.argsort(first_index, kind="stable"):
+        idx, concept_id = divmod(int(unique_keys[u]), len(concept_ids))
+        tallies[idx][names[concept_id]] = [int(attempts[u]), int(correct[u])]
+
+    return tallies
@@ -0,0 +1,194 @@
+"""
+Service Registry
+Process-wide, lazily constructed service instances
+"""
+from typing import Any, Optional, TYPE_CHECKING
+import threading
+
+from app.core.config import settings
+from app.core.log import get_logger
+
+if TYPE_CHECKING:
+    from app.services.adk_agent_service import ADKAgentService
+    from app.services.quiz_service import QuizService
+    from app.services.learning_service import LearningService
+    from app.services.job_queue import JobQueue
+    from app.services.profile_store import ProfileStore
+    from app.services.revision_scheduler import RevisionScheduler
+    from app.core.event_outbox import EventOutbox
+    from app.services.quiz_analytics import QuizAnalyticsAggregator
+
+
+logger = get_logger(__name__)
+
+
+class ServiceRegistry:
+    """
+    Holds the single LLM client and the services built on top of it
+
+    Nothing is constructed until first requested, so importing the app does
+    not configure the Gemini SDK. All services share one ADKAgentService.
+    Service modules are imported inside the accessors to keep this module
+    free of import cycles.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._adk_service: Optional["ADKAgentService"] = None
+        self._quiz_service: Optional["QuizService"] = None
+        self._learning_service: Optional["LearningService"] = None
+        self._job_queue: Optional["JobQueue"] = None
+        self._profile_store: Optional["ProfileStore"] = None
+        self._revision_scheduler: Optional["RevisionScheduler"] = None
+        self._event_outbox: Optional["EventOutbox"] = None
+        self._event_outbox_loaded = False
+        self._quiz_analytics: Optional["QuizAnalyticsAggregator"] = None
+        self._quiz_analytics_loaded = False
+
+    def adk_service(self) -> "ADKAgentService":
+        """Shared LLM client, created on first use"""
+        if self._adk_service is None:
+            with self._lock:
+                if self._adk_service is None:
+                    from app.services.adk_agent_service import ADKAgentService
+                    self._adk_service = ADKAgentService()
+        return self._adk_service
+
+    def quiz_service(self) -> "QuizService":
+        """Shared quiz service, created on first use"""
+        if self._quiz_service is None:
+            with self._lock:
+                if self._quiz_service is None:
+                    from app.services.quiz_service import QuizService
+                    self._quiz_service = QuizService(
+                        adk_service=self.adk_service(),
+                        profile_store=self.profile_store(),
+                        scheduler=self.revision_scheduler(),
+                        outbox=self.event_outbox(),
+                        analytics=self.quiz_analytics()
+                    )
+        return self._quiz_service
+
+    def learning_service(self) -> "LearningService":
+        """Shared learning service, created on first use"""
+        if self._learning_service is None:
+            with self._lock:
+                if self._learning_service is None:
+                    from app.services.learning_service import LearningService
+                    self._learning_service = LearningService(adk_service=self.adk_service())
+        return self._learning_service
+
+    def job_queue(self) -> "JobQueue":
+        """Shared background job queue, created on first use"""
+        if self._job_queue is None:
+            with self._lock:
+                if self._job_queue is None:
+                    from app.services.job_queue import JobQueue
+                    self._job_queue = JobQueue(
+                        workers=settings.JOB_WORKERS,
+                        max_pending=settings.JOB_QUEUE_SIZE,
+                        ttl=settings.JOB_TTL_SECONDS
+                    )
+        return self._job_queue
+
+    def profile_store(self) -> "ProfileStore":
+        """Shared learner profile store, opened on first use"""
+        if self._profile_store is None:
+            with self._lock:
+                if self._profile_store is None:
+                    from app.services.profile_store import ProfileStore
+                    self._profile_store = ProfileStore(
+                        settings.PROFILE_STORE_PATH,
+                        cache_size=settings.PROFILE_CACHE_SIZE
+                    )
+        return self._profile_store
+
+    def revision_scheduler(self) -> "RevisionScheduler":
+        """Shared spaced-repetition queue, created on first use"""
+        if self._revision_scheduler is None:
+            with self._lock:
+                if self._revision_scheduler is None:
+                    from app.services.revision_scheduler import RevisionScheduler
+                    self._revision_scheduler = RevisionScheduler(
+                        intervals_hours=settings.REVISION_INTERVAL_HOURS,
+                        decay_days=settings.MEMORY_DECAY_DAYS,
+                        path=settings.PROFILE_STORE_PATH
+                    )
+        return self._revision_scheduler
+
+    def event_outbox(self) -> Optional["EventOutbox"]:
+        """Shared analytics event outbox, or None when EVENT_SINK is "none" """
+        if not self._event_outbox_loaded:
+            with self._lock:
+                if not self._event_outbox_loaded:
+                    from app.core.event_outbox import EventOutbox, create_sink
+                    sink = create_sink(settings.EVENT_SINK, settings.EVENT_SINK_PATH)
+                    if sink is not None:
+                        self._event_outbox = EventOutbox(
+                            settings.EVENT_OUTBOX_PATH,
+                            sink,
+                            batch_size=settings.EVENT_BATCH_SIZE,
+                            flush_interval=settings.EVENT_FLUSH_INTERVAL
+                        )
+                    self._event_outbox_loaded = True
+        return self._event_outbox
+
+    def quiz_analytics(self) -> Optional["QuizAnalyticsAggregator"]:
+        """Shared quiz_analytics aggregator, or None without ANALYTICS_DB_URL"""
+        if not self._quiz_analytics_loaded:
+            with self._lock:
+                if not self._quiz_analytics_loaded:
+                    if settings.ANALYTICS_DB_URL:
+                        from app.services.quiz_analytics import QuizAnalyticsAggregator, create_backend
+                        try:
+                            backend = create_backend(
+                                settings.ANALYTICS_DB_URL,
+                                pool_size=settings.ANALYTICS_POOL_SIZE
+                            )
+                            self._quiz_analytics = QuizAnalyticsAggregator(
+                                backend,
+                                flush_interval=settings.ANALYTICS_FLUSH_INTERVAL,
+                                max_pending=settings.ANALYTICS_MAX_PENDING
+                            )
+                        except ImportError:
+                            logger.error("psycopg_pool is not installed; quiz_analytics writes disabled")
+                    self._quiz_analytics_loaded = True
+        return self._quiz_analytics
+
+    def peek(self, name: str) -> Optional[Any]:
+        """
+        The named service if it has already been built, else None
+
+        Never constructs anything, so health probes can report on services
+        without opening their databases or starting their threads.
+        """
+        return getattr(self, f"_{name}")
+
+    def close(self) -> None:
+        """Drop all instances; the next access rebuilds them"""
+        with self._lock:
+            if self._profile_store is not None:
+                self._profile_store.close()
+                self._profile_store = None
+            if self._job_queue is not None:
+                self._job_queue.close()
+                self._job_queue = None
+            if self._event_outbox is not None:
+                self._event_outbox.close()
+                self._event_outbox = None
+            self._event_outbox_loaded = False
+            if self._quiz_analytics is not None:
+                self._quiz_analytics.close()
+                self._quiz_analytics = None
+            self._quiz_analytics_loaded = False
+            if self._revision_scheduler is not None:
+                self._revision_scheduler.close()
+                self._revision_scheduler = None
+            self._quiz_service = None
+            self._learning_service = None
+            if self._adk_service is not None:
+                self._adk_service.close()
+                self._adk_service = None
+
+
+registry = ServiceRegistry()
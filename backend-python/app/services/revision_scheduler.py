@@ -0,0 +1,264 @@
+"""
+Revision Scheduler
+Spaced-repetition queue of (user, module) pairs ordered by next review time
+"""
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+from dataclasses import dataclass
+from datetime import datetime, timezone
+import heapq
+import math
+import sqlite3
+import threading
+import time
+
+from app.models.quiz_models import DueReview
+
+
+SECONDS_PER_DAY = 86400.0
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS review_states (
+    user_id TEXT NOT NULL,
+    module_id TEXT NOT NULL,
+    domain TEXT NOT NULL,
+    memory_score REAL NOT NULL,
+    last_reviewed_at REAL NOT NULL,
+    next_review_at REAL NOT NULL,
+    review_count INTEGER NOT NULL,
+    attempts INTEGER NOT NULL,
+    queued INTEGER NOT NULL,
+    PRIMARY KEY (user_id, module_id)
+);
+"""
+
+# Forgetting score thresholds, as in backend/consumers/memoryScoreConsumer.ts
+HIGH_URGENCY = 60.0
+MEDIUM_URGENCY = 35.0
+
+
+@dataclass
+class ReviewState:
+    """Memory state of one learner on one module (a memory_scores row)"""
+    user_id: str
+    module_id: str
+    domain: str
+    memory_score: float  # 0-100 confidence in retention at last review
+    last_reviewed_at: float
+    next_review_at: float
+    review_count: int = 0
+    attempts: int = 1  # Quizzes recorded on this module
+    queued: bool = True
+
+
+def initial_memory_score(quiz_score: float) -> float:
+    """Retention confidence after a first quiz scored 0-100"""
+    if quiz_score < 60:
+        return max(40.0, quiz_score * 0.8)
+    return min(100.0, 70 + min(30.0, (quiz_score - 60) * 1.5))
+
+
+def decay_factors(elapsed_days: "Any", decay_days: float) -> "Any":
+    """Forgetting-curve multiplier exp(-t / decay_days) for an array of elapsed days"""
+    import numpy as np
+
+    return np.exp(-np.maximum(elapsed_days, 0.0) / decay_days)
+
+
+class RevisionScheduler:
+    """
+    Min-heap of (next_review_at, user, module) over every tracked pair
+
+    record() is called once per module quiz and (re)schedules the pair
+    after the next spaced-repetition interval; a failed quiz starts the
+    intervals over. pop_due() takes the pairs that are due off the queue
+    in O(k log n) and computes their decayed memory scores as one
+    vectorized batch, so nothing is recomputed for pairs that are not due.
+
+    Rescheduling leaves the old heap entry behind; stale entries are
+    skipped when popped and dropped when the heap is compacted.
+
+    Every state change is written through to a review_states table in an
+    embedded SQLite file, and the heap is rebuilt from it on startup, so
+    schedules survive a restart.
+    """
+
+    def __init__(
+        self,
+        intervals_hours: Sequence[float] = (24, 72, 168, 720),
+        decay_days: float = 7.0,
+        pass_score: float = 60.0,
+        path: str = ":memory:"
+    ):
+        self.intervals = [hours * 3600.0 for hours in intervals_hours]
+        self.decay_days = decay_days
+        self.pass_score = pass_score
+        self.path = path
+        self._states: Dict[Tuple[str, str], ReviewState] = {}
+        self._heap: List[Tuple[float, str, str]] = []
+        self._queued = 0
+        self._lock = threading.Lock()
+        self.popped = 0
+
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        if path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+        self._load()
+
+    def _load(self) -> None:
+        """Rebuild states and the heap of queued pairs from the table"""
+        for row in self._conn.execute(
+            "SELECT user_id, module_id, domain, memory_score, last_reviewed_at, next_review_at, "
+            "review_count, attempts, queued FROM review_states"
+        ):
+            state = ReviewState(*row[:-1], queued=bool(row[-1]))
+            self._states[(state.user_id, state.module_id)] = state
+        self._queued = sum(state.queued for state in self._states.values())
+        self._compact()
+
+    def record(
+        self,
+        user_id: str,
+        module_id: str,
+        domain: str,
+        score: float,
+        now: Optional[float] = None
+    ) -> ReviewState:
+        """Fold a quiz scored 0-100 into the pair's memory and reschedule it"""
+        now = time.time() if now is None else now
+        key = (user_id, module_id)
+        with self._lock:
+            state = self._states.get(key)
+            if state is None:
+                state = ReviewState(
+                    user_id=user_id,
+                    module_id=module_id,
+                    domain=domain,
+                    memory_score=initial_memory_score(score),
+                    last_reviewed_at=now,
+                    next_review_at=now,
+                    queued=False
+                )
+                self._states[key] = state
+            else:
+                elapsed_days = (now - state.last_reviewed_at) / SECONDS_PER_DAY
+                decayed = state.memory_score * math.exp(-max(elapsed_days, 0.0) / self.decay_days)
+                boost = 15.0 if score >= 80 else 5.0 if score >= self.pass_score else 0.0
+                state.memory_score = min(100.0, max(0.0, decayed + boost))
+                state.review_count = state.review_count + 1 if score >= self.pass_score else 0
+                state.attempts += 1
+                state.domain = domain
+                state.last_reviewed_at = now
+
+            interval = self.intervals[min(state.review_count, len(self.intervals) - 1)]
+            state.next_review_at = now + interval
+            if not state.queued:
+                state.queued = True
+                self._queued += 1
+            heapq.heappush(self._heap, (state.next_review_at, user_id, module_id))
+            if len(self._heap) > 2 * self._queued + 1024:
+                self._compact()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO review_states VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    user_id, module_id, state.domain, state.memory_score, state.last_reviewed_at,
+                    state.next_review_at, state.review_count, state.attempts, 1
+                )
+            )
+            self._conn.commit()
+            return state
+
+    def pop_due(self, now: Optional[float] = None, limit: int = 100) -> List[DueReview]:
+        """
+        Remove and return up to limit pairs due at now, most overdue first
+
+        Popped pairs leave the queue until their next recorded quiz.
+        """
+        now = time.time() if now is None else now
+        due: List[ReviewState] = []
+        with self._lock:
+            while self._heap and len(due) < limit and self._heap[0][0] <= now:
+                next_review_at, user_id, module_id = heapq.heappop(self._heap)
+                state = self._states.get((user_id, module_id))
+                if state is None or not state.queued or state.next_review_at != next_review_at:
+                    continue
+                state.queued = False
+                self._queued -= 1
+                due.append(state)
+            if due:
+                self._conn.executemany(
+                    "UPDATE review_states SET queued = 0 WHERE user_id = ? AND module_id = ?",
+                    [(state.user_id, state.module_id) for state in due]
+                )
+                self._conn.commit()
+            self.popped += len(due)
+        return self._score(due, now)
+
+    def _score(self, states: List[ReviewState], now: float) -> List[DueReview]:
+        """Decayed memory, forgetting score and urgency for a batch of pairs"""
+        if not states:
+            return []
+        import numpy as np
+
+        last_reviewed = np.fromiter((s.last_reviewed_at for s in states), np.float64, len(states))
+        memory = np.fromiter((s.memory_score for s in states), np.float64, len(states))
+        elapsed_days = (now - last_reviewed) / SECONDS_PER_DAY
+        factors = decay_factors(elapsed_days, self.decay_days)
+        current = memory * factors
+        forgetting = 100.0 - current
+        urgency = np.where(
+            forgetting >= HIGH_URGENCY, "high",
+            np.where(forgetting >= MEDIUM_URGENCY, "medium", "low")
+        )
+
+        return [
+            DueReview.model_construct(
+                user_id=state.user_id,
+                module_id=state.module_id,
+                domain=state.domain,
+                current_score=round(float(current[i]), 2),
+                forgetting_score=round(float(forgetting[i]), 2),
+                decay_factor=round(float(factors[i]), 4),
+                revision_urgency=str(urgency[i]),
+                review_count=state.review_count,
+                days_since_review=int(elapsed_days[i]),
+                last_reviewed_at=datetime.fromtimestamp(state.last_reviewed_at, tz=timezone.utc),
+                next_review_at=datetime.fromtimestamp(state.next_review_at, tz=timezone.utc)
+            )
+            for i, state in enumerate(states)
+        ]
+
+    def _compact(self) -> None:
+        """Rebuild the heap from the queued pairs, dropping stale entries"""
+        self._heap = [
+            (state.next_review_at, state.user_id, state.module_id)
+            for state in self._states.values()
+            if state.queued
+        ]
+        heapq.heapify(self._heap)
+
+    def get(self, user_id: str, module_id: str) -> Optional[ReviewState]:
+        return self._states.get((user_id, module_id))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._states.clear()
+            self._heap.clear()
+            self._queued = 0
+            self._conn.execute("DELETE FROM review_states")
+            self._conn.commit()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Queue size and counters"""
+        return {
+            "tracked_pairs": len(self._states),
+            "queued": self._queued,
+            "heap_entries": len(self._heap),
+            "popped": self.popped
+        }
@@ -0,0 +1,132 @@
+"""
+Cold Start Benchmark
+Measures import time of the FastAPI app and time-to-first-200 on /health
+
+Usage:
+    python benchmarks/cold_start.py
+    python benchmarks/cold_start.py --import-budget-ms 1200 --ready-budget-ms 2500 --runs 5
+
+Exits with status 1 when the median of either measurement exceeds its budget,
+or when `import main` pulls in a module that should be deferred.
+"""
+from typing import Dict, List, Tuple
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+import urllib.request
+
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Modules that must stay out of the import path of `main`
+DEFERRED_MODULES = ["google.generativeai", "numpy", "uvicorn"]
+
+
+def measure_import(top: int) -> Tuple[float, List[Tuple[int, int, str]], List[str]]:
+    """Run `python -X importtime -c 'import main'` and parse its report"""
+    check = "; ".join([
+        "import sys, main",
+        f"loaded = [m for m in {DEFERRED_MODULES!r} if m in sys.modules]",
+        "print(','.join(loaded))"
+    ])
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", check],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    rows: List[Tuple[int, int, str]] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), int(cumulative_us), name.rstrip()))
+
+    main_us = next(cumulative for _, cumulative, name in rows if name.strip() == "main")
+    loaded = [m for m in result.stdout.strip().split(",") if m]
+
+    rows.sort(key=lambda row: row[1], reverse=True)
+    return main_us / 1000.0, rows[:top], loaded
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def measure_ready(timeout: float) -> float:
+    """Start uvicorn and time the first 200 response from /health"""
+    port = _free_port()
+    env = dict(os.environ, PREWARM_SERVICES="False")
+    started = time.perf_counter()
+    server = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "main:app", "--host", "127.0.0.1", "--port", str(port)],
+        cwd=BACKEND_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+
+    try:
+        while time.perf_counter() - started < timeout:
+            try:
+                with urllib.request.urlopen(f"http://127.0.0.1:{port}/health", timeout=1) as response:
+                    if response.status == 200:
+                        return (time.perf_counter() - started) * 1000.0
+            except OSError:
+                time.sleep(0.01)
+        raise TimeoutError(f"/health did not return 200 within {timeout}s")
+    finally:
+        server.terminate()
+        server.wait(timeout=10)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="NeuroLearn cold start benchmark")
+    parser.add_argument("--runs", type=int, default=3, help="Repetitions per measurement")
+    parser.add_argument("--top", type=int, default=15, help="Slowest imports to list")
+    parser.add_argument("--import-budget-ms", type=float, default=1500.0)
+    parser.add_argument("--ready-budget-ms", type=float, default=3000.0)
+    parser.add_argument("--ready-timeout", type=float, default=30.0)
+    args = parser.parse_args()
+
+    import_runs: List[float] = []
+    slowest: List[Tuple[int, int, str]] = []
+    loaded: List[str] = []
+    for _ in range(args.runs):
+        elapsed, slowest, loaded = measure_import(args.top)
+        import_runs.append(elapsed)
+
+    print("Slowest imports (last run, cumulative ms):")
+    for self_us, cumulative_us, name in slowest:
+        print(f"  {cumulative_us / 1000.0:9.1f}  {self_us / 1000.0:9.1f} self  {name}")
+
+    ready_runs = [measure_ready(args.ready_timeout) for _ in range(args.runs)]
+
+    results: Dict[str, Tuple[float, float]] = {
+        "import main": (statistics.median(import_runs), args.import_budget_ms),
+        "first 200 on /health": (statistics.median(ready_runs), args.ready_budget_ms)
+    }
+
+    failed = bool(loaded)
+    if loaded:
+        print(f"\nDeferred modules imported by main: {', '.join(loaded)}")
+
+    print("\nMedian over {} runs:".format(args.runs))
+    for label, (value, budget) in results.items():
+        status = "ok" if value <= budget else "OVER BUDGET"
+        failed = failed or value > budget
+        print(f"  {label:<22} {value:9.1f} ms  (budget {budget:.0f} ms)  {status}")
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+"""
+Serialization Benchmark
+Per-response-type cost of rendering API responses
+
+Usage:
+    python benchmarks/serialization.py
+    python benchmarks/serialization.py --number 20000
+
+Compares FastAPI's default path (response_model re-validation followed by
+jsonable_encoder and json.dumps) with the ORJSONResponse and
+MsgPackResponse renderers used by the /api/v1 routes.
+"""
+from typing import Callable, Dict, List, Tuple
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder  # noqa: E402
+from pydantic import BaseModel  # noqa: E402
+
+from app.core.responses import MsgPackResponse, ORJSONResponse  # noqa: E402
+from app.models.quiz_models import (  # noqa: E402
+    RoadmapResponse,
+    ModuleQuizResponse,
+    LearningContentResponse,
+    DomainType,
+    SkillLevel
+)
+from app.services.fallback_catalog import fallback_catalog  # noqa: E402
+
+
+def sample_responses() -> Dict[str, BaseModel]:
+    """One representative instance of each large response model"""
+    concepts = ["arrays", "linked lists", "recursion", "dynamic programming", "graphs"]
+    return {
+        "RoadmapResponse": RoadmapResponse(
+            message="Personalized roadmap generated successfully",
+            user_id="bench_user",
+            domain=DomainType.DSA,
+            skill_level=SkillLevel.INTERMEDIATE,
+            proficiency_score=0.62,
+            strengths=concepts[:2],
+            weaknesses=concepts[2:],
+            roadmap=fallback_catalog.roadmap(DomainType.DSA, SkillLevel.INTERMEDIATE, concepts),
+            behavioral_analysis={
+                "time_management": {"average_time": 41.5, "rushed_questions": 1},
+                "decision_confidence": {"high_uncertainty_count": 2, "confidence_score": 0.7}
+            },
+            recommended_start="dsa_1"
+        ),
+        "ModuleQuizResponse": ModuleQuizResponse(
+            message="Module quiz analyzed",
+            user_id="bench_user",
+            module_id="module_dp",
+            score=0.55,
+            passed=False,
+            time_performance="average",
+            strong_concepts=concepts[:2],
+            weak_concepts=concepts[2:],
+            revision_need=True,
+            revision_urgency="soon",
+            data=fallback_catalog.revisions(concepts[2:]),
+            next_action="Review weak concepts",
+            unlock_next_module=False
+        ),
+        "LearningContentResponse": LearningContentResponse(
+            message="Learning content generated successfully",
+            user_id="bench_user",
+            domain=DomainType.DSA,
+            topic="Dynamic Programming",
+            module=fallback_catalog.module("Dynamic Programming", "mixed"),
+            personalization_notes="Focus on recursion and memoization",
+            estimated_time="45 minutes"
+        )
+    }
+
+
+def renderers() -> List[Tuple[str, Callable[[BaseModel], bytes]]]:
+    def fastapi_default(model: BaseModel) -> bytes:
+        validated = type(model).model_validate(model.model_dump())
+        return json.dumps(jsonable_encoder(validated)).encode("utf-8")
+
+    return [
+        ("fastapi default", fastapi_default),
+        ("orjson response", lambda model: ORJSONResponse(model).body),
+        ("msgpack response", lambda model: MsgPackResponse(model).body)
+    ]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="NeuroLearn serialization benchmark")
+    parser.add_argument("--number", type=int, default=5000, help="Renders per measurement")
+    parser.add_argument("--repeat", type=int, default=3, help="Measurements, best is reported")
+    args = parser.parse_args()
+
+    print(f"{'response':<26}{'renderer':<18}{'us/response':>12}{'bytes':>8}{'speedup':>9}")
+    for name, model in sample_responses().items():
+        baseline = None
+        for label, render in renderers():
+            best = min(timeit.repeat(lambda: render(model), number=args.number, repeat=args.repeat))
+            per_call_us = best / args.number * 1e6
+            baseline = baseline or per_call_us
+            size = len(render(model))
+            print(f"{name:<26}{label:<18}{per_call_us:>12.1f}{size:>8}{baseline / per_call_us:>8.1f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -5,19 +5,44 @@ FastAPI application for adaptive learning platform
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
-import uvicorn
+import asyncio
 
-from app.api.routes import quiz_router, learning_router
+from app.api.routes import quiz_router, learning_router, jobs_router, revision_router
 from app.core.config import settings
+from app.core.log import configure_logging, shutdown_logging
+from app.services.registry import registry
+from app.core.cache import response_cache
+from app.core.rate_limiter import outbound_limiter
+from app.core.response_decoding import decode_metrics
+from app.services.prompt_templates import prompt_metrics
+from app.core.canonical import generation_keys
+from app.services.adk_agent_service import single_flight
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan events"""
+    configure_logging()
     print("NeuroLearn Backend Starting...")
     print(f"Environment: {settings.ENVIRONMENT}")
+    
+    # Build services (and the LLM SDK) off the event loop after startup,
+    # so readiness does not wait on them but the first request rarely does
+    prewarm = []
+    if settings.PREWARM_SERVICES:
+        loop = asyncio.get_running_loop()
+        prewarm = [
+            loop.run_in_executor(None, registry.quiz_service),
+            loop.run_in_executor(None, registry.learning_service)
+        ]
+    
     yield
     print("NeuroLearn Backend Shutting Down...")
+    # A running executor call cannot be cancelled: let the prewarm finish
+    # building before the services it builds are closed
+    await asyncio.gather(*prewarm, return_exceptions=True)
+    registry.close()
+    shutdown_logging()
 
 
 # Initialize FastAPI app
@@ -40,6 +65,8 @@ app.add_middleware(
 # Include routers
 app.include_router(quiz_router, prefix="/api/v1", tags=["Quiz"])
 app.include_router(learning_router, prefix="/api/v1", tags=["Learning"])
+app.include_router(jobs_router, prefix="/api/v1", tags=["Jobs"])
+app.include_router(revision_router, prefix="/api/v1", tags=["Revision"])
 
 
 @app.get("/")
@@ -54,15 +81,41 @@ async def root():
 
 @app.get("/health")
 async def health_check():
-    """Detailed health check"""
+    """
+    Detailed health check
+    
+    Services are only peeked at: one that has not been built yet reports
+    null rather than being constructed by the probe.
+    """
+    adk_service = registry.peek("adk_service")
+    provider = adk_service.client if adk_service is not None else None
     return {
         "status": "ok",
         "environment": settings.ENVIRONMENT,
-        "adk_enabled": settings.ADK_ENABLED
+        "adk_enabled": settings.ADK_ENABLED,
+        "llm_provider": provider.stats() if provider is not None else None,
+        "response_cache": response_cache.stats(),
+        "single_flight": single_flight.stats(),
+        "outbound_limiter": outbound_limiter.stats(),
+        "response_decoding": decode_metrics.stats(),
+        "prompts": prompt_metrics.stats(),
+        "generation_keys": generation_keys.stats(),
+        "jobs": _stats("job_queue"),
+        "revision_queue": _stats("revision_scheduler"),
+        "event_outbox": _stats("event_outbox"),
+        "quiz_analytics": _stats("quiz_analytics")
     }
 
 
+def _stats(name: str):
+    """stats() of a registry service that already exists, else None"""
+    service = registry.peek(name)
+    return service.stats() if service is not None else None
+
+
 if __name__ == "__main__":
+    import uvicorn
+    
     uvicorn.run(
         "main:app",
         host=settings.HOST,
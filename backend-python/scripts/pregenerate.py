@@ -0,0 +1,194 @@
+"""
+Catalog Pregeneration
+Generates learning modules and roadmaps for a catalog manifest ahead of traffic
+
+Usage:
+    python scripts/pregenerate.py scripts/catalog_manifest.example.json
+    python scripts/pregenerate.py manifest.json --concurrency 8 --store content_store.db
+
+Results are written to the content store (CONTENT_STORE_PATH), which the API
+consults whenever its in-memory cache misses. Run it with the same model
+settings (DEFAULT_MODEL, TEMPERATURE, MAX_TOKENS) as the API, since they
+are part of the lookup key.
+
+Every finished item is appended to a checkpoint file; re-running the same
+manifest skips those items, so an interrupted run resumes where it stopped.
+Failed items are not checkpointed and are retried on the next run. Items
+whose prompt is unchanged are read back from the store rather than
+regenerated; changing a prompt or the model settings produces new keys.
+
+Manifest format (any field given as a list is expanded into one item per
+combination):
+
+    {
+      "modules": [
+        {"domain": "dsa", "topic": ["Arrays", "Graphs"],
+         "skill_level": ["beginner", "intermediate"], "format_preference": "mixed"}
+      ],
+      "roadmaps": [
+        {"domain": "dsa", "skill_level": "beginner", "proficiency_score": 0.3,
+         "strengths": [], "weaknesses": ["arrays"]}
+      ]
+    }
+"""
+from typing import Any, Dict, Iterator, List, Set
+import argparse
+import asyncio
+import hashlib
+import itertools
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.config import settings  # noqa: E402
+from app.core.content_store import ContentStore  # noqa: E402
+from app.models.quiz_models import DomainType, SkillLevel  # noqa: E402
+from app.services.adk_agent_service import ADKAgentService  # noqa: E402
+
+
+# Fields expanded when given as a list; all others are passed through as-is
+EXPANDED_FIELDS = {
+    "module": ("domain", "topic", "skill_level", "format_preference"),
+    "roadmap": ("domain", "skill_level")
+}
+
+MODULE_DEFAULTS = {"format_preference": "mixed", "weak_concepts": [], "module_id": None}
+ROADMAP_DEFAULTS = {
+    "proficiency_score": 0.5,
+    "strengths": [],
+    "weaknesses": [],
+    "behavioral_profile": {}
+}
+
+
+def expand(kind: str, entry: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """One item per combination of the list-valued expandable fields"""
+    fields = [f for f in EXPANDED_FIELDS[kind] if isinstance(entry.get(f), list)]
+    for values in itertools.product(*(entry[f] for f in fields)):
+        item = dict(entry, **dict(zip(fields, values)))
+        item["kind"] = kind
+        yield item
+
+
+def load_manifest(path: str) -> List[Dict[str, Any]]:
+    """Expanded, de-duplicated items of a manifest"""
+    with open(path, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+
+    items: Dict[str, Dict[str, Any]] = {}
+    for kind, section, defaults in (
+        ("module", "modules", MODULE_DEFAULTS),
+        ("roadmap", "roadmaps", ROADMAP_DEFAULTS)
+    ):
+        for entry in manifest.get(section, []):
+            for item in expand(kind, dict(defaults, **entry)):
+                items.setdefault(item_id(item), item)
+    return list(items.values())
+
+
+def item_id(item: Dict[str, Any]) -> str:
+    """Stable identifier of a manifest item, used for checkpointing"""
+    canonical = json.dumps(item, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16]
+
+
+def load_checkpoint(path: str) -> Set[str]:
+    if not os.path.exists(path):
+        return set()
+    done = set()
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                done.add(json.loads(line)["id"])
+    return done
+
+
+async def generate(service: ADKAgentService, item: Dict[str, Any], timeout: float) -> None:
+    """Generate one manifest item; the service persists it to the store"""
+    domain = DomainType(item["domain"])
+    skill_level = SkillLevel(item["skill_level"])
+
+    if item["kind"] == "module":
+        call = service.generate_learning_module(
+            domain=domain,
+            topic=item["topic"],
+            skill_level=skill_level,
+            format_preference=item["format_preference"],
+            weak_concepts=item["weak_concepts"],
+            user_id="pregenerate",
+            module_id=item["module_id"]
+        )
+    else:
+        call = service.generate_roadmap(
+            domain=domain,
+            skill_level=skill_level,
+            proficiency_score=item["proficiency_score"],
+            strengths=item["strengths"],
+            weaknesses=item["weaknesses"],
+            behavioral_profile=item["behavioral_profile"],
+            user_id="pregenerate"
+        )
+    await asyncio.wait_for(call, timeout=timeout if timeout > 0 else None)
+
+
+async def run(args: argparse.Namespace) -> int:
+    items = load_manifest(args.manifest)
+    checkpoint_path = args.checkpoint or f"{args.manifest}.checkpoint"
+    done = set() if args.force else load_checkpoint(checkpoint_path)
+    todo = [item for item in items if item_id(item) not in done]
+    print(f"{len(items)} items in manifest, {len(items) - len(todo)} already done, {len(todo)} to generate")
+
+    service = ADKAgentService()
+    if service.client is None:
+        print("LLM client is not configured (check LLM_PROVIDER, ADK_ENABLED and GEMINI_API_KEY)", file=sys.stderr)
+        return 1
+    service.store = ContentStore(args.store)
+    service.persist_generated = True
+    service.fallback_on_error = False
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    failures = 0
+    completed = 0
+
+    with open(checkpoint_path, "a", encoding="utf-8") as checkpoint:
+        async def worker(item: Dict[str, Any]) -> None:
+            nonlocal failures, completed
+            label = f"{item['kind']} {item['domain']}/{item.get('topic', '-')}/{item['skill_level']}"
+            async with semaphore:
+                started = time.perf_counter()
+                try:
+                    await generate(service, item, args.timeout)
+                except Exception as e:
+                    failures += 1
+                    print(f"  FAILED  {label}: {type(e).__name__}: {e}", file=sys.stderr)
+                    return
+            completed += 1
+            checkpoint.write(json.dumps({"id": item_id(item), "kind": item["kind"], "at": time.time()}) + "\n")
+            checkpoint.flush()
+            print(f"  ok      {label} ({time.perf_counter() - started:.1f}s) [{completed}/{len(todo)}]")
+
+        await asyncio.gather(*(worker(item) for item in todo))
+
+    print(f"Done: {completed} generated, {failures} failed, store has {service.store.count()} entries")
+    service.store.close()
+    return 1 if failures else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Pregenerate catalog content into the content store")
+    parser.add_argument("manifest", help="Catalog manifest (JSON)")
+    parser.add_argument("--store", default=settings.CONTENT_STORE_PATH or "content_store.db")
+    parser.add_argument("--checkpoint", help="Checkpoint file (default: <manifest>.checkpoint)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Items generated at once")
+    parser.add_argument("--timeout", type=float, default=120.0, help="Seconds per item (0 = none)")
+    parser.add_argument("--force", action="store_true", help="Ignore the checkpoint and revisit every item")
+    args = parser.parse_args()
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,7 +1,13 @@
 """pytest configuration"""
+import os
 import pytest
 import asyncio
 
+# Keep tests away from a developer's pregenerated content
+os.environ.setdefault("CONTENT_STORE_PATH", "")
+os.environ.setdefault("PROFILE_STORE_PATH", ":memory:")
+os.environ.setdefault("EVENT_SINK", "none")
+
 
 @pytest.fixture(scope="session")
 def event_loop():
@@ -9,3 +15,56 @@ def event_loop():
     loop = asyncio.get_event_loop_policy().new_event_loop()
     yield loop
     loop.close()
+
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeClient:
+    """Stand-in for the Gemini client that counts calls"""
+
+    def __init__(self, text, delay=0.0):
+        self.text = text
+        self.delay = delay
+        self.calls = 0
+
+    async def generate_content_async(self, prompt, generation_config=None):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return FakeResponse(self.text)
+
+
+REVISION_JSON = """```json
+{"revisions": [{"concept": "arrays", "explanation": "Indexed storage", "examples": ["a[0]"]}]}
+```"""
+
+
+@pytest.fixture
+def make_adk_service():
+    """
+    Factory for an ADKAgentService isolated from the shared cache and flights
+
+    Takes the LLM client and optionally the cache size; further keyword
+    arguments are set as service attributes (store, limiter, ...).
+    """
+    from app.core.cache import ResponseCache
+    from app.services.adk_agent_service import ADKAgentService, SingleFlight
+
+    def make(client, max_entries=64, **attributes):
+        service = ADKAgentService()
+        service.cache = ResponseCache(max_entries=max_entries)
+        service.single_flight = SingleFlight()
+        service.client = client
+        for name, value in attributes.items():
+            setattr(service, name, value)
+        return service
+
+    return make
+
+
+@pytest.fixture
+def adk_service(make_adk_service):
+    """Isolated service whose client answers every prompt with REVISION_JSON"""
+    return make_adk_service(FakeClient(REVISION_JSON))
@@ -0,0 +1,129 @@
+"""
+Test Suite for Canonical Generation Keys
+"""
+import pytest
+from app.core.canonical import (
+    GenerationKeyStats,
+    canonical_concepts,
+    canonical_topic,
+    concept_names,
+    generation_keys
+)
+from app.models.quiz_models import DomainType, SkillLevel
+from tests.conftest import FakeClient, FakeResponse
+
+
+LOOPS_AND_ARRAYS_JSON = (
+    '{"revisions": [{"concept": "Loops", "explanation": "Repetition", "examples": ["for"]},'
+    ' {"concept": "Arrays", "explanation": "Indexed storage", "examples": ["a[0]"]}]}'
+)
+MODULE_JSON = '{"title": "Binary Search Trees", "tldr": "Ordered trees", "key_concepts": ["bst"], "examples": ["lookup"]}'
+
+
+@pytest.fixture(autouse=True)
+def reset_generation_keys():
+    generation_keys.reset()
+
+
+class TestCanonicalization:
+    """Test normalization of topics and concept lists"""
+
+    def test_concepts_folded_sorted_and_deduped(self):
+        assert canonical_concepts(["Loops", " arrays ", "LOOPS", "", "  "]) == ["arrays", "loops"]
+        assert canonical_concepts(["arrays", "Loops"]) == canonical_concepts(["loops", "arrays"])
+        assert canonical_concepts(None) == []
+
+    def test_limit_applied_in_priority_order_before_sorting(self):
+        concepts = [f"concept {i:02d}" for i in range(10)] + ["zeta recursion", "xray", "Alpha"]
+
+        assert canonical_concepts(concepts, limit=11) == sorted(concepts[:10]) + ["zeta recursion"]
+        assert canonical_concepts(["Zeta", "alpha", "zeta"], limit=1) == ["zeta"]
+        assert concept_names([" Trees ", "trees", "Arrays"]) == {"trees": "Trees", "arrays": "Arrays"}
+
+    def test_topic_normalized(self):
+        assert canonical_topic("Binary  Search Trees ") == canonical_topic("binary search trees")
+
+    def test_key_stats(self):
+        stats = GenerationKeyStats()
+        stats.record("revision", ("k1", ("Arrays",)), "k1")
+        stats.record("revision", ("k1", ("arrays",)), "k1")
+        stats.record("revision", ("k2", ("trees",)), "k2")
+        stats.record("revision", ("k2", ("trees",)), "k2")
+
+        assert stats.stats()["revision"] == {
+            "requests": 4,
+            "raw_distinct": 3,
+            "canonical_distinct": 2,
+            "achievable_hit_rate": 0.5,
+            "saturated": False
+        }
+
+    def test_key_stats_bounded(self):
+        stats = GenerationKeyStats(max_tracked=3)
+        for i in range(10):
+            stats.record("module", ("t", i), i)
+
+        result = stats.stats()["module"]
+        assert (result["requests"], result["raw_distinct"], result["canonical_distinct"]) == (10, 3, 3)
+        assert result["saturated"] is True
+
+
+class TestCanonicalGeneration:
+    """Test that equivalent requests share one generation"""
+
+    @pytest.mark.asyncio
+    async def test_revision_concept_order_and_case(self, adk_service):
+        adk_service.client = FakeClient(LOOPS_AND_ARRAYS_JSON)
+        for concepts in (["arrays", "Loops"], ["loops", "arrays"]):
+            await adk_service.generate_revision_content(
+                domain=DomainType.DSA,
+                weak_concepts=concepts,
+                module_id="module_1",
+                user_id="test_user"
+            )
+
+        assert adk_service.client.calls == 1
+        assert generation_keys.stats()["revision"]["raw_distinct"] == 2
+        assert generation_keys.stats()["revision"]["canonical_distinct"] == 1
+
+    @pytest.mark.asyncio
+    async def test_module_topic_spelling_shares_generation(self, adk_service):
+        adk_service.client = FakeClient(MODULE_JSON)
+        modules = [
+            await adk_service.generate_learning_module(
+                domain=DomainType.DSA,
+                topic=topic,
+                skill_level=SkillLevel.BEGINNER,
+                format_preference="text",
+                weak_concepts=[],
+                user_id="test_user",
+                module_id=module_id
+            )
+            for topic, module_id in (("Binary Search Trees ", "bst_1"), ("binary search trees", "bst_2"))
+        ]
+
+        assert adk_service.client.calls == 1
+        assert [m.module_id for m in modules] == ["bst_1", "bst_2"]
+        assert modules[0].title == modules[1].title == "Binary Search Trees"
+
+    @pytest.mark.asyncio
+    async def test_prompt_keeps_highest_priority_concepts(self, adk_service):
+        prompts = []
+
+        async def generate_content_async(prompt, generation_config=None):
+            prompts.append(prompt)
+            return FakeResponse(MODULE_JSON)
+
+        adk_service.client.generate_content_async = generate_content_async
+        weak_concepts = ["zeta recursion", "yak", "xray"] + [f"concept {i:02d}" for i in range(10)]
+        await adk_service.generate_learning_module(
+            domain=DomainType.DSA,
+            topic="Recursion",
+            skill_level=SkillLevel.BEGINNER,
+            format_preference="text",
+            weak_concepts=weak_concepts,
+            user_id="test_user"
+        )
+
+        assert "zeta recursion" in prompts[0]
+        assert "concept 09" not in prompts[0]
@@ -0,0 +1,26 @@
+"""
+Test Suite for Cold Start Import Budget
+"""
+import os
+import subprocess
+import sys
+
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def test_main_import_defers_heavy_modules():
+    """Importing the app must not load the LLM SDK, NumPy or the server"""
+    code = (
+        "import sys, main; "
+        "print(','.join(m for m in ('google.generativeai', 'numpy', 'uvicorn') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=BACKEND_DIR,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    assert result.stdout.strip() == ""
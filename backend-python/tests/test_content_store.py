@@ -0,0 +1,163 @@
+"""
+Test Suite for the Content Store and Pregeneration CLI
+"""
+import argparse
+import importlib.util
+import json
+import os
+import threading
+import pytest
+from app.core.cache import ResponseCache
+from app.core.content_store import ContentStore
+from app.models.quiz_models import DomainType, SkillLevel, RevisionData
+from tests.conftest import FakeClient
+
+
+MODULE_JSON = '{"title": "Graphs Deep Dive", "tldr": "Nodes and edges", "key_concepts": ["bfs"], "examples": ["maps"]}'
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def load_pregenerate():
+    spec = importlib.util.spec_from_file_location(
+        "pregenerate", os.path.join(BACKEND_DIR, "scripts", "pregenerate.py")
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = ContentStore(str(tmp_path / "content.db"))
+    yield store
+    store.close()
+
+
+@pytest.fixture
+def adk_service(make_adk_service, store):
+    return make_adk_service(FakeClient(MODULE_JSON), store=store)
+
+
+async def generate_module(service):
+    return await service.generate_learning_module(
+        domain=DomainType.DSA,
+        topic="Graphs",
+        skill_level=SkillLevel.BEGINNER,
+        format_preference="text",
+        weak_concepts=[],
+        user_id="test_user_123"
+    )
+
+
+class TestContentStore:
+    """Test persistence and lookup of generated content"""
+
+    def test_round_trip(self, store):
+        value = [RevisionData(concept="arrays", explanation="Indexed storage", examples=["a[0]"])]
+        store.put("revision", "key1", value)
+
+        assert store.get("revision", "key1") == value
+        assert store.get("module", "key1") is None
+        assert store.count() == 1
+
+    def test_missing_file_is_not_created(self, tmp_path):
+        path = tmp_path / "absent.db"
+        store = ContentStore(str(path))
+
+        assert store.get("module", "key") is None
+        assert not path.exists()
+
+    def test_disabled_with_empty_path(self):
+        store = ContentStore("")
+        store.put("revision", "key", [])
+
+        assert store.get("revision", "key") is None
+
+    @pytest.mark.asyncio
+    async def test_persisted_generation_served_from_store(self, adk_service, store):
+        adk_service.persist_generated = True
+        generated = await generate_module(adk_service)
+
+        # A fresh process: empty memory cache, same store
+        adk_service.cache = ResponseCache(max_entries=16)
+        adk_service.client = FakeClient("not json")
+        served = await generate_module(adk_service)
+
+        assert served == generated
+        assert served.title == "Graphs Deep Dive"
+        assert adk_service.client.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_store_read_off_the_loop(self, adk_service, store):
+        get = store.get
+        threads = []
+
+        def tracking_get(kind, key):
+            threads.append(threading.get_ident())
+            return get(kind, key)
+
+        store.get = tracking_get
+        await generate_module(adk_service)
+
+        assert threads and threading.get_ident() not in threads
+
+    @pytest.mark.asyncio
+    async def test_generation_not_persisted_by_default(self, adk_service, store):
+        await generate_module(adk_service)
+
+        assert store.count() == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_raised_without_fallback(self, adk_service):
+        adk_service.client = FakeClient("not json")
+        adk_service.fallback_on_error = False
+
+        with pytest.raises(ValueError):
+            await generate_module(adk_service)
+
+
+class TestPregenerate:
+    """Test manifest expansion and checkpointed runs"""
+
+    def test_manifest_expansion(self, tmp_path):
+        pregenerate = load_pregenerate()
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text(json.dumps({
+            "modules": [
+                {"domain": "dsa", "topic": ["Arrays", "Graphs"], "skill_level": ["beginner", "advanced"]},
+                {"domain": "dsa", "topic": "Arrays", "skill_level": "beginner"}
+            ],
+            "roadmaps": [{"domain": ["dsa", "ai-ml"], "skill_level": "beginner"}]
+        }))
+
+        items = pregenerate.load_manifest(str(manifest))
+
+        assert len([i for i in items if i["kind"] == "module"]) == 4
+        assert len([i for i in items if i["kind"] == "roadmap"]) == 2
+        assert all(i["format_preference"] == "mixed" for i in items if i["kind"] == "module")
+
+    @pytest.mark.asyncio
+    async def test_run_checkpoints_and_resumes(self, tmp_path, adk_service, monkeypatch):
+        pregenerate = load_pregenerate()
+        monkeypatch.setattr(pregenerate, "ADKAgentService", lambda: adk_service)
+        manifest = tmp_path / "manifest.json"
+        manifest.write_text(json.dumps({
+            "modules": [{"domain": "dsa", "topic": ["Arrays", "Graphs"], "skill_level": "beginner"}]
+        }))
+        args = argparse.Namespace(
+            manifest=str(manifest),
+            store=str(tmp_path / "pregenerated.db"),
+            checkpoint=None,
+            concurrency=2,
+            timeout=5.0,
+            force=False
+        )
+
+        assert await pregenerate.run(args) == 0
+        assert adk_service.client.calls == 2
+        assert len(pregenerate.load_checkpoint(f"{manifest}.checkpoint")) == 2
+        assert ContentStore(args.store).count("module") == 2
+
+        assert await pregenerate.run(args) == 0
+        assert adk_service.client.calls == 2
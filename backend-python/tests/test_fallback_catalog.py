@@ -0,0 +1,60 @@
+"""
+Test Suite for Fallback Catalog
+"""
+from app.services.fallback_catalog import FallbackCatalog, fallback_catalog
+from app.models.quiz_models import DomainType, SkillLevel
+
+
+class TestFallbackCatalog:
+    """Test the prebuilt mock roadmap, revision and module content"""
+
+    def test_roadmap_keeps_authored_order_without_weaknesses(self):
+        topics = fallback_catalog.roadmap(DomainType.DSA, SkillLevel.BEGINNER, [])
+
+        assert [t.topic_id for t in topics] == ["dsa_1", "dsa_2", "dsa_3"]
+
+    def test_roadmap_puts_weakness_topics_first(self):
+        topics = fallback_catalog.roadmap(
+            DomainType.DSA, SkillLevel.INTERMEDIATE, ["Stack Operations"]
+        )
+
+        assert [t.topic_id for t in topics] == ["dsa_3", "dsa_1", "dsa_2"]
+
+    def test_roadmap_matches_topic_name_words(self):
+        topics = fallback_catalog.roadmap(DomainType.WEB_DEV, SkillLevel.BEGINNER, ["javascript"])
+
+        assert topics[0].topic_id == "web_2"
+
+    def test_advanced_moves_beginner_topics_last(self):
+        topics = fallback_catalog.roadmap(DomainType.DSA, SkillLevel.ADVANCED, [])
+
+        assert topics[-1].difficulty == "beginner"
+
+    def test_roadmap_reuses_prebuilt_topics(self):
+        first = fallback_catalog.roadmap(DomainType.AI_ML, SkillLevel.BEGINNER, [])
+        second = fallback_catalog.roadmap(DomainType.AI_ML, SkillLevel.BEGINNER, ["regression"])
+
+        assert {id(t) for t in first} == {id(t) for t in second}
+
+    def test_roadmap_capped_at_five_topics(self):
+        catalog = FallbackCatalog()
+        key = (DomainType.DSA, SkillLevel.BEGINNER)
+        catalog._roadmaps[key] = catalog._roadmaps[key] * 3
+        catalog._term_index[key] = catalog._index_terms(catalog._roadmaps[key])
+
+        assert len(catalog.roadmap(DomainType.DSA, SkillLevel.BEGINNER, [])) == 5
+        assert len(catalog.roadmap(DomainType.DSA, SkillLevel.BEGINNER, ["deque"])) == 5
+
+    def test_revisions_cover_first_three_concepts(self):
+        revisions = fallback_catalog.revisions(["a", "b", "c", "d"])
+
+        assert [r.concept for r in revisions] == ["a", "b", "c"]
+        assert fallback_catalog.revisions(["a"])[0] is revisions[0]
+
+    def test_module_memoized_per_topic_and_format(self):
+        video = fallback_catalog.module("Graphs", "video")
+
+        assert video.module_id == "module_graphs"
+        assert video.video_links
+        assert fallback_catalog.module("Graphs", "video") is video
+        assert fallback_catalog.module("Graphs", "text").video_links == []
@@ -0,0 +1,176 @@
+"""
+Test Suite for Background Jobs
+"""
+import asyncio
+import httpx
+import pytest
+from app.api.dependencies import get_job_queue
+from app.models.quiz_models import JobState
+from app.services.job_queue import JobQueue, JobQueueFull
+from main import app
+
+
+MODULE_QUIZ = {
+    "quiz_form": "module-quiz",
+    "domain": "dsa",
+    "user_id": "test_user_123",
+    "module_id": "module_arrays",
+    "total_time": 120.0,
+    "question_time": [30.0, 30.0, 30.0, 30.0],
+    "num_option_changes": [0, 1, 3, 0],
+    "answers": [{"q": 1}, {"q": 2}, {"q": 3}, {"q": 4}],
+    "correct_answers": [True, False, False, False],
+    "concepts": ["arrays", "recursion", "graphs", "arrays"]
+}
+
+
+async def wait_for(queue: JobQueue, job_id: str):
+    for _ in range(200):
+        job = queue.get(job_id)
+        if job.state in (JobState.SUCCEEDED, JobState.FAILED):
+            return job
+        await asyncio.sleep(0.005)
+    raise AssertionError("job did not finish")
+
+
+class TestJobQueue:
+    """Test the worker pool, queue bound and TTL eviction"""
+
+    @pytest.mark.asyncio
+    async def test_runs_job_and_keeps_result(self):
+        queue = JobQueue(workers=2)
+
+        async def work():
+            return 42
+
+        job = queue.submit("test", work)
+        assert job.state == JobState.QUEUED
+
+        finished = await wait_for(queue, job.job_id)
+        assert finished.result == 42
+        assert finished.finished_at is not None
+        queue.close()
+
+    @pytest.mark.asyncio
+    async def test_failure_recorded(self):
+        queue = JobQueue(workers=1)
+
+        async def work():
+            raise RuntimeError("provider down")
+
+        job = await wait_for(queue, queue.submit("test", work).job_id)
+
+        assert job.state == JobState.FAILED
+        assert job.error == "provider down"
+        assert queue.stats()["failed"] == 1
+        queue.close()
+
+    @pytest.mark.asyncio
+    async def test_rejects_when_full(self):
+        queue = JobQueue(workers=1, max_pending=2)
+        release = asyncio.Event()
+
+        async def work():
+            await release.wait()
+
+        queue.submit("test", work)
+        await asyncio.sleep(0)  # the worker takes the first job
+        queue.submit("test", work)
+        queue.submit("test", work)
+
+        with pytest.raises(JobQueueFull):
+            queue.submit("test", work)
+        assert queue.stats()["rejected"] == 1
+
+        release.set()
+        queue.close()
+
+    @pytest.mark.asyncio
+    async def test_finished_jobs_evicted_after_ttl(self):
+        queue = JobQueue(workers=1, ttl=0.02)
+
+        async def work():
+            return "done"
+
+        job = await wait_for(queue, queue.submit("test", work).job_id)
+        await asyncio.sleep(0.03)
+
+        assert queue.get(job.job_id) is None
+        assert queue.stats()["evicted"] == 1
+        queue.close()
+
+
+class TestAsyncRoutes:
+    """Test ?async=true submission and GET /jobs/{id}"""
+
+    @pytest.fixture
+    def job_queue(self):
+        queue = JobQueue(workers=2)
+        app.dependency_overrides[get_job_queue] = lambda: queue
+        yield queue
+        app.dependency_overrides.pop(get_job_queue, None)
+        queue.close()
+
+    @pytest.fixture
+    def client(self):
+        return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+    @pytest.mark.asyncio
+    async def test_module_quiz_returns_score_and_job(self, client, job_queue):
+        async with client:
+            response = await client.post("/api/v1/quiz/submit?async=true", json=MODULE_QUIZ)
+            body = response.json()
+
+            assert response.status_code == 200
+            assert body["score"] == 0.25
+            assert body["data"] is None
+            assert body["next_action"] == "complete_revision_before_proceeding"
+
+            await wait_for(job_queue, body["job_id"])
+            job = (await client.get(f"/api/v1/jobs/{body['job_id']}")).json()
+
+        assert job["state"] == "succeeded"
+        assert job["kind"] == "revision"
+        assert {r["concept"] for r in job["result"]} <= set(body["weak_concepts"])
+
+    @pytest.mark.asyncio
+    async def test_full_queue_answers_module_quiz_inline(self, client):
+        queue = JobQueue(workers=1, max_pending=0)
+        app.dependency_overrides[get_job_queue] = lambda: queue
+        try:
+            async with client:
+                response = await client.post("/api/v1/quiz/submit?async=true", json=MODULE_QUIZ)
+        finally:
+            app.dependency_overrides.pop(get_job_queue, None)
+            queue.close()
+        body = response.json()
+
+        assert response.status_code == 200
+        assert body["job_id"] is None
+        assert body["data"]
+        assert queue.stats()["rejected"] == 1
+
+    @pytest.mark.asyncio
+    async def test_learning_generate_accepted(self, client, job_queue):
+        request = {
+            "user_id": "test_user_123",
+            "domain": "dsa",
+            "topic": "Heaps",
+            "skill_level": "beginner"
+        }
+        async with client:
+            response = await client.post("/api/v1/learning/generate?async=true", json=request)
+
+            assert response.status_code == 202
+            job_id = response.json()["job_id"]
+            await wait_for(job_queue, job_id)
+            job = (await client.get(f"/api/v1/jobs/{job_id}")).json()
+
+        assert job["result"]["module"]["title"] == "Mastering Heaps"
+
+    @pytest.mark.asyncio
+    async def test_unknown_job_is_404(self, client, job_queue):
+        async with client:
+            response = await client.get("/api/v1/jobs/missing")
+
+        assert response.status_code == 404
@@ -0,0 +1,179 @@
+"""
+Test Suite for Streaming Learning Content
+"""
+import asyncio
+import json
+import httpx
+import pytest
+from app.api.dependencies import get_learning_service
+from app.core.json_stream import IncrementalObjectParser
+from app.core.rate_limiter import OutboundLimiter
+from app.services.learning_service import LearningService
+from app.services.llm_providers import StubProvider
+from app.models.quiz_models import DomainType, SkillLevel, LearningModule
+from main import app
+
+
+MODULE_JSON = json.dumps({
+    "title": "Binary Search",
+    "tldr": "Halve the {search} space, \"quickly\"",
+    "text_content": "Sorted input, compare with the middle element",
+    "key_concepts": ["midpoint", "invariants"],
+    "examples": ["search [1, 3, 5]"],
+    "practice_exercises": ["lower bound"],
+    "video_links": [{"title": "Intro", "url": "#", "duration": "5 min"}],
+    "additional_resources": []
+})
+
+
+class FakeChunk:
+    def __init__(self, text):
+        self.text = text
+
+
+class FakeStream:
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for chunk in self.chunks:
+            yield FakeChunk(chunk)
+
+
+class FakeStreamingClient:
+    """Stand-in for the Gemini client that streams fixed-size chunks"""
+
+    def __init__(self, text, chunk_size=7):
+        self.chunks = [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+        self.calls = 0
+
+    async def generate_content_async(self, prompt, generation_config=None, stream=False):
+        self.calls += 1
+        return FakeStream(self.chunks)
+
+
+@pytest.fixture
+def adk_service(make_adk_service):
+    return make_adk_service(FakeStreamingClient("```json\n" + MODULE_JSON + "\n```"))
+
+
+async def collect(adk_service):
+    events = []
+    async for event in adk_service.stream_learning_module(
+        domain=DomainType.DSA,
+        topic="Binary Search",
+        skill_level=SkillLevel.INTERMEDIATE,
+        format_preference="text",
+        weak_concepts=[],
+        user_id="u1"
+    ):
+        events.append(event)
+    return events
+
+
+class TestIncrementalObjectParser:
+    """Test member-by-member JSON parsing"""
+
+    def test_members_complete_in_order_across_chunks(self):
+        parser = IncrementalObjectParser()
+        members = []
+        for char in "```json\n" + MODULE_JSON:
+            members.extend(parser.feed(char))
+
+        assert parser.done
+        assert [name for name, _ in members] == list(json.loads(MODULE_JSON))
+        assert dict(members) == json.loads(MODULE_JSON)
+
+    def test_member_not_emitted_until_closed(self):
+        parser = IncrementalObjectParser()
+
+        assert parser.feed('{"title": "A", "key_concepts": ["x", ') == [("title", "A")]
+        assert parser.feed('"y"]') == []
+        assert parser.feed(', "n": 3}') == [("key_concepts", ["x", "y"]), ("n", 3)]
+
+
+class TestStreamLearningModule:
+    """Test streamed module generation"""
+
+    @pytest.mark.asyncio
+    async def test_streams_fields_then_validated_module(self, adk_service):
+        events = await collect(adk_service)
+
+        fields = [payload for event, payload in events if event == "field"]
+        assert fields[0] == ("title", "Binary Search")
+        assert ("key_concepts", ["midpoint", "invariants"]) in fields
+
+        event, module = events[-1]
+        assert event == "module"
+        assert isinstance(module, LearningModule)
+        assert module.tldr == 'Halve the {search} space, "quickly"'
+
+    @pytest.mark.asyncio
+    async def test_streamed_module_is_cached(self, adk_service):
+        await collect(adk_service)
+        events = await collect(adk_service)
+
+        assert adk_service.client.calls == 1
+        assert events[-1][1].title == "Binary Search"
+
+    @pytest.mark.asyncio
+    async def test_broken_stream_falls_back_to_mock(self, adk_service):
+        adk_service.client = FakeStreamingClient('{"title": "Binary Search", oops')
+        events = await collect(adk_service)
+
+        assert events[0] == ("field", ("title", "Binary Search"))
+        assert events[-1][1].title == "Mastering Binary Search"
+
+    @pytest.mark.asyncio
+    async def test_slot_not_held_while_reader_is_paused(self, adk_service):
+        adk_service.limiter = OutboundLimiter(max_concurrency=1, max_retries=0)
+        paused = adk_service.stream_learning_module(
+            domain=DomainType.DSA,
+            topic="Binary Search",
+            skill_level=SkillLevel.INTERMEDIATE,
+            format_preference="text",
+            weak_concepts=[],
+            user_id="u1"
+        )
+        assert (await paused.__anext__())[0] == "field"
+        await asyncio.sleep(0)
+
+        adk_service.cache.clear()
+        events = await asyncio.wait_for(collect(adk_service), timeout=1.0)
+        await paused.aclose()
+
+        assert adk_service.limiter.in_flight == 0
+        assert events[-1][1].title == "Binary Search"
+        assert adk_service.client.calls == 2
+
+
+class TestLearningRoute:
+    """Test POST /learning/generate against the stub provider"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("stream, sectioned", [(False, False), (True, False), (False, True)])
+    async def test_weak_concepts_optional(self, make_adk_service, stream, sectioned):
+        service = make_adk_service(
+            StubProvider(latency_ms=0.0), sectioned_modules=sectioned, fallback_on_error=False
+        )
+        app.dependency_overrides[get_learning_service] = lambda: LearningService(adk_service=service)
+        request = {"user_id": "u1", "domain": "dsa", "topic": "Arrays", "skill_level": "beginner"}
+        try:
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                response = await client.post(f"/api/v1/learning/generate?stream={str(stream).lower()}", json=request)
+        finally:
+            app.dependency_overrides.pop(get_learning_service, None)
+
+        assert response.status_code == 200
+        if stream:
+            assert "event: error" not in response.text
+            complete = response.text.split("event: complete\ndata: ")[1]
+            body = json.loads(complete)
+        else:
+            body = response.json()
+        assert body["module"]["title"] == "Stub Module"
@@ -0,0 +1,199 @@
+"""
+Test Suite for LLM Providers
+"""
+import asyncio
+import statistics
+import threading
+import pytest
+from app.core.config import settings
+from app.core.rate_limiter import OutboundLimiter, is_retryable
+from app.models.quiz_models import DomainType, SkillLevel
+from app.services.llm_providers import (
+    LLMProvider,
+    RecordingProvider,
+    ReplayMissError,
+    ReplayProvider,
+    StubProvider,
+    StubProviderError,
+    create_provider
+)
+from app.services.prompt_templates import module_prompt, prompt_kind, revision_prompt
+
+
+@pytest.fixture
+def service_with(make_adk_service):
+    def make(provider):
+        return make_adk_service(provider, limiter=OutboundLimiter(max_concurrency=64, max_retries=0))
+    return make
+
+
+class TestStubProvider:
+    """Test canned responses, synthetic latency and injected errors"""
+
+    def test_prompt_kind(self):
+        assert prompt_kind(revision_prompt("dsa", ["arrays"], "m1").text) == "revision"
+        assert prompt_kind(module_prompt("dsa", "bst", "beginner", "text", []).text) == "module"
+        assert prompt_kind("hello") is None
+
+    @pytest.mark.parametrize("distribution", ["uniform", "normal", "lognormal"])
+    def test_latency_distribution_mean(self, distribution):
+        stub = StubProvider(latency_ms=100.0, jitter_ms=20.0, distribution=distribution)
+        draws = [stub.latency() for _ in range(4000)]
+
+        assert statistics.mean(draws) == pytest.approx(0.1, rel=0.03)
+        assert min(draws) >= 0.0
+
+    def test_seeded_draws_repeat(self):
+        first = StubProvider(seed=7)
+        second = StubProvider(seed=7)
+
+        assert [first.latency() for _ in range(5)] == [second.latency() for _ in range(5)]
+
+    @pytest.mark.asyncio
+    async def test_injected_errors_are_retryable(self):
+        stub = StubProvider(latency_ms=0.0, error_rate=1.0, error_code=429)
+
+        with pytest.raises(StubProviderError) as error:
+            await stub.generate_content_async("prompt")
+        assert is_retryable(error.value)
+        assert stub.stats() == {"provider": "stub", "calls": 1, "errors": 1}
+
+    @pytest.mark.asyncio
+    async def test_service_runs_offline_on_stub(self, service_with):
+        service = service_with(StubProvider(latency_ms=1.0, jitter_ms=0.5))
+
+        roadmap = await service.generate_roadmap(
+            domain=DomainType.DSA,
+            skill_level=SkillLevel.BEGINNER,
+            proficiency_score=0.4,
+            strengths=[],
+            weaknesses=["arrays"],
+            behavioral_profile={},
+            user_id="u1"
+        )
+        revisions = await service.generate_revision_content(
+            domain=DomainType.DSA, weak_concepts=["loops", "arrays"], module_id="m1", user_id="u1"
+        )
+
+        assert roadmap[0].topic_name == "Stub Topic 1"
+        assert [r.explanation for r in revisions] == [
+            "Canned explanation of loops", "Canned explanation of arrays"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_canned_response_override_and_stream(self):
+        stub = StubProvider(latency_ms=0.0, responses={"module": '{"title": "Custom"}' * 10})
+        prompt = module_prompt("dsa", "bst", "beginner", "text", []).text
+
+        chunks = [chunk.text async for chunk in await stub.generate_content_async(prompt, stream=True)]
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == '{"title": "Custom"}' * 10
+
+
+class TestRecordReplay:
+    """Test that recorded runs replay exactly"""
+
+    @pytest.mark.asyncio
+    async def test_replay_reproduces_recorded_run(self, tmp_path):
+        path = str(tmp_path / "recordings.jsonl")
+        config = {"temperature": 0.7, "max_output_tokens": 2000}
+        recorder = RecordingProvider(StubProvider(latency_ms=0.0), path)
+        prompts = [revision_prompt("dsa", [c], "m1").text for c in ("arrays", "loops")]
+        recorded = [(await recorder.generate_content_async(p, generation_config=config)).text for p in prompts]
+        recorder.close()
+
+        replay = ReplayProvider(path)
+        replayed = await asyncio.gather(*[
+            replay.generate_content_async(p, generation_config=config) for p in reversed(prompts)
+        ])
+
+        assert [r.text for r in reversed(replayed)] == recorded
+        assert replay.stats() == {"provider": "replay", "recorded": 2, "hits": 2, "misses": 0}
+        with pytest.raises(ReplayMissError):
+            await replay.generate_content_async(prompts[0], generation_config={"temperature": 0.1})
+
+    @pytest.mark.asyncio
+    async def test_streams_are_recorded_whole(self, tmp_path):
+        path = str(tmp_path / "recordings.jsonl")
+        prompt = module_prompt("dsa", "bst", "beginner", "text", []).text
+        recorder = RecordingProvider(StubProvider(latency_ms=0.0), path)
+        streamed = "".join([c.text async for c in await recorder.generate_content_async(prompt, stream=True)])
+        recorder.close()
+
+        replayed = await ReplayProvider(path).generate_content_async(prompt)
+
+        assert replayed.text == streamed
+        assert recorder.stats()["recorded"] == 1
+
+    @pytest.mark.asyncio
+    async def test_recording_does_not_write_on_the_loop(self, tmp_path, monkeypatch):
+        path = tmp_path / "recordings.jsonl"
+        recorder = RecordingProvider(StubProvider(latency_ms=0.0), str(path))
+        loop_thread = threading.get_ident()
+        writers = []
+        real_open = open
+
+        def tracking_open(*args, **kwargs):
+            writers.append(threading.get_ident())
+            return real_open(*args, **kwargs)
+
+        monkeypatch.setattr("builtins.open", tracking_open)
+        for concept in ("arrays", "loops", "trees"):
+            await recorder.generate_content_async(revision_prompt("dsa", [concept], "m1").text)
+        recorder.close()
+
+        assert writers and loop_thread not in writers
+        assert recorder.stats()["recorded"] == 3
+        assert len(path.read_text().splitlines()) == 3
+
+    @pytest.mark.asyncio
+    async def test_recorded_after_close(self, tmp_path):
+        path = tmp_path / "recordings.jsonl"
+        recorder = RecordingProvider(StubProvider(latency_ms=0.0), str(path))
+        prompts = [revision_prompt("dsa", [c], "m1").text for c in ("arrays", "loops")]
+        await recorder.generate_content_async(prompts[0])
+        recorder.close()
+
+        await recorder.generate_content_async(prompts[1])
+
+        assert recorder.stats()["recorded"] == 2
+        assert ReplayProvider(str(path)).stats()["recorded"] == 2
+
+    def test_providers_must_implement_generate(self):
+        class Incomplete(LLMProvider):
+            pass
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+    @pytest.mark.asyncio
+    async def test_service_falls_back_on_replay_miss(self, tmp_path, service_with):
+        path = tmp_path / "recordings.jsonl"
+        path.write_text("")
+        service = service_with(ReplayProvider(str(path)))
+
+        revisions = await service.generate_revision_content(
+            domain=DomainType.DSA, weak_concepts=["arrays"], module_id="m1", user_id="u1"
+        )
+
+        assert revisions[0].explanation.startswith("Detailed explanation of arrays")
+
+
+class TestCreateProvider:
+    """Test provider selection from settings"""
+
+    def test_gemini_without_key_is_disabled(self, monkeypatch):
+        monkeypatch.setattr(settings, "GEMINI_API_KEY", "")
+        assert create_provider("gemini") is None
+
+    def test_stub_wrapped_for_recording(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(settings, "LLM_RECORD_PATH", str(tmp_path / "rec.jsonl"))
+        provider = create_provider("stub")
+
+        assert isinstance(provider, RecordingProvider)
+        assert provider.stats()["provider"] == "stub+record"
+
+    def test_unknown_provider(self):
+        with pytest.raises(ValueError):
+            create_provider("openai")
@@ -0,0 +1,99 @@
+"""
+Test Suite for Structured Logging
+"""
+import json
+import logging
+import pytest
+from app.core.log import LogWriter
+
+
+@pytest.fixture
+def writer(tmp_path):
+    writer = LogWriter(str(tmp_path / "app.log"), max_bytes=0, flush_interval=0.05)
+    logger = logging.getLogger("neurolearn.test_log")
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    logger.addHandler(writer.handler)
+    writer.start()
+    yield writer, logger
+    logger.removeHandler(writer.handler)
+    writer.stop()
+
+
+def read_lines(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+class TestLogWriter:
+    """Test the background JSON-lines writer"""
+
+    def test_records_written_as_json_lines(self, writer):
+        log_writer, logger = writer
+        logger.info("module generated", extra={"kind": "module", "cached": False})
+        logger.warning("user %s retried", "u1")
+        log_writer.stop()
+
+        lines = read_lines(log_writer.path)
+        assert lines[0]["message"] == "module generated"
+        assert lines[0]["level"] == "INFO"
+        assert lines[0]["kind"] == "module"
+        assert lines[0]["cached"] is False
+        assert lines[1]["message"] == "user u1 retried"
+
+    def test_exception_text_is_kept(self, writer):
+        log_writer, logger = writer
+        try:
+            raise ValueError("bad json")
+        except ValueError as e:
+            logger.error("parse failed", exc_info=e)
+        log_writer.stop()
+
+        entry = read_lines(log_writer.path)[0]
+        assert entry["message"] == "parse failed"
+        assert entry["exception"].startswith("Traceback")
+        assert entry["exception"].endswith("ValueError: bad json")
+
+    def test_autostart_on_first_record(self, tmp_path):
+        log_writer = LogWriter(str(tmp_path / "lazy.log"), flush_interval=0.05, autostart=True)
+        logger = logging.getLogger("neurolearn.test_autostart")
+        logger.propagate = False
+        logger.addHandler(log_writer.handler)
+        assert log_writer._thread is None
+
+        logger.warning("first")
+        log_writer.stop()
+        logger.removeHandler(log_writer.handler)
+
+        assert read_lines(log_writer.path)[0]["message"] == "first"
+
+    def test_size_based_rotation(self, tmp_path):
+        path = str(tmp_path / "rotating.log")
+        log_writer = LogWriter(path, max_bytes=200, backup_count=2, batch_size=1, flush_interval=0.05)
+        logger = logging.getLogger("neurolearn.test_rotation")
+        logger.propagate = False
+        logger.addHandler(log_writer.handler)
+        log_writer.start()
+
+        for idx in range(20):
+            logger.warning("entry %d %s", idx, "x" * 50)
+        log_writer.stop()
+        logger.removeHandler(log_writer.handler)
+
+        assert (tmp_path / "rotating.log.1").exists()
+        assert (tmp_path / "rotating.log.2").exists()
+        assert not (tmp_path / "rotating.log.3").exists()
+        assert log_writer.written == 20
+
+    def test_full_queue_drops_instead_of_blocking(self, tmp_path):
+        log_writer = LogWriter(str(tmp_path / "full.log"), queue_size=2)
+        logger = logging.getLogger("neurolearn.test_full")
+        logger.propagate = False
+        logger.addHandler(log_writer.handler)
+
+        # Writer thread not started, so nothing drains the queue
+        for idx in range(5):
+            logger.warning("entry %d", idx)
+        logger.removeHandler(log_writer.handler)
+
+        assert log_writer.dropped == 3
@@ -0,0 +1,185 @@
+"""
+Test Suite for the Learner Profile Store
+"""
+import statistics
+import pytest
+from app.services.profile_store import ProfileStore, RunningStats
+from app.services.quiz_service import QuizService
+from app.services.quiz_stats import QuizStats
+from app.models.quiz_models import QuizSubmissionRequest, QuizFormType, DomainType
+
+
+def module_quiz(user_id, correct_answers, concepts, question_time=None, option_changes=None):
+    count = len(concepts)
+    question_time = question_time or [30.0] * count
+    return QuizSubmissionRequest(
+        quiz_form=QuizFormType.MODULE_QUIZ,
+        domain=DomainType.DSA,
+        user_id=user_id,
+        module_id="module_1",
+        total_time=sum(question_time),
+        question_time=question_time,
+        num_option_changes=option_changes or [0] * count,
+        answers=[{"question_id": f"q{i}"} for i in range(count)],
+        correct_answers=correct_answers,
+        concepts=concepts
+    )
+
+
+def stats_for(correct_answers, concepts):
+    return QuizStats.from_request(module_quiz("user", correct_answers, concepts))
+
+
+class TestProfileStore:
+    """Test running tallies, persistence and the LRU tier"""
+
+    def test_record_accumulates_tallies(self):
+        store = ProfileStore()
+        store.record("u1", stats_for([True, False], ["arrays", "graphs"]))
+        profile = store.record("u1", stats_for([True, True], ["arrays", "arrays"]))
+
+        assert profile.quiz_count == 2
+        assert profile.concept_tallies == {"arrays": [3, 3], "graphs": [1, 0]}
+        assert profile.mastery("arrays") == 1.0
+        assert profile.mastery("trees") is None
+
+    def test_profiles_are_per_user(self):
+        store = ProfileStore()
+        store.record("u1", stats_for([True], ["arrays"]))
+
+        assert store.get("u2").concept_tallies == {}
+
+    def test_persisted_across_instances(self, tmp_path):
+        path = str(tmp_path / "profiles.db")
+        store = ProfileStore(path)
+        store.record("u1", stats_for([True, False], ["arrays", "graphs"]))
+        store.record("u1", stats_for([False], ["graphs"]))
+        store.close()
+
+        profile = ProfileStore(path).get("u1")
+
+        assert profile.quiz_count == 2
+        assert profile.concept_tallies == {"arrays": [1, 1], "graphs": [2, 0]}
+
+    def test_evicted_profile_reloaded_from_sqlite(self):
+        store = ProfileStore(cache_size=1)
+        store.record("u1", stats_for([True], ["arrays"]))
+        store.record("u2", stats_for([False], ["arrays"]))
+
+        assert store.stats()["cached_profiles"] == 1
+        assert store.get("u1").concept_tallies == {"arrays": [1, 1]}
+        assert store.stats()["loads"] == 3
+
+
+class TestRunningStats:
+    """Test merging per-submission summaries into a running baseline"""
+
+    def test_merge_matches_full_history(self):
+        samples = [[12.0, 30.0, 45.5], [8.0], [20.0, 22.0, 90.0, 41.0]]
+        running = RunningStats()
+        for sample in samples:
+            stdev = statistics.stdev(sample) if len(sample) > 1 else 0.0
+            running.merge(len(sample), statistics.mean(sample), stdev, min(sample), max(sample))
+
+        history = [value for sample in samples for value in sample]
+        assert running.count == len(history)
+        assert running.mean == pytest.approx(statistics.mean(history))
+        assert running.stdev == pytest.approx(statistics.stdev(history))
+        assert (running.min, running.max) == (8.0, 90.0)
+
+    def test_empty_sample_ignored(self):
+        running = RunningStats()
+        running.merge(0, 0.0, 0.0, 0.0, 0.0)
+
+        assert running.count == 0
+        assert running.stdev == 0.0
+
+    def test_baselines_persisted(self, tmp_path):
+        path = str(tmp_path / "profiles.db")
+        store = ProfileStore(path)
+        store.record("u1", QuizStats.from_request(
+            module_quiz("u1", [True, True], ["arrays", "graphs"], [10.0, 50.0], [0, 3])
+        ))
+        expected = store.get("u1").time_per_question
+        store.close()
+
+        profile = ProfileStore(path).get("u1")
+
+        assert profile.time_per_question == expected
+        assert profile.option_changes.max == 3
+
+
+class TestBehaviorBaseline:
+    """Test this-quiz-vs-history deltas in behavioral analysis"""
+
+    @pytest.mark.asyncio
+    async def test_no_baseline_for_first_quiz(self):
+        quiz_service = QuizService(profile_store=ProfileStore())
+
+        analysis = await quiz_service.analyze_behavior(module_quiz("u1", [True], ["arrays"]))
+
+        assert analysis["baseline"] is None
+
+    @pytest.mark.asyncio
+    async def test_deltas_against_prior_quizzes(self):
+        quiz_service = QuizService(profile_store=ProfileStore())
+        concepts = ["arrays", "graphs"]
+        await quiz_service.process_module_quiz(
+            module_quiz("u1", [True, True], concepts, [20.0, 40.0], [1, 1])
+        )
+
+        await quiz_service.process_module_quiz(
+            module_quiz("u1", [True, True], concepts, [60.0, 60.0], [2, 4])
+        )
+        baseline = (await quiz_service.analyze_behavior(
+            module_quiz("u1", [True, True], concepts, [45.0, 45.0], [0, 0])
+        ))["baseline"]
+
+        assert baseline["quizzes"] == 2
+        assert baseline["average_time_per_question"] == 45.0
+        assert baseline["time_delta"] == 0.0
+        assert baseline["time_z_score"] == 0.0
+        assert baseline["average_option_changes"] == 2.0
+        assert baseline["option_change_delta"] == -2.0
+
+    @pytest.mark.asyncio
+    async def test_analysis_does_not_record(self):
+        store = ProfileStore()
+        quiz_service = QuizService(profile_store=store)
+
+        await quiz_service.analyze_behavior(module_quiz("u1", [True], ["arrays"]))
+
+        assert store.get("u1").quiz_count == 0
+
+
+class TestCumulativeMastery:
+    """Test that quiz decisions use cumulative concept mastery"""
+
+    @pytest.mark.asyncio
+    async def test_weak_concept_recovers_over_quizzes(self):
+        quiz_service = QuizService(profile_store=ProfileStore())
+        concepts = ["recursion", "arrays"]
+
+        first = await quiz_service.process_module_quiz(module_quiz("u1", [False, True], concepts))
+        assert first.weak_concepts == ["recursion"]
+
+        for _ in range(3):
+            latest = await quiz_service.process_module_quiz(module_quiz("u1", [True, True], concepts))
+
+        # 3 of 4 recursion answers correct overall, though the first quiz missed it
+        assert latest.weak_concepts == []
+        assert latest.strong_concepts == ["recursion", "arrays"]
+
+    @pytest.mark.asyncio
+    async def test_history_from_other_quizzes_counts(self):
+        quiz_service = QuizService(profile_store=ProfileStore())
+        await quiz_service.process_module_quiz(
+            module_quiz("u1", [False, False, False], ["graphs", "graphs", "graphs"])
+        )
+
+        response = await quiz_service.process_module_quiz(
+            module_quiz("u1", [True, True], ["graphs", "arrays"])
+        )
+
+        assert response.weak_concepts == ["graphs"]
+        assert response.score == 1.0
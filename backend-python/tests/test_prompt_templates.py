@@ -0,0 +1,68 @@
+"""
+Test Suite for Compiled Prompt Templates
+"""
+from app.services.prompt_templates import (
+    ROADMAP_PROMPT,
+    MODULE_PROMPT,
+    PromptMetrics,
+    cap_concepts,
+    estimate_tokens,
+    module_prompt,
+    revision_prompt,
+    roadmap_prompt
+)
+
+
+class TestPromptTemplates:
+    """Test prefix stability, concept capping and token estimates"""
+
+    def test_cap_concepts(self):
+        concepts = [" Arrays", "arrays", "", "Graphs", "ARRAYS", "Trees", "Heaps"]
+
+        assert cap_concepts(concepts, 10) == ["Arrays", "Graphs", "Trees", "Heaps"]
+        assert cap_concepts(concepts, 2) == ["Arrays", "Graphs"]
+        assert cap_concepts(None, 5) == []
+
+    def test_static_prefix_shared_across_requests(self):
+        first = roadmap_prompt("dsa", "beginner", 0.2, ["arrays"], ["graphs"], {})
+        second = roadmap_prompt("webdev", "advanced", 0.9, [], [], {"decision_pattern": "quick_decider"})
+
+        assert first.prefix == second.prefix == ROADMAP_PROMPT.prefix
+        assert first.text.startswith(ROADMAP_PROMPT.prefix)
+        assert first.body != second.body
+
+    def test_roadmap_body_includes_only_present_behavior(self):
+        prompt = roadmap_prompt(
+            "dsa", "beginner", 0.42, [], ["graphs", "Graphs"],
+            {"decision_pattern": "quick_decider", "confidence_score": 0.7, "time_management": None}
+        )
+
+        assert "Weaknesses: graphs\n" in prompt.body
+        assert "Strengths: None identified" in prompt.body
+        assert "Decision pattern: quick_decider" in prompt.body
+        assert "Learning style" not in prompt.body
+        assert "confidence" not in prompt.body
+
+    def test_module_and_revision_bodies(self):
+        module = module_prompt("dsa", "Graphs", "beginner", "text", [])
+        revision = revision_prompt("dsa", ["recursion"] * 3, None)
+
+        assert module.prefix == MODULE_PROMPT.prefix
+        assert "Focus areas" not in module.body
+        assert "Weak concepts: recursion\n" in revision.body
+        assert "Module: general" in revision.body
+
+    def test_token_estimates(self):
+        prompt = revision_prompt("dsa", ["arrays"], "m1")
+
+        assert estimate_tokens("abcd" * 10) == 10
+        assert abs(prompt.estimated_tokens - estimate_tokens(prompt.text)) <= 1
+
+    def test_metrics(self):
+        metrics = PromptMetrics()
+        metrics.record(revision_prompt("dsa", ["arrays"], "m1"))
+        metrics.record(revision_prompt("dsa", ["arrays", "graphs", "trees"], "m1"))
+
+        stats = metrics.stats()["revision"]
+        assert stats["prompts"] == 2
+        assert stats["max_tokens"] >= stats["average_tokens"]
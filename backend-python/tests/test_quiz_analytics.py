@@ -0,0 +1,176 @@
+"""
+Test Suite for the quiz_analytics Aggregator
+"""
+import pytest
+from app.models.quiz_models import QuizSubmissionRequest
+from app.services.profile_store import ProfileStore
+from app.services.quiz_service import QuizService
+from app.services.revision_scheduler import RevisionScheduler
+from app.services.quiz_analytics import (
+    AnalyticsBackend,
+    QuizAnalyticsAggregator,
+    SQLiteAnalyticsBackend,
+    create_backend
+)
+
+
+def module_event(user_id="u1", module="module_1", score=80, seconds=100, passed=True, at="2024-01-01T00:00:00+00:00"):
+    return {
+        "event_type": "module_quiz_completed",
+        "user_id": user_id,
+        "timestamp": at,
+        "domain": "dsa",
+        "module": module,
+        "module_index": 1,
+        "score": score,
+        "max_score": 100,
+        "total_time_seconds": seconds,
+        "attempts": 1,
+        "concepts_tested": ["arrays"],
+        "passed": passed,
+        "questions_answered": 5
+    }
+
+
+class CountingBackend(SQLiteAnalyticsBackend):
+    def __init__(self, fail=False):
+        super().__init__(":memory:")
+        self.calls = 0
+        self.fail = fail
+
+    def upsert(self, deltas):
+        self.calls += 1
+        if self.fail:
+            raise ConnectionError("database unavailable")
+        super().upsert(deltas)
+
+
+@pytest.fixture
+def backend():
+    return CountingBackend()
+
+
+@pytest.fixture
+def aggregator(backend):
+    aggregator = QuizAnalyticsAggregator(backend, flush_interval=60)
+    yield aggregator
+    aggregator.close()
+
+
+class TestQuizAnalyticsAggregator:
+    """Test in-memory merging and bulk upserts"""
+
+    def test_submissions_merged_into_one_upsert(self, aggregator, backend):
+        aggregator.record(module_event(score=60, seconds=100, at="2024-01-01T00:00:00+00:00"))
+        aggregator.record(module_event(score=90, seconds=200, passed=False, at="2024-01-02T00:00:00+00:00"))
+        aggregator.record(module_event(user_id="u2"))
+
+        assert aggregator.flush() == 2
+        assert backend.calls == 1
+
+        row = backend.fetch("u1", "module_1", "module")
+        assert row["total_attempts"] == 2
+        assert row["average_score"] == 75.0
+        assert row["average_time_taken"] == 150
+        assert row["passed"] is False
+        assert row["first_attempted_at"].startswith("2024-01-01")
+        assert row["last_attempted_at"].startswith("2024-01-02")
+
+    def test_later_flush_updates_running_averages(self, aggregator, backend):
+        aggregator.record(module_event(score=60, seconds=100))
+        aggregator.flush()
+        for score in (90, 100, 100):
+            aggregator.record(module_event(score=score, seconds=200))
+        aggregator.flush()
+
+        row = backend.fetch("u1", "module_1", "module")
+        assert row["total_attempts"] == 4
+        assert row["average_score"] == pytest.approx(87.5)
+        assert row["average_time_taken"] == 175
+        assert row["first_attempted_at"].startswith("2024-01-01")
+
+    def test_diagnostic_rows_keyed_separately(self, aggregator, backend):
+        aggregator.record({
+            "event_type": "diagnostic_quiz_completed",
+            "user_id": "u1",
+            "timestamp": "2024-01-01T00:00:00+00:00",
+            "domain": "dsa",
+            "score": 72,
+            "max_score": 100,
+            "total_time_seconds": 540,
+            "recommended_format": "mixed",
+            "concepts_covered": ["arrays", "loops"],
+            "questions_attempted": 5
+        })
+        aggregator.record(module_event())
+        aggregator.flush()
+
+        row = backend.fetch("u1", "diagnostic", "diagnostic")
+        assert row["recommended_format"] == "mixed"
+        assert row["concepts_covered"] == ["arrays", "loops"]
+        assert backend.fetch("u1", "module_1", "module")["total_attempts"] == 1
+
+    def test_failed_flush_keeps_rows(self, backend):
+        backend.fail = True
+        aggregator = QuizAnalyticsAggregator(backend, flush_interval=60)
+        aggregator.record(module_event(score=60))
+        assert aggregator.flush() == 0
+
+        aggregator.record(module_event(score=100))
+        backend.fail = False
+        assert aggregator.flush() == 1
+
+        row = backend.fetch("u1", "module_1", "module")
+        assert row["total_attempts"] == 2
+        assert row["average_score"] == 80.0
+        aggregator.close()
+
+    def test_large_flush_is_chunked(self, backend):
+        backend.chunk_size = 7
+        aggregator = QuizAnalyticsAggregator(backend, flush_interval=60)
+        for i in range(20):
+            aggregator.record(module_event(user_id=f"u{i}"))
+
+        assert aggregator.flush() == 20
+        assert backend.fetch("u19", "module_1", "module")["total_attempts"] == 1
+        aggregator.close()
+
+    def test_create_backend(self, tmp_path):
+        backend = create_backend(f"sqlite:///{tmp_path / 'analytics.db'}")
+        assert isinstance(backend, SQLiteAnalyticsBackend)
+        backend.close()
+
+        with pytest.raises(ValueError):
+            create_backend("mysql://localhost/analytics")
+
+    def test_backends_must_implement_upsert(self):
+        class Incomplete(AnalyticsBackend):
+            pass
+
+        with pytest.raises(TypeError):
+            Incomplete()
+
+    @pytest.mark.asyncio
+    async def test_module_quiz_recorded(self, aggregator, backend):
+        quiz_service = QuizService(
+            profile_store=ProfileStore(),
+            scheduler=RevisionScheduler(),
+            analytics=aggregator
+        )
+        await quiz_service.process_module_quiz(QuizSubmissionRequest(
+            quiz_form="module-quiz",
+            domain="dsa",
+            user_id="u1",
+            module_id="module_2",
+            total_time=60.0,
+            question_time=[30.0, 30.0],
+            num_option_changes=[0, 0],
+            answers=[{"q": 1}, {"q": 2}],
+            correct_answers=[True, True],
+            concepts=["arrays", "graphs"]
+        ))
+        aggregator.flush()
+
+        row = backend.fetch("u1", "module_2", "module")
+        assert row["average_score"] == 100.0
+        assert row["passed"] is True
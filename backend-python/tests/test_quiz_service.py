@@ -1,8 +1,12 @@
 """
 Test Suite for Quiz Service
 """
+import asyncio
+import statistics
 import pytest
 from app.services.quiz_service import QuizService
+from app.services.quiz_stats import QuizStats, batch_quiz_stats
+from app.services.profile_store import ProfileStore
 from app.models.quiz_models import (
     QuizSubmissionRequest,
     QuizFormType,
@@ -13,7 +17,7 @@ from app.models.quiz_models import (
 
 @pytest.fixture
 def quiz_service():
-    return QuizService()
+    return QuizService(profile_store=ProfileStore())
 
 
 @pytest.fixture
@@ -117,5 +121,134 @@ class TestQuizService:
         assert isinstance(analysis["weak_concepts"], list)
 
 
+class TestQuizStats:
+    """Test the precomputed per-submission statistics"""
+    
+    def test_matches_statistics_module(self, sample_prerequisite_request):
+        """Single-pass values agree with statistics.mean/stdev"""
+        stats = QuizStats.from_request(sample_prerequisite_request)
+        times = sample_prerequisite_request.question_time
+        
+        assert stats.average_time == pytest.approx(statistics.mean(times))
+        assert stats.time_stdev == pytest.approx(statistics.stdev(times))
+        assert stats.average_option_changes == pytest.approx(1.4)
+        assert stats.total_option_changes == 7
+        assert stats.high_uncertainty_count == 1
+        assert stats.accuracy == 0.8
+    
+    def test_concept_tallies(self, sample_prerequisite_request):
+        """Per-concept attempts and correct answers in first-seen order"""
+        stats = QuizStats.from_request(sample_prerequisite_request)
+        
+        assert stats.concept_tallies == {
+            "arrays": [2, 2],
+            "loops": [2, 2],
+            "complexity": [1, 0]
+        }
+    
+    def test_empty_lists(self, sample_module_request):
+        """Empty inputs produce zeroed statistics"""
+        request = sample_module_request.model_copy(update={
+            "question_time": [],
+            "num_option_changes": []
+        })
+        stats = QuizStats.from_request(request)
+        
+        assert stats.question_count == 0
+        assert stats.average_time == 0.0
+        assert stats.time_stdev == 0.0
+        assert stats.average_option_changes == 0.0
+    
+    def test_batch_stats_match_single(self, sample_prerequisite_request, sample_module_request):
+        """Vectorized statistics agree with the per-request pass"""
+        sparse_request = sample_module_request.model_copy(update={
+            "question_time": [],
+            "num_option_changes": []
+        })
+        requests = [sample_prerequisite_request, sample_module_request, sparse_request]
+        
+        for batch, request in zip(batch_quiz_stats(requests), requests):
+            single = QuizStats.from_request(request)
+            assert batch.min_time == single.min_time
+            assert batch.max_time == single.max_time
+            assert batch.option_change_stdev == pytest.approx(single.option_change_stdev)
+            assert batch.min_option_changes == single.min_option_changes
+            assert batch.max_option_changes == single.max_option_changes
+
+
+class TestQuizBatch:
+    """Test vectorized batch processing"""
+    
+    @pytest.mark.asyncio
+    async def test_batch_matches_single_requests(
+        self, quiz_service, sample_prerequisite_request, sample_module_request
+    ):
+        """Batch results equal the per-request results in order"""
+        sparse_request = sample_module_request.model_copy(update={
+            "question_time": [],
+            "num_option_changes": [],
+            "correct_answers": None
+        })
+        requests = [sample_prerequisite_request, sample_module_request, sparse_request]
+        
+        batch = await quiz_service.process_batch(requests)
+        # Same starting point: no recorded history
+        quiz_service.profile_store = ProfileStore()
+        single = [
+            await quiz_service.process_prerequisite_quiz(sample_prerequisite_request),
+            await quiz_service.process_module_quiz(sample_module_request),
+            await quiz_service.process_module_quiz(sparse_request)
+        ]
+        
+        assert [r.model_dump() for r in batch] == [r.model_dump() for r in single]
+    
+    @pytest.mark.asyncio
+    async def test_batch_submissions_get_own_deadline(self, quiz_service, sample_module_request):
+        """Queued submissions start with a full budget instead of a shared one"""
+        remaining = []
+        
+        async def process_module_quiz(request, stats, deadline, record=True):
+            remaining.append(deadline.remaining())
+            await asyncio.sleep(0.05)
+        
+        quiz_service.process_module_quiz = process_module_quiz
+        quiz_service.batch_concurrency = 1
+        quiz_service.batch_submission_deadline = 0.1
+        await quiz_service.process_batch([sample_module_request] * 4)
+        
+        assert len(remaining) == 4
+        assert min(remaining) > 0.08
+    
+    @pytest.mark.asyncio
+    async def test_regrade_has_no_side_effects(self, quiz_service, sample_module_request):
+        """Re-grading neither records profiles, reschedules reviews nor emits events"""
+        emitted = []
+        
+        async def emit(event):
+            emitted.append(event)
+        
+        quiz_service._emit = emit
+        request = sample_module_request.model_copy(update={"module_id": "module_1", "user_id": "regrade_user"})
+        
+        regraded = await quiz_service.process_batch([request, request], regrade=True)
+        
+        assert quiz_service.profile_store.get(request.user_id).quiz_count == 0
+        assert quiz_service.scheduler.get(request.user_id, "module_1") is None
+        assert emitted == []
+        assert regraded[0].model_dump() == regraded[1].model_dump()
+        
+        await quiz_service.process_batch([request])
+        assert quiz_service.profile_store.get(request.user_id).quiz_count == 1
+        assert len(emitted) == 1
+    
+    @pytest.mark.asyncio
+    async def test_batch_rejects_learn_submissions(self, quiz_service, sample_module_request):
+        """module-learn submissions are not quizzes"""
+        learn_request = sample_module_request.model_copy(update={"quiz_form": QuizFormType.MODULE_LEARN})
+        
+        with pytest.raises(ValueError):
+            await quiz_service.process_batch([sample_module_request, learn_request])
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
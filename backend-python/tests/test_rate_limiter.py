@@ -0,0 +1,130 @@
+"""
+Test Suite for Outbound Rate Limiter
+"""
+import asyncio
+import sys
+import time
+import types
+import pytest
+from app.core.deadline import DeadlineExceeded
+from app.core.rate_limiter import OutboundLimiter, is_retryable
+
+
+class ProviderError(Exception):
+    def __init__(self, code):
+        super().__init__(f"HTTP {code}")
+        self.code = code
+
+
+class TooManyRequests(Exception):
+    pass
+
+
+class ResourceExhausted(TooManyRequests):
+    pass
+
+
+class ServerError(Exception):
+    pass
+
+
+class TestIsRetryable:
+    """Test transient error classification"""
+
+    def test_status_codes(self):
+        assert is_retryable(ProviderError(429))
+        assert is_retryable(ProviderError(503))
+        assert not is_retryable(ProviderError(400))
+
+    def test_google_api_core_types(self, monkeypatch):
+        assert not is_retryable(ResourceExhausted("quota"))
+
+        google_exceptions = types.ModuleType("google.api_core.exceptions")
+        google_exceptions.TooManyRequests = TooManyRequests
+        google_exceptions.ServerError = ServerError
+        monkeypatch.setitem(sys.modules, "google.api_core.exceptions", google_exceptions)
+
+        assert is_retryable(ResourceExhausted("quota"))
+        assert is_retryable(ServerError("unavailable"))
+        assert not is_retryable(ValueError("bad json"))
+
+    def test_own_deadline_not_retried(self):
+        assert not is_retryable(DeadlineExceeded())
+
+
+class TestOutboundLimiter:
+    """Test concurrency cap, pacing and retries"""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_capped(self):
+        limiter = OutboundLimiter(max_concurrency=2)
+        peak = 0
+
+        async def work():
+            nonlocal peak
+            peak = max(peak, limiter.in_flight)
+            await asyncio.sleep(0.01)
+
+        await asyncio.gather(*(limiter.call(work) for _ in range(6)))
+
+        assert peak == 2
+        assert limiter.max_waiting >= 4
+        assert limiter.stats()["calls"] == 6
+
+    @pytest.mark.asyncio
+    async def test_token_bucket_paces_calls(self):
+        limiter = OutboundLimiter(max_concurrency=10, rate_per_second=50, burst=1)
+
+        async def work():
+            return None
+
+        started = time.monotonic()
+        await asyncio.gather(*(limiter.call(work) for _ in range(5)))
+
+        # One burst token, then four refills at 20ms each
+        assert time.monotonic() - started >= 0.07
+
+    @pytest.mark.asyncio
+    async def test_transient_errors_are_retried(self):
+        limiter = OutboundLimiter(max_retries=3, base_delay=0.001)
+        attempts = 0
+
+        async def flaky():
+            nonlocal attempts
+            attempts += 1
+            if attempts < 3:
+                raise ProviderError(429)
+            return "ok"
+
+        assert await limiter.call(flaky) == "ok"
+        assert limiter.retries == 2
+        assert limiter.failures == 0
+
+    @pytest.mark.asyncio
+    async def test_permanent_errors_are_not_retried(self):
+        limiter = OutboundLimiter(max_retries=3, base_delay=0.001)
+        attempts = 0
+
+        async def broken():
+            nonlocal attempts
+            attempts += 1
+            raise ProviderError(400)
+
+        with pytest.raises(ProviderError):
+            await limiter.call(broken)
+
+        assert attempts == 1
+        assert limiter.failures == 1
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_retries(self):
+        limiter = OutboundLimiter(max_retries=2, base_delay=0.001)
+
+        async def overloaded():
+            raise ProviderError(503)
+
+        with pytest.raises(ProviderError):
+            await limiter.call(overloaded)
+
+        assert limiter.retries == 2
+        assert limiter.in_flight == 0
@@ -0,0 +1,91 @@
+"""
+Test Suite for Service Registry
+"""
+import time
+import httpx
+import pytest
+import main
+from app.services.registry import ServiceRegistry
+
+
+class TestServiceRegistry:
+    """Test lazy construction and sharing of services"""
+
+    def test_nothing_built_until_requested(self):
+        registry = ServiceRegistry()
+
+        assert registry._adk_service is None
+        assert registry._quiz_service is None
+        assert registry._learning_service is None
+
+    def test_services_share_one_llm_client(self):
+        registry = ServiceRegistry()
+
+        quiz_service = registry.quiz_service()
+        learning_service = registry.learning_service()
+
+        assert quiz_service.adk_service is registry.adk_service()
+        assert learning_service.adk_service is registry.adk_service()
+        assert registry.quiz_service() is quiz_service
+
+    def test_close_drops_instances(self):
+        registry = ServiceRegistry()
+        adk_service = registry.adk_service()
+        registry.close()
+
+        assert registry.adk_service() is not adk_service
+
+    def test_peek_does_not_build(self):
+        registry = ServiceRegistry()
+
+        assert registry.peek("job_queue") is None
+        assert registry.peek("event_outbox") is None
+        assert registry._job_queue is None
+        assert not registry._event_outbox_loaded
+
+        job_queue = registry.job_queue()
+        assert registry.peek("job_queue") is job_queue
+        registry.close()
+
+    @pytest.mark.asyncio
+    async def test_health_does_not_build_services(self, monkeypatch):
+        registry = ServiceRegistry()
+        monkeypatch.setattr(main, "registry", registry)
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=main.app), base_url="http://test"
+        ) as client:
+            body = (await client.get("/health")).json()
+
+        assert body["jobs"] is None
+        assert body["event_outbox"] is None
+        assert body["llm_provider"] is None
+        assert registry._adk_service is None
+        assert registry._job_queue is None
+        assert registry._revision_scheduler is None
+        assert not registry._event_outbox_loaded
+        assert not registry._quiz_analytics_loaded
+
+    @pytest.mark.asyncio
+    async def test_shutdown_waits_for_prewarm(self, monkeypatch):
+        events = []
+
+        class SlowRegistry:
+            def quiz_service(self):
+                time.sleep(0.1)
+                events.append("quiz_service")
+
+            def learning_service(self):
+                events.append("learning_service")
+
+            def close(self):
+                events.append("close")
+
+        monkeypatch.setattr(main, "registry", SlowRegistry())
+        monkeypatch.setattr(main.settings, "PREWARM_SERVICES", True)
+        monkeypatch.setattr(main, "configure_logging", lambda: None)
+        monkeypatch.setattr(main, "shutdown_logging", lambda: None)
+        async with main.lifespan(main.app):
+            pass
+
+        assert events[-1] == "close"
+        assert set(events[:-1]) == {"quiz_service", "learning_service"}
@@ -0,0 +1,146 @@
+"""
+Test Suite for Response Cache
+"""
+import asyncio
+import pytest
+from app.core.cache import ResponseCache
+from app.core.deadline import Deadline
+from app.services.adk_agent_service import SingleFlight
+from app.models.quiz_models import DomainType
+from tests.conftest import FakeClient, REVISION_JSON
+
+
+@pytest.fixture
+def cache():
+    return ResponseCache(max_entries=2, ttls={"roadmap": 60.0, "revision": 0.0})
+
+
+class TestResponseCache:
+    """Test cache keying, eviction and counters"""
+
+    def test_key_depends_on_prompt_and_settings(self):
+        base = ResponseCache.make_key("module", "prompt", "gemini-1.5-flash", 0.7, 2000)
+
+        assert base == ResponseCache.make_key("module", "prompt", "gemini-1.5-flash", 0.7, 2000)
+        assert base != ResponseCache.make_key("module", "prompt!", "gemini-1.5-flash", 0.7, 2000)
+        assert base != ResponseCache.make_key("module", "prompt", "gemini-1.5-pro", 0.7, 2000)
+        assert base != ResponseCache.make_key("module", "prompt", "gemini-1.5-flash", 0.2, 2000)
+        assert base != ResponseCache.make_key("module", "prompt", "gemini-1.5-flash", 0.7, 1000)
+
+    def test_lru_eviction(self, cache):
+        cache.set("roadmap", "a", 1)
+        cache.set("roadmap", "b", 2)
+        assert cache.get("roadmap", "a") == 1  # a becomes most recently used
+        cache.set("roadmap", "c", 3)
+
+        assert cache.get("roadmap", "b") is None
+        assert cache.get("roadmap", "a") == 1
+        assert cache.stats()["evictions"] == 1
+
+    def test_zero_ttl_kind_is_not_cached(self, cache):
+        cache.set("revision", "a", 1)
+        assert cache.get("revision", "a") is None
+
+    def test_hit_miss_counters(self, cache):
+        cache.set("roadmap", "a", 1)
+        cache.get("roadmap", "a")
+        cache.get("roadmap", "missing")
+
+        stats = cache.stats()["kinds"]["roadmap"]
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_repeat_generation_served_from_cache(self, adk_service):
+        first = await adk_service.generate_revision_content(
+            domain=DomainType.DSA, weak_concepts=["arrays"], module_id="module_1", user_id="u1"
+        )
+        second = await adk_service.generate_revision_content(
+            domain=DomainType.DSA, weak_concepts=["arrays"], module_id="module_1", user_id="u2"
+        )
+
+        assert adk_service.client.calls == 1
+        assert first == second
+        assert first[0].explanation == "Indexed storage"
+
+    @pytest.mark.asyncio
+    async def test_failed_generation_is_not_cached(self, adk_service):
+        adk_service.client = FakeClient("not json")
+        await adk_service.generate_revision_content(
+            domain=DomainType.DSA, weak_concepts=["arrays"], module_id="module_1", user_id="u1"
+        )
+        await adk_service.generate_revision_content(
+            domain=DomainType.DSA, weak_concepts=["arrays"], module_id="module_1", user_id="u1"
+        )
+
+        assert adk_service.client.calls == 2
+        assert len(adk_service.cache) == 0
+
+
+class TestSingleFlight:
+    """Test coalescing of identical in-flight generations"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_share_one_request(self, adk_service):
+        adk_service.client = FakeClient(REVISION_JSON, delay=0.05)
+
+        results = await asyncio.gather(*[
+            adk_service.generate_revision_content(
+                domain=DomainType.DSA, weak_concepts=["arrays"], module_id="module_1", user_id=f"u{i}"
+            )
+            for i in range(10)
+        ])
+
+        assert adk_service.client.calls == 1
+        assert all(result == results[0] for result in results)
+        assert adk_service.single_flight.stats() == {"in_flight": 0, "started": 1, "coalesced": 9}
+
+    @pytest.mark.asyncio
+    async def test_errors_are_shared_and_not_retained(self):
+        flight = SingleFlight()
+        calls = 0
+
+        async def failing():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            raise RuntimeError("quota exceeded")
+
+        results = await asyncio.gather(
+            flight.do("k", failing), flight.do("k", failing), return_exceptions=True
+        )
+
+        assert calls == 1
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert flight.stats()["in_flight"] == 0
+
+
+class TestDeadline:
+    """Test deadline fallback with late results landing in the cache"""
+
+    @pytest.mark.asyncio
+    async def test_slow_generation_falls_back_then_warms_cache(self, adk_service):
+        adk_service.client = FakeClient(REVISION_JSON, delay=0.1)
+        kwargs = dict(domain=DomainType.DSA, weak_concepts=["arrays"], module_id="module_1", user_id="u1")
+
+        fallback = await adk_service.generate_revision_content(**kwargs, deadline=Deadline(0.01))
+        assert fallback[0].explanation.startswith("Detailed explanation of arrays")
+
+        await asyncio.sleep(0.15)
+        cached = await adk_service.generate_revision_content(**kwargs, deadline=Deadline(0.01))
+
+        assert cached[0].explanation == "Indexed storage"
+        assert adk_service.client.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_deadline_still_starts_generation(self, adk_service):
+        deadline = Deadline(0)
+        kwargs = dict(domain=DomainType.DSA, weak_concepts=["arrays"], module_id="module_1", user_id="u1")
+
+        fallback = await adk_service.generate_revision_content(**kwargs, deadline=deadline)
+        await asyncio.sleep(0.01)
+
+        assert fallback[0].explanation.startswith("Detailed explanation of arrays")
+        assert adk_service.client.calls == 1
+        assert len(adk_service.cache) == 1
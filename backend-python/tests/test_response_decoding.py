@@ -0,0 +1,118 @@
+"""
+Test Suite for LLM Response Decoding
+"""
+import json
+import pytest
+from app.core.response_decoding import (
+    DecodeMetrics,
+    ResponseDecodeError,
+    decode,
+    decode_metrics,
+    find_payload,
+    repair
+)
+from app.models.llm_payloads import ModulePayload, RevisionPayload
+from app.services.adk_agent_service import ADKAgentService
+from app.models.quiz_models import DomainType
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    decode_metrics.reset()
+    yield
+    decode_metrics.reset()
+
+
+class TestFindPayload:
+    """Test locating the JSON document in a response"""
+
+    def test_strips_fences_and_prose(self):
+        text = 'Here you go:\n```json\n{"a": [1, 2]}\n```\nEnjoy!'
+
+        assert find_payload(text) == '{"a": [1, 2]}'
+
+    def test_truncated_payload_runs_to_end(self):
+        assert find_payload('```json\n{"a": [1, 2') == '{"a": [1, 2'
+
+    def test_no_payload(self):
+        with pytest.raises(ResponseDecodeError):
+            find_payload("Sorry, I cannot help with that.")
+
+
+class TestRepair:
+    """Test the cheap repair passes"""
+
+    def test_trailing_commas(self):
+        assert json.loads(repair('{"a": [1, 2,], "b": {"c": 3,},}')) == {
+            "a": [1, 2], "b": {"c": 3}
+        }
+
+    def test_truncated_array_keeps_complete_items(self):
+        repaired = repair('{"topics": [{"name": "Arrays"}, {"name": "Gra')
+
+        assert json.loads(repaired) == {"topics": [{"name": "Arrays"}]}
+
+    def test_truncated_after_closed_array(self):
+        assert json.loads(repair('{"a": [1, 2], "b": [3]')) == {"a": [1, 2], "b": [3]}
+
+    def test_brackets_inside_strings_ignored(self):
+        assert json.loads(repair('{"a": "x, ] } \\" y",}')) == {"a": 'x, ] } " y'}
+
+    def test_drops_text_after_document(self):
+        assert json.loads(repair('{"a": 1} {"b": 2}')) == {"a": 1}
+
+
+class TestDecode:
+    """Test validation into payload models and the failure metrics"""
+
+    def test_clean_response(self):
+        payload = decode('{"revisions": [{"concept": "arrays"}]}', RevisionPayload, "revision")
+
+        assert payload.revisions[0].concept == "arrays"
+        assert decode_metrics.stats()["revision"]["ok"] == 1
+
+    def test_repaired_response(self):
+        payload = decode('```json\n{"title": "Graphs", "examples": ["bfs",],}\n```', ModulePayload, "module")
+
+        assert payload.examples == ["bfs"]
+        assert decode_metrics.stats()["module"]["repaired"] == 1
+
+    def test_schema_error_is_not_repaired(self):
+        with pytest.raises(ResponseDecodeError):
+            decode('{"examples": "not a list"}', ModulePayload, "module")
+
+        stats = decode_metrics.stats()["module"]
+        assert stats["failed"] == 1
+        assert stats["failure_rate"] == 1.0
+
+    def test_failure_rate(self):
+        metrics = DecodeMetrics()
+        for outcome in ("ok", "ok", "repaired", "failed"):
+            metrics.record("roadmap", outcome)
+
+        assert metrics.stats()["roadmap"]["total"] == 4
+        assert metrics.stats()["roadmap"]["failure_rate"] == 0.25
+
+
+class TestADKParsing:
+    """Test the ADK parsers on top of the decoder"""
+
+    def test_roadmap_defaults_priority_to_position(self):
+        text = '{"topics": [{"name": "Arrays", "priority": 3}, {"name": "Graphs"},]}'
+
+        roadmap = ADKAgentService()._parse_roadmap(text, DomainType.DSA)
+
+        assert [t.topic_name for t in roadmap] == ["Arrays", "Graphs"]
+        assert [t.priority for t in roadmap] == [3, 2]
+        assert roadmap[1].estimated_time == "1-2 weeks"
+
+    def test_module_title_falls_back_to_topic(self):
+        module = ADKAgentService()._parse_module(
+            '{"tldr": "Short", "key_concepts": ["a"], "examples": []}',
+            DomainType.DSA, "Graphs", "text", "module_1"
+        )
+
+        assert module.title == "Graphs"
+        assert module.module_id == "module_1"
+        assert module.content_type == "text"
+        assert list(module.model_dump())[:4] == ["module_id", "title", "tldr", "content_type"]
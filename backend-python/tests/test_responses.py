@@ -0,0 +1,78 @@
+"""
+Test Suite for Response Rendering
+"""
+import msgpack
+import pytest
+from fastapi.testclient import TestClient
+from app.core.responses import (
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    ResponseRenderer,
+    negotiate
+)
+from app.models.quiz_models import DomainType, SkillLevel
+from main import app
+
+
+LEARNING_REQUEST = {
+    "user_id": "test_user_123",
+    "domain": "dsa",
+    "topic": "Binary Trees",
+    "skill_level": "beginner",
+    "format_preference": "text"
+}
+
+
+@pytest.fixture
+def client():
+    return TestClient(app)
+
+
+class TestNegotiate:
+    """Test Accept header negotiation"""
+
+    @pytest.mark.parametrize("accept, expected", [
+        (None, JSON_MEDIA_TYPE),
+        ("*/*", JSON_MEDIA_TYPE),
+        ("application/json", JSON_MEDIA_TYPE),
+        ("application/msgpack", MSGPACK_MEDIA_TYPE),
+        ("application/x-msgpack", MSGPACK_MEDIA_TYPE),
+        ("application/json;q=0.5, application/msgpack", MSGPACK_MEDIA_TYPE),
+        ("application/json, application/msgpack;q=0.5", JSON_MEDIA_TYPE),
+        ("application/msgpack;q=0", JSON_MEDIA_TYPE)
+    ])
+    def test_media_type(self, accept, expected):
+        assert negotiate(accept) == expected
+
+    def test_renderer_serializes_enums_in_dicts(self):
+        response = ResponseRenderer()({"domain": DomainType.DSA, "level": SkillLevel.BEGINNER})
+
+        assert response.body == b'{"domain":"dsa","level":"beginner"}'
+        assert response.headers["vary"] == "Accept"
+
+
+class TestRouteRendering:
+    """Test the negotiated format on /api/v1 routes"""
+
+    def test_json_by_default(self, client):
+        response = client.post("/api/v1/learning/generate", json=LEARNING_REQUEST)
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == JSON_MEDIA_TYPE
+        assert response.json()["module"]["title"] == "Mastering Binary Trees"
+
+    def test_msgpack_when_accepted(self, client):
+        json_body = client.post("/api/v1/learning/generate", json=LEARNING_REQUEST).json()
+        response = client.post(
+            "/api/v1/learning/generate",
+            json=LEARNING_REQUEST,
+            headers={"Accept": MSGPACK_MEDIA_TYPE}
+        )
+
+        assert response.headers["content-type"] == MSGPACK_MEDIA_TYPE
+        assert msgpack.unpackb(response.content) == json_body
+
+    def test_health_routes_negotiate(self, client):
+        response = client.get("/api/v1/quiz/health", headers={"Accept": MSGPACK_MEDIA_TYPE})
+
+        assert msgpack.unpackb(response.content)["service"] == "quiz"
@@ -0,0 +1,142 @@
+"""
+Test Suite for the Spaced-Repetition Revision Scheduler
+"""
+import math
+import httpx
+import pytest
+from app.api.dependencies import get_revision_scheduler
+from app.models.quiz_models import QuizSubmissionRequest
+from app.services.profile_store import ProfileStore
+from app.services.quiz_service import QuizService
+from app.services.revision_scheduler import RevisionScheduler, SECONDS_PER_DAY
+from main import app
+
+
+HOUR = 3600.0
+
+
+class TestRevisionScheduler:
+    """Test scheduling, due ordering and batch decay"""
+
+    def test_first_review_after_first_interval(self):
+        scheduler = RevisionScheduler()
+        scheduler.record("u1", "m1", "dsa", 90.0, now=0.0)
+
+        assert scheduler.pop_due(now=23 * HOUR) == []
+        due = scheduler.pop_due(now=24 * HOUR)
+
+        assert [(r.user_id, r.module_id) for r in due] == [("u1", "m1")]
+        assert scheduler.stats()["queued"] == 0
+
+    def test_intervals_grow_and_reset_on_failure(self):
+        scheduler = RevisionScheduler()
+        scheduler.record("u1", "m1", "dsa", 90.0, now=0.0)
+        state = scheduler.record("u1", "m1", "dsa", 90.0, now=HOUR)
+        assert state.next_review_at == HOUR + 72 * HOUR
+
+        state = scheduler.record("u1", "m1", "dsa", 30.0, now=2 * HOUR)
+        assert state.review_count == 0
+        assert state.next_review_at == 2 * HOUR + 24 * HOUR
+
+    def test_due_pairs_most_overdue_first_with_limit(self):
+        scheduler = RevisionScheduler()
+        for offset, module in enumerate(["m3", "m1", "m2"]):
+            scheduler.record("u1", module, "dsa", 70.0, now=offset * HOUR)
+
+        first = scheduler.pop_due(now=100 * HOUR, limit=2)
+        rest = scheduler.pop_due(now=100 * HOUR, limit=2)
+
+        assert [r.module_id for r in first] == ["m3", "m1"]
+        assert [r.module_id for r in rest] == ["m2"]
+
+    def test_rescheduled_entry_is_not_returned_early(self):
+        scheduler = RevisionScheduler()
+        scheduler.record("u1", "m1", "dsa", 90.0, now=0.0)
+        scheduler.record("u1", "m1", "dsa", 90.0, now=12 * HOUR)
+
+        assert scheduler.pop_due(now=30 * HOUR) == []
+        assert len(scheduler.pop_due(now=12 * HOUR + 72 * HOUR)) == 1
+        assert scheduler.pop_due(now=1000 * HOUR) == []
+
+    def test_batch_decay_matches_forgetting_curve(self):
+        scheduler = RevisionScheduler(decay_days=7.0)
+        scheduler.record("u1", "m1", "dsa", 80.0, now=0.0)  # memory 100
+        scheduler.record("u2", "m1", "dsa", 40.0, now=0.0)  # memory 40
+
+        due = {r.user_id: r for r in scheduler.pop_due(now=14 * SECONDS_PER_DAY)}
+
+        assert due["u1"].current_score == pytest.approx(100 * math.exp(-2), abs=0.01)
+        assert due["u1"].decay_factor == pytest.approx(math.exp(-2), abs=1e-4)
+        assert due["u1"].days_since_review == 14
+        assert due["u1"].revision_urgency == "high"
+        assert due["u2"].forgetting_score == pytest.approx(100 - 40 * math.exp(-2), abs=0.01)
+
+    def test_heap_compacted(self):
+        scheduler = RevisionScheduler()
+        for i in range(3000):
+            scheduler.record("u1", "m1", "dsa", 90.0, now=float(i))
+
+        assert scheduler.stats()["heap_entries"] < 2000
+        assert len(scheduler.pop_due(now=1e9)) == 1
+
+    def test_schedule_survives_restart(self, tmp_path):
+        path = str(tmp_path / "profiles.db")
+        scheduler = RevisionScheduler(path=path)
+        scheduler.record("u1", "m1", "dsa", 90.0, now=0.0)
+        scheduler.record("u1", "m1", "dsa", 90.0, now=HOUR)
+        scheduler.record("u2", "m1", "dsa", 40.0, now=0.0)
+        scheduler.pop_due(now=24 * HOUR)
+        scheduler.close()
+
+        restarted = RevisionScheduler(path=path)
+        state = restarted.get("u1", "m1")
+
+        assert (state.review_count, state.attempts, state.next_review_at) == (1, 2, 73 * HOUR)
+        assert restarted.stats()["queued"] == 1
+        assert [r.user_id for r in restarted.pop_due(now=1000 * HOUR)] == ["u1"]
+
+    @pytest.mark.asyncio
+    async def test_module_quiz_schedules_review(self):
+        scheduler = RevisionScheduler()
+        quiz_service = QuizService(profile_store=ProfileStore(), scheduler=scheduler)
+        request = QuizSubmissionRequest(
+            quiz_form="module-quiz",
+            domain="dsa",
+            user_id="u1",
+            module_id="module_arrays",
+            total_time=60.0,
+            question_time=[30.0, 30.0],
+            num_option_changes=[0, 1],
+            answers=[{"q": 1}, {"q": 2}],
+            correct_answers=[True, False],
+            concepts=["arrays", "arrays"]
+        )
+
+        await quiz_service.process_module_quiz(request)
+
+        state = scheduler.get("u1", "module_arrays")
+        assert state.domain == "dsa"
+        assert state.memory_score == 40.0
+
+
+class TestDueRoute:
+    """Test POST /revision/due"""
+
+    @pytest.mark.asyncio
+    async def test_pops_due_reviews(self):
+        scheduler = RevisionScheduler()
+        scheduler.record("u1", "m1", "dsa", 90.0, now=0.0)
+        app.dependency_overrides[get_revision_scheduler] = lambda: scheduler
+        try:
+            async with httpx.AsyncClient(
+                transport=httpx.ASGITransport(app=app), base_url="http://test"
+            ) as client:
+                first = await client.post("/api/v1/revision/due?limit=10")
+                second = await client.post("/api/v1/revision/due")
+        finally:
+            app.dependency_overrides.pop(get_revision_scheduler, None)
+
+        assert first.status_code == 200
+        assert first.json()["count"] == 1
+        assert first.json()["reviews"][0]["module_id"] == "m1"
+        assert second.json()["count"] == 0
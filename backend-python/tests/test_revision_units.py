@@ -0,0 +1,129 @@
+"""
+Test Suite for Per-Concept Revision Units
+"""
+import asyncio
+import json
+import re
+import pytest
+from app.core.config import settings
+from app.core.deadline import Deadline
+from app.models.quiz_models import DomainType, RevisionData
+from tests.conftest import FakeResponse
+
+
+class ConceptClient:
+    """Stand-in for the Gemini client answering each concept listed in the prompt"""
+
+    def __init__(self, delay=0.0, reverse=False):
+        self.delay = delay
+        self.reverse = reverse
+        self.prompts = []
+
+    async def generate_content_async(self, prompt, generation_config=None):
+        self.prompts.append(prompt)
+        await asyncio.sleep(self.delay)
+        concepts = self.requested(prompt)
+        if self.reverse:
+            concepts = concepts[::-1]
+        return FakeResponse(json.dumps({"revisions": [
+            {"concept": concept.title(), "explanation": f"About {concept}", "examples": [concept]}
+            for concept in concepts
+        ]}))
+
+    @staticmethod
+    def requested(prompt):
+        return re.search(r"Weak concepts: (.*)", prompt).group(1).split(", ")
+
+
+@pytest.fixture
+def adk_service(make_adk_service):
+    return make_adk_service(ConceptClient())
+
+
+async def revise(service, concepts, module_id="module_1", **kwargs):
+    return await service.generate_revision_content(
+        domain=DomainType.DSA, weak_concepts=concepts, module_id=module_id, user_id="u1", **kwargs
+    )
+
+
+class TestRevisionUnits:
+    """Test assembly from cached units and batched generation of misses"""
+
+    @pytest.mark.asyncio
+    async def test_only_missing_concepts_are_generated(self, adk_service):
+        await revise(adk_service, ["arrays", "loops"])
+        result = await revise(adk_service, ["Trees", "loops"])
+
+        assert len(adk_service.client.prompts) == 2
+        assert ConceptClient.requested(adk_service.client.prompts[1]) == ["trees"]
+        assert [unit.explanation for unit in result] == ["About trees", "About loops"]
+
+    @pytest.mark.asyncio
+    async def test_known_combinations_need_no_generation(self, adk_service):
+        await revise(adk_service, ["arrays", "loops", "trees"])
+        for concepts in (["trees"], ["loops", "arrays"], ["arrays", "trees"]):
+            await revise(adk_service, concepts)
+
+        assert len(adk_service.client.prompts) == 1
+        assert adk_service.cache.stats()["kinds"]["revision_unit"]["hits"] == 5
+
+    @pytest.mark.asyncio
+    async def test_units_are_per_module(self, adk_service):
+        await revise(adk_service, ["arrays"], module_id="module_1")
+        await revise(adk_service, ["arrays"], module_id="module_2")
+
+        assert len(adk_service.client.prompts) == 2
+
+    @pytest.mark.asyncio
+    async def test_items_matched_by_name_then_position(self, adk_service):
+        adk_service.client = ConceptClient(reverse=True)
+        result = await revise(adk_service, ["arrays", "loops"])
+        assert [unit.explanation for unit in result] == ["About arrays", "About loops"]
+
+        items = [
+            RevisionData(concept="Something else", explanation="first", examples=[]),
+            RevisionData(concept="Loops", explanation="loops", examples=[])
+        ]
+        units = adk_service._match_units(["arrays", "loops", "trees"], items)
+        assert {concept: unit.explanation for concept, unit in units.items()} == {
+            "loops": "loops",
+            "arrays": "first"
+        }
+
+    @pytest.mark.asyncio
+    async def test_misses_split_into_prompt_sized_batches(self, adk_service, monkeypatch):
+        monkeypatch.setattr(settings, "PROMPT_MAX_CONCEPTS", 2)
+        result = await revise(adk_service, ["a", "b", "c", "d", "e"])
+
+        assert [ConceptClient.requested(p) for p in adk_service.client.prompts] == [
+            ["a", "b"], ["c", "d"], ["e"]
+        ]
+        assert [unit.explanation for unit in result] == [f"About {c}" for c in "abcde"]
+
+    @pytest.mark.asyncio
+    async def test_response_keeps_caller_names_and_order(self, adk_service):
+        await revise(adk_service, ["arrays"])
+        result = await revise(adk_service, ["Zeta Recursion", " Arrays", "arrays"])
+
+        assert [unit.concept for unit in result] == ["Zeta Recursion", "Arrays"]
+        assert [unit.explanation for unit in result] == ["About zeta recursion", "About arrays"]
+
+        adk_service.client.delay = 0.1
+        partial = await revise(adk_service, ["Trees", "Arrays"], deadline=Deadline(0.01))
+        assert [unit.concept for unit in partial] == ["Trees", "Arrays"]
+        assert partial[0].explanation.startswith("Detailed explanation of Trees")
+        await asyncio.sleep(0.15)
+
+    @pytest.mark.asyncio
+    async def test_deadline_keeps_cached_units(self, adk_service):
+        await revise(adk_service, ["arrays"])
+        adk_service.client.delay = 0.1
+
+        result = await revise(adk_service, ["arrays", "loops"], deadline=Deadline(0.01))
+
+        assert result[0].explanation == "About arrays"
+        assert result[1].explanation.startswith("Detailed explanation of loops")
+
+        await asyncio.sleep(0.15)
+        result = await revise(adk_service, ["arrays", "loops"], deadline=Deadline(0.01))
+        assert result[1].explanation == "About loops"
@@ -0,0 +1,118 @@
+"""
+Test Suite for Sectioned Module Generation
+"""
+import asyncio
+import json
+import time
+import pytest
+from app.core.deadline import Deadline
+from app.models.quiz_models import DomainType, SkillLevel
+from app.services.prompt_templates import MODULE_SECTION_FIELDS, module_section_prompts
+from tests.conftest import FakeResponse
+
+
+SECTIONS = {
+    "module overview": {"title": "Binary Search Trees", "tldr": "Ordered trees", "key_concepts": ["bst"]},
+    "core content": {"text_content": "A BST keeps keys ordered"},
+    "learning aids": {"examples": ["lookup"], "practice_exercises": ["insert 5"]},
+    "external material": {"video_links": [], "additional_resources": [{"type": "article", "title": "BST"}]}
+}
+
+
+class SectionClient:
+    """Stand-in for the Gemini client answering each section prompt after a delay"""
+
+    def __init__(self, delay=0.05, broken=(), slow=()):
+        self.delay = delay
+        self.broken = broken
+        self.slow = slow
+        self.calls = 0
+
+    async def generate_content_async(self, prompt, generation_config=None):
+        self.calls += 1
+        marker = next(marker for marker in SECTIONS if marker in prompt.lower())
+        await asyncio.sleep(self.delay * (4 if marker in self.slow else 1))
+        if marker in self.broken:
+            return FakeResponse("no json here")
+        return FakeResponse(json.dumps(SECTIONS[marker]))
+
+
+@pytest.fixture
+def adk_service(make_adk_service):
+    return make_adk_service(SectionClient(), sectioned_modules=True)
+
+
+async def generate(service, **kwargs):
+    return await service.generate_learning_module(
+        domain=DomainType.DSA,
+        topic="Binary Search Trees",
+        skill_level=SkillLevel.BEGINNER,
+        format_preference="text",
+        weak_concepts=["insertion"],
+        user_id="u1",
+        **kwargs
+    )
+
+
+class TestSectionPrompts:
+    """Test the per-section prompt templates"""
+
+    def test_sections_cover_module_fields(self):
+        prompts = module_section_prompts("dsa", "bst", "beginner", "text", ["insertion"])
+
+        assert list(prompts) == list(MODULE_SECTION_FIELDS)
+        assert len({prompt.prefix for prompt in prompts.values()}) == len(prompts)
+        assert all(prompt.body == prompts["overview"].body for prompt in prompts.values())
+        assert all("Focus areas: insertion" in prompt.text for prompt in prompts.values())
+
+
+class TestSectionedGeneration:
+    """Test concurrent section generation, merging and per-section fallback"""
+
+    @pytest.mark.asyncio
+    async def test_sections_generated_concurrently_and_merged(self, adk_service):
+        started = time.perf_counter()
+        module = await generate(adk_service, module_id="module_bst")
+        elapsed = time.perf_counter() - started
+
+        assert adk_service.client.calls == 4
+        assert elapsed < 0.15
+        assert module.module_id == "module_bst"
+        assert module.title == "Binary Search Trees"
+        assert module.text_content == "A BST keeps keys ordered"
+        assert module.practice_exercises == ["insert 5"]
+        assert module.additional_resources == [{"type": "article", "title": "BST"}]
+
+    @pytest.mark.asyncio
+    async def test_sections_are_cached(self, adk_service):
+        await generate(adk_service)
+        module = await generate(adk_service)
+
+        assert adk_service.client.calls == 4
+        assert module.key_concepts == ["bst"]
+
+    @pytest.mark.asyncio
+    async def test_broken_section_falls_back_alone(self, adk_service):
+        adk_service.client = SectionClient(broken=("learning aids",))
+        module = await generate(adk_service)
+
+        assert module.text_content == "A BST keeps keys ordered"
+        assert module.examples[0].startswith("Example 1")
+        assert len(adk_service.cache) == 3
+
+    @pytest.mark.asyncio
+    async def test_slow_section_misses_deadline_alone(self, adk_service):
+        adk_service.client = SectionClient(delay=0.02, slow=("core content",))
+        module = await generate(adk_service, deadline=Deadline(0.05))
+
+        assert module.tldr == "Ordered trees"
+        assert module.text_content.strip().startswith("# Introduction to Binary Search Trees")
+        await asyncio.sleep(0.1)
+
+    @pytest.mark.asyncio
+    async def test_errors_raised_without_fallback(self, adk_service):
+        adk_service.client = SectionClient(broken=("core content",))
+        adk_service.fallback_on_error = False
+
+        with pytest.raises(ValueError):
+            await generate(adk_service)